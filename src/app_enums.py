@@ -5,7 +5,10 @@ Enums:
     - AppState: Represents different states of the application (start screen, login, game, quit).
     - CurrentField: Represents the current selected input field in forms.
     - ErrorMessages: Predefined error messages used for validation and login/registration feedback.
-    - LevelAttributes: Keys for enemy attributes tied to different game levels.
+    - RenderMode: Selectable ways of pushing the game screen to the display.
+    - LoopMode: Selectable ways of timing the game simulation and the drawing.
+    - GameEventType: Kinds of gameplay events sent through the event bus.
+    - CollisionMode: Selectable ways of finding the colliding sprites.
 """
 
 from enum import Enum
@@ -41,17 +44,6 @@ class ErrorMessages(str, Enum):
     PASSWORD_NOT_ALPHANUM = "Password must contain only letters a-Ö or numbers 0-9."
 
 
-class LevelAttributes(str, Enum):
-    ENEMY_COOLDOWN = "enemy_cooldown"
-    ENEMY_SHOOT_PROB = "enemy_shoot_prob"
-    ENEMY_COLS = "enemy_cols"
-    ENEMY_ROWS = "enemy_rows"
-    ENEMY_SPEED = "enemy_speed"
-    ENEMY_BULLET_SPEED = "enemy_bullet_speed"
-    ENEMY_MAX_HITS = "enemy_max_hits"
-    ENEMY_IMAGE = "enemy_image"
-
-
 class GameAttributes(str, Enum):
     LEVEL = "level"
     LEVEL_STARTED = "level_started"
@@ -63,14 +55,6 @@ class GameAttributes(str, Enum):
     RUNNING = "running"
     GAMEOVER = "gameover"
     GAMEOVER_TEXT = "gameover_text"
-    COOLDOWN = "cooldown"
-    SHOOT_PROB = LevelAttributes.ENEMY_SHOOT_PROB
-    COLS = LevelAttributes.ENEMY_COLS
-    ROWS = LevelAttributes.ENEMY_ROWS
-    SPEED = LevelAttributes.ENEMY_SPEED
-    BULLET_SPEED = LevelAttributes.ENEMY_BULLET_SPEED
-    MAX_HITS = LevelAttributes.ENEMY_MAX_HITS
-    IMAGE = LevelAttributes.ENEMY_IMAGE
     PLAYER_BULLETS = "player_bullets"
     ENEMY_BULLETS = "enemy_bullets"
     ENEMIES = "enemies"
@@ -83,3 +67,29 @@ class GameMessages(str, Enum):
     POINTS_TEXT = "POINTS / RECORD:"
     RECORD_TEXT = "NEW RECORD:"
     HIGH_SCORE_TEXT = "NEW HIGH SCORE:"
+
+
+class RenderMode(str, Enum):
+    FULL = "full"
+    DIRTY = "dirty"
+    TEXTURE = "texture"
+
+
+class LoopMode(str, Enum):
+    FRAME = "frame"
+    FIXED = "fixed"
+    UNCAPPED = "uncapped"
+
+
+class GameEventType(str, Enum):
+    ENEMY_HIT = "enemy_hit"
+    ENEMY_KILLED = "enemy_killed"
+    BULLET_HIT = "bullet_hit"
+    PLAYER_HIT = "player_hit"
+
+
+class CollisionMode(str, Enum):
+    PYGAME = "pygame"
+    SPATIAL_HASH = "grid"
+    SWEEP_AND_PRUNE = "sweep"
+    NUMPY = "numpy"
@@ -0,0 +1,69 @@
+"""
+Compare moving bullets one BulletService at a time with moving them
+all at once in a BulletPool.
+
+Usage (from the project root):
+    poetry run invoke benchmark-bullets
+"""
+import time
+from config import BULLET_HEIGHT, BULLET_WIDTH, LOWER_BOUNDARY, RIGHT_BOUNDARY
+from models.point import Point
+from models.size import Size
+from services.bullet_pool import BulletPool
+from services.bullet_service import BulletService
+from utils.service_helpers import create_sprite_info
+
+
+def spawn_positions(count):
+    """
+    Bullets in evenly spaced columns over the screen, half of them going up.
+    """
+    for i in range(count):
+        direction = "up" if i % 2 == 0 else "down"
+        yield Point((i * 37) % RIGHT_BOUNDARY, (i * 53) % LOWER_BOUNDARY), direction
+
+
+def measure_services(count, frames):
+    """
+    Returns:
+        float: Milliseconds per frame to move and check the bullets one by one.
+    """
+    size = Size(BULLET_WIDTH, BULLET_HEIGHT)
+    bullets = [BulletService(create_sprite_info(position, size, 1, 1), direction)
+               for position, direction in spawn_positions(count)]
+    start = time.perf_counter()
+    for _ in range(frames):
+        for bullet in bullets:
+            bullet.update()
+            bullet.is_moving()
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def measure_pool(count, frames):
+    """
+    Returns:
+        float: Milliseconds per frame to move and cull the bullets in the pool.
+    """
+    size = Size(BULLET_WIDTH, BULLET_HEIGHT)
+    pool = BulletPool()
+    for position, direction in spawn_positions(count):
+        pool.spawn(position, size, 1, direction)
+    start = time.perf_counter()
+    for _ in range(frames):
+        pool.update()
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main(counts=(100, 1000, 5000, 10000), frames=100):
+    """
+    Print the bullet update cost per frame for both implementations.
+    """
+    for count in counts:
+        services_ms = measure_services(count, frames)
+        pool_ms = measure_pool(count, frames)
+        print(f"{count:>6} bullets: services {services_ms:.3f} ms, "
+              f"pool {pool_ms:.3f} ms / frame")
+
+
+if __name__ == "__main__":
+    main()
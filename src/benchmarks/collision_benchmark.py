@@ -0,0 +1,116 @@
+"""
+Compare the cost of the four collision checks of the game with the
+collision detectors for different numbers of enemies and bullets.
+
+The sprites are spread over the screen at random with a fixed seed.
+Nothing is removed, so every round tests the same sprites, and the hit
+sets of every detector are checked against pygame.sprite. The sprites
+have filled masks, so the pixel precise detectors find the same hits
+and the difference is the cost of the mask tests.
+
+Usage (from the project root):
+    poetry run invoke benchmark-collisions
+"""
+import random
+import time
+import pygame
+from app_enums import CollisionMode
+from config import (BULLET_HEIGHT, BULLET_WIDTH, ENEMY_HEIGHT, ENEMY_WIDTH,
+                    LOWER_BOUNDARY, PLAYER_HEIGHT, PLAYER_WIDTH, RIGHT_BOUNDARY)
+from ui.game_views.game.collisions import create_collision_detector
+
+
+def create_group(count, width, height, rng):
+    """
+    Returns:
+        Group: count sprites with a rect and a filled mask, at random positions.
+    """
+    group = pygame.sprite.Group()
+    mask = pygame.mask.Mask((width, height), fill=True)
+    for _ in range(count):
+        sprite = pygame.sprite.Sprite()
+        sprite.rect = pygame.Rect(rng.randrange(RIGHT_BOUNDARY - width),
+                                  rng.randrange(LOWER_BOUNDARY - height),
+                                  width, height)
+        sprite.mask = mask
+        group.add(sprite)
+    return group
+
+
+def create_scene(enemies, bullets, seed=1):
+    """
+    Returns:
+        tuple: (player, enemy group, player bullet group, enemy bullet group)
+    """
+    rng = random.Random(seed)
+    player = pygame.sprite.Sprite()
+    player.rect = pygame.Rect(RIGHT_BOUNDARY // 2, LOWER_BOUNDARY - 100,
+                              PLAYER_WIDTH, PLAYER_HEIGHT)
+    player.mask = pygame.mask.Mask(player.rect.size, fill=True)
+    return (player,
+            create_group(enemies, ENEMY_WIDTH, ENEMY_HEIGHT, rng),
+            create_group(bullets // 2, BULLET_WIDTH, BULLET_HEIGHT, rng),
+            create_group(bullets - bullets // 2, BULLET_WIDTH, BULLET_HEIGHT, rng))
+
+
+def pair_set(pairs):
+    """
+    Returns:
+        set: The (sprite, sprite) tuples of CollisionPairs.
+    """
+    return {(pairs.first[i], pairs.second[j])
+            for i, j in zip(pairs.first_indices.tolist(), pairs.second_indices.tolist())}
+
+
+def check_all(detector, scene):
+    """
+    Run the four collision checks of Game.check_sprite_collisions once.
+
+    Returns:
+        tuple: The hit sets of the four checks.
+    """
+    player, enemies, player_bullets, enemy_bullets = scene
+    detector.prepare((enemies, player_bullets, enemy_bullets))
+    enemy_hits = detector.collide_pairs(enemies, player_bullets)
+    bullet_hits = detector.collide_pairs(enemy_bullets, player_bullets)
+    player_bullet_hits = detector.spritecollide(player, enemy_bullets, False)
+    player_enemy_hits = detector.spritecollide(player, enemies, False)
+    return (pair_set(enemy_hits),
+            pair_set(bullet_hits),
+            set(player_bullet_hits),
+            set(player_enemy_hits))
+
+
+def measure(detector, scene, rounds):
+    """
+    Returns:
+        float: Milliseconds per tick for the four checks.
+    """
+    start = time.perf_counter()
+    for _ in range(rounds):
+        check_all(detector, scene)
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+def main(populations=((8, 20), (60, 100), (200, 500), (500, 2000), (1000, 5000)),
+         rounds=20):
+    """
+    Print the cost of the collision checks per tick for every detector,
+    with rect and with pixel precise tests.
+    """
+    for enemies, bullets in populations:
+        scene = create_scene(enemies, bullets)
+        expected = check_all(create_collision_detector(CollisionMode.PYGAME), scene)
+        results = []
+        for mode in CollisionMode:
+            for pixel_precise in (False, True):
+                name = mode.value + (" pixel" if pixel_precise else "")
+                detector = create_collision_detector(mode, pixel_precise)
+                if check_all(detector, scene) != expected:
+                    raise AssertionError(f"{name} found different collisions")
+                results.append(f"{name} {measure(detector, scene, rounds):.3f} ms")
+        print(f"{enemies:>5} enemies, {bullets:>5} bullets: " + ", ".join(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Measure how the cost of GameDrawer.draw grows with the number of sprites.
+
+The game is filled with synthetic populations of enemies, bullets and
+hit animations. The sprites are shifted a few pixels every frame so that
+the dirty rectangle renderer has real work to do. Only GameDrawer.draw
+is timed. The results are printed as JSON so that runs before and after
+a renderer change can be compared.
+
+Usage (from the project root):
+    poetry run invoke benchmark-draw
+    poetry run invoke benchmark-draw --populations 10,100 --output draw.json
+"""
+import argparse
+import json
+import os
+import platform
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# pylint: disable=wrong-import-position
+import pygame
+from app_enums import GameAttributes, RenderMode
+from config import (BULLET_HEIGHT,
+                    BULLET_WIDTH,
+                    ENEMY_HEIGHT,
+                    ENEMY_WIDTH,
+                    LOWER_BOUNDARY,
+                    RIGHT_BOUNDARY)
+from level_config import ENEMY_IMAGE
+from models.point import Point
+from models.size import Size
+from services.enemy_service import EnemyService
+from ui.game_views.game.animation import ANIMATIONS, HIT_FRAMES
+from ui.sprites.bullet import BULLET_SPRITES
+from ui.sprites.enemy import EnemySprite
+from benchmarks.render_benchmark import create_game
+
+DEFAULT_POPULATIONS = (10, 100, 500, 1000, 5000)
+PERCENTILES = (50, 90, 95, 99)
+# Long enough that no hit animation ends during a run.
+ANIMATION_DURATION_MS = 10 ** 9
+
+
+def grid_position(index, size: Size):
+    """
+    Spread sprites evenly over the screen.
+
+    Returns:
+        Point: Top left corner of the sprite with the given index.
+    """
+    columns = max(1, RIGHT_BOUNDARY // size.width)
+    rows = max(1, LOWER_BOUNDARY // size.height)
+    x = (index % columns) * size.width
+    y = ((index // columns) % rows) * size.height
+    return Point(x, y)
+
+
+def populate(game, count):
+    """
+    Replace the sprites of the game with count enemies,
+    count bullets and count hit animations.
+    """
+    for group in game.game_groups.values():
+        group.empty()
+    game.world.clear()
+
+    enemy_size = Size(ENEMY_WIDTH, ENEMY_HEIGHT)
+    bullet_size = Size(BULLET_WIDTH, BULLET_HEIGHT)
+    for i in range(count):
+        position = grid_position(i, enemy_size)
+        enemy = EnemySprite(EnemyService.create(position, enemy_size, 1, 1, 0),
+                            game.game_groups[GameAttributes.ENEMY_BULLETS],
+                            game.world.bullets, ENEMY_IMAGE)
+        enemy.rect.topleft = position.x, position.y
+        game.game_groups[GameAttributes.ENEMIES].add(enemy)
+
+        direction = "up" if i % 2 == 0 else "down"
+        group = (GameAttributes.PLAYER_BULLETS if direction == "up"
+                 else GameAttributes.ENEMY_BULLETS)
+        position = grid_position(i * 7, bullet_size)
+        handle = game.world.bullets.spawn(position, bullet_size, 1, direction)
+        game.game_groups[group].add(BULLET_SPRITES.acquire(game.world.bullets, handle))
+
+        center = grid_position(i * 3, enemy_size)
+        game.game_groups[GameAttributes.HITS].add(
+            ANIMATIONS.create(HIT_FRAMES, (center.x, center.y), enemy_size,
+                              duration=ANIMATION_DURATION_MS))
+
+
+def shift_sprites(game, frame):
+    """
+    Move every sprite one pixel to the right, and back every 8th frame.
+    """
+    offset = -7 if frame % 8 == 7 else 1
+    for group in game.game_groups.values():
+        for sprite in group:
+            sprite.rect.x += offset
+
+
+def measure(game, frames):
+    """
+    Draw the given number of frames.
+
+    Returns:
+        list: Draw time of each frame in milliseconds.
+    """
+    timings = []
+    for frame in range(frames):
+        shift_sprites(game, frame)
+        start = time.perf_counter()
+        game.drawer.draw()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def percentile(values, percent):
+    """
+    Percentile of the values with linear interpolation between the closest ranks.
+
+    Args:
+        values: A non-empty list of numbers.
+        percent: The percentile between 0 and 100.
+
+    Returns:
+        float: The percentile.
+    """
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * percent / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(timings):
+    """
+    Returns:
+        dict: Mean, min, max and percentiles of the frame times in milliseconds.
+    """
+    summary = {
+        "mean_ms": sum(timings) / len(timings),
+        "min_ms": min(timings),
+        "max_ms": max(timings),
+    }
+    for percent in PERCENTILES:
+        summary[f"p{percent}_ms"] = percentile(timings, percent)
+    return {key: round(value, 4) for key, value in summary.items()}
+
+
+def run_benchmark(populations=DEFAULT_POPULATIONS, frames=120, warmup=10,
+                  render_modes=tuple(RenderMode)):
+    """
+    Time GameDrawer.draw for every renderer and population size.
+    The display must be set before calling this.
+
+    Args:
+        populations: Numbers of enemies, bullets and hit animations to draw.
+        frames: How many frames are timed per run.
+        warmup: How many frames are drawn before timing.
+        render_modes: The renderers to compare.
+
+    Returns:
+        dict: The benchmark report.
+    """
+    screen = pygame.display.get_surface()
+    results = []
+    for render_mode in render_modes:
+        game = create_game(screen, RenderMode(render_mode))
+        for count in populations:
+            populate(game, count)
+            game.drawer.invalidate()
+            measure(game, warmup)
+            timings = measure(game, frames)
+            results.append({
+                "renderer": RenderMode(render_mode).value,
+                "population": count,
+                "sprites": sum(len(group) for group in game.game_groups.values()),
+                "frames": frames,
+                **summarize(timings),
+            })
+        game.drawer.close()
+
+    return {
+        "benchmark": "game_drawer_draw",
+        "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "screen": list(screen.get_size()),
+        "results": results,
+    }
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description="GameDrawer.draw benchmark")
+    parser.add_argument("--populations", default=",".join(map(str, DEFAULT_POPULATIONS)),
+                        help="comma separated numbers of enemies, bullets and hit animations")
+    parser.add_argument("--frames", type=int, default=120,
+                        help="timed frames per run")
+    parser.add_argument("--renderers", default=",".join(mode.value for mode in RenderMode),
+                        help="comma separated renderers to compare")
+    parser.add_argument("--output", default="",
+                        help="write the JSON report to this file instead of stdout")
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    """
+    Run the benchmark and print or write the JSON report.
+    """
+    parsed = parse_args(args)
+    pygame.init()
+    pygame.display.set_mode((RIGHT_BOUNDARY, LOWER_BOUNDARY))
+
+    report = run_benchmark(
+        populations=[int(count) for count in parsed.populations.split(",")],
+        frames=parsed.frames,
+        render_modes=parsed.renderers.split(","))
+    pygame.quit()
+
+    text = json.dumps(report, indent=2)
+    if parsed.output:
+        with open(parsed.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Measure the memory use and the attribute access cost of the value types
+that are created for every bullet and enemy (Point, Size, Hit, SpriteInfo).
+
+Usage (from the project root):
+    poetry run invoke benchmark-models
+"""
+import timeit
+import tracemalloc
+from models.point import Point
+from models.size import Size
+from services.base_sprite_service import BaseSpriteService
+from utils.service_helpers import create_sprite_info
+
+
+def create_entity(i):
+    """
+    Create the value objects of one enemy or bullet.
+    """
+    return create_sprite_info(Point(i, i), Size(10, 20), 1, 1)
+
+
+def measure_memory(count=10000):
+    """
+    Returns:
+        float: Bytes allocated per entity (SpriteInfo with its Point, Size and Hit).
+    """
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    entities = [create_entity(i) for i in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    list_size = entities.__sizeof__()
+    return (after - before - list_size) / count
+
+
+def measure_access(number=200000):
+    """
+    Returns:
+        dict: Nanoseconds per access for each way of reading the coordinates.
+    """
+    info = create_entity(1)
+    service = BaseSpriteService(info)
+    point = info.position
+    statements = {
+        "point.x": lambda: point.x,
+        "sprite_info.x": lambda: info.x,
+        "service.x": lambda: service.x,
+        "service.point.x": lambda: service.point.x,
+        "service.position": lambda: service.position,
+        "move service.x += 1": lambda: setattr(service, "x", service.x + 1),
+        "move point.x += 1": lambda: setattr(point, "x", point.x + 1),
+    }
+    return {name: timeit.timeit(statement, number=number) / number * 1e9
+            for name, statement in statements.items()}
+
+
+def main():
+    print(f"memory per entity: {measure_memory():.0f} bytes")
+    for name, nanoseconds in measure_access().items():
+        print(f"{name:>26}: {nanoseconds:.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Compare the frame cost of the game renderers on a dummy video driver.
+
+The game is populated with a full wave of enemies and bullets that keep
+moving between frames. Only the drawing of the frame is timed.
+
+Usage (from the project root):
+    poetry run invoke benchmark-render
+"""
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+import pygame
+from app_enums import GameAttributes, RenderMode
+from config import LOWER_BOUNDARY, RIGHT_BOUNDARY
+from models.game_options import GameOptions
+from models.point import Point
+from models.size import Size
+from ui.game_views.game.game import Game
+from ui.sprites.bullet import BULLET_SPRITES
+from utils.db_setup_helpers import (create_test_database_connection,
+                                    get_database,
+                                    get_general_statistics_service,
+                                    get_user_service,
+                                    get_user_statistics_service)
+
+
+def create_game(screen, render_mode):
+    """
+    Create a game that uses an in-memory database and the given renderer.
+    """
+    database = get_database(create_test_database_connection())
+    game = Game(screen,
+                user_service=get_user_service(database),
+                user_statistics_service=get_user_statistics_service(database),
+                general_statistics_service=get_general_statistics_service(
+                    database),
+                options=GameOptions(render_mode=render_mode))
+    game.set_user(None)
+    return game
+
+
+def add_bullets(game, count):
+    """
+    Add bullets flying up and down in evenly spaced columns.
+    """
+    for i in range(count):
+        direction = "up" if i % 2 == 0 else "down"
+        group = (GameAttributes.PLAYER_BULLETS if direction == "up"
+                 else GameAttributes.ENEMY_BULLETS)
+        x = (i * 37) % RIGHT_BOUNDARY
+        y = (i * 53) % LOWER_BOUNDARY
+        handle = game.world.bullets.spawn(Point(x, y), Size(10, 20), 1, direction)
+        game.game_groups[group].add(BULLET_SPRITES.acquire(game.world.bullets, handle))
+
+
+def measure(game, frames):
+    """
+    Draw the given number of frames and return the draw time of each frame.
+    """
+    timings = []
+    for _ in range(frames):
+        game.movement.move_bullets(game.world)
+        for group in game.game_groups.values():
+            group.update()
+        start = time.perf_counter()
+        game.draw()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main(frames=300, bullets=200):
+    """
+    Print the average draw time of each renderer.
+    """
+    pygame.init()
+    screen = pygame.display.set_mode((RIGHT_BOUNDARY, LOWER_BOUNDARY))
+
+    for render_mode in RenderMode:
+        game = create_game(screen, render_mode)
+        game.create_enemies()
+        add_bullets(game, bullets)
+        timings = measure(game, frames)
+        game.drawer.close()
+        average_ms = sum(timings) / len(timings) * 1000
+        print(f"{render_mode.value:>7}: {average_ms:.3f} ms / frame")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
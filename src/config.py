@@ -23,6 +23,12 @@ BRONZE = (205, 127, 50)
 THICK_BORDER = 3
 THIN_BORDER = 1
 
+# game loop
+GAME_FPS = 60
+MAX_STEPS_PER_FRAME = 5
+MAX_FRAME_TIME = 0.25
+INTERPOLATION_MAX_DISTANCE = 32
+
 # global boundaries
 UPPER_BOUNDARY = 0
 LOWER_BOUNDARY = 600
@@ -42,9 +48,29 @@ PLAYER_COOLDOWN = 0.3
 BULLET_WIDTH = 10
 BULLET_HEIGHT = 20
 BULLET_POINTS_COEFFICIENT = 2
+BULLET_POOL_CAPACITY = 256
+
+# collisions
+SPATIAL_HASH_CELL_SIZE = 64
+AABB_CHUNK_SIZE = 1 << 20
 
 # Enemy starting attributes
 ENEMY_WIDTH = 40
 ENEMY_HEIGHT = 40
 ENEMY_START_Y_OFFSET = 100
 ENEMY_START_X_OFFSET = 50
+
+# Asset caches
+SURFACE_CACHE_MAX_SIZE = 64
+ANIMATION_CACHE_MAX_SIZE = 16
+SPRITE_POOL_MAX_SIZE = 512
+TEXT_CACHE_MAX_SIZE = 256
+
+# Menu views
+MENU_IDLE_TIMEOUT_MS = 500
+MENU_FPS = 30
+
+# Sprite atlas built by ui/build_atlas.py
+ATLAS_MANIFEST = "atlas.json"
+ATLAS_PAGE_NAME = "atlas"
+ATLAS_MAX_SIZE = 2048
@@ -28,3 +28,13 @@ ENEMY_MAX_HITS_3 = 3
 ENEMY_IMAGE_3 = "enemy3.png"
 
 FINAL_LEVEL = 15
+
+# Every level group starts from its own attributes and gets harder level by level
+LEVELS_PER_GROUP = 5
+ENEMY_SHOOTING_PROBABILITY_STEP = 0.0001
+ENEMY_COLS_STEP = 1
+ENEMY_MAX_ROWS = 4
+
+# Levels after FINAL_LEVEL (endless mode) repeat the last group,
+# and the enemies are faster on every round
+ENDLESS_SPEED_STEP = 1
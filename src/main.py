@@ -4,11 +4,13 @@ This module initializes and starts the Space Invaders game.
 It creates a Game instance, runs the main game loop, and handles
 clean-up operations like quitting Pygame and exiting the system.
 """
+import argparse
 import sys
 import pygame
 from config import LOWER_BOUNDARY, RIGHT_BOUNDARY
-from app_enums import AppState
+from app_enums import AppState, CollisionMode, LoopMode, RenderMode
 from entities.user import User
+from models.game_options import GameOptions
 from ui.game_views.create_user import CreateUserView
 from ui.game_views.start_screen import StartScreenView
 from ui.game_views.login import LoginView
@@ -16,17 +18,21 @@ from ui.game_views.game.game import Game
 from utils.ui_helpers import check_database_exists
 
 
-def main():
+def main(args=None):
     """
     Main starting point for the game.
     Initializes the Game object, runs the game loop,
     and performs cleanup operations after the game ends.
+
+    Args:
+        args: Command line arguments. Defaults to sys.argv.
     """
 
+    options = parse_options(args)
     screen = init_main()
 
     state = AppState.START_SCREEN
-    game = Game(screen)
+    game = Game(screen, options=options)
     user = None
 
     while state != AppState.QUIT:
@@ -75,6 +81,52 @@ def handle_states(state: AppState, screen, game: Game, user: User):
     return state, user
 
 
+def parse_options(args=None):
+    """
+    Parse the startup options from the command line.
+
+    Args:
+        args: Command line arguments. Defaults to sys.argv.
+
+    Returns:
+        GameOptions: The selected game options.
+    """
+    parser = argparse.ArgumentParser(description="Alien Attack")
+    parser.add_argument("--renderer",
+                        choices=[mode.value for mode in RenderMode],
+                        default=RenderMode.FULL.value,
+                        help="full: redraw the whole screen every frame, "
+                        "dirty: push only the changed areas to the display, "
+                        "texture: draw with SDL textures in a separate game window")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed of the enemy fire, the same seed gives the same game")
+    parser.add_argument("--loop",
+                        choices=[mode.value for mode in LoopMode],
+                        default=LoopMode.FRAME.value,
+                        help="frame: one game step per frame like the original game, "
+                        "fixed: the game runs at a fixed speed and skips frames "
+                        "when drawing is slow, "
+                        "uncapped: the game runs as fast as it can")
+    parser.add_argument("--endless", action="store_true",
+                        help="keep playing after the final level, "
+                        "the enemies get faster on every round")
+    parser.add_argument("--collisions",
+                        choices=[mode.value for mode in CollisionMode],
+                        default=CollisionMode.PYGAME.value,
+                        help="pygame: test every pair of sprites, "
+                        "grid: test only the sprites in the same cells of a spatial hash grid, "
+                        "sweep: test only the sprites that overlap on the x axis, "
+                        "numpy: test all pairs of two groups in one NumPy call")
+    parser.add_argument("--pixel", action="store_true",
+                        help="check the collisions by the image pixels, "
+                        "so the transparent corners of the sprites do not hit")
+    parsed = parser.parse_args(args)
+    return GameOptions(render_mode=parsed.renderer, seed=parsed.seed,
+                       loop_mode=parsed.loop, endless=parsed.endless,
+                       collision_mode=parsed.collisions,
+                       pixel_collisions=parsed.pixel)
+
+
 def init_main():
     """
     Initialize the main display screen and window settings.
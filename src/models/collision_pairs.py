@@ -0,0 +1,38 @@
+from typing import NamedTuple
+import numpy as np
+
+
+class CollisionPairs(NamedTuple):
+    """
+    The colliding pairs of two sprite groups as index arrays.
+
+    Pair k is first[first_indices[k]] and second[second_indices[k]].
+    The pairs are sorted by the first index, so the sprites of the first
+    group come in the same order as in the dict of groupcollide.
+
+    Attributes:
+        first: List of sprites of the first group.
+        second: List of sprites of the second group.
+        first_indices: Integer array of indices to first.
+        second_indices: Integer array of indices to second.
+    """
+
+    first: list
+    second: list
+    first_indices: np.ndarray
+    second_indices: np.ndarray
+
+    def consume_second(self):
+        """
+        Keep only the first pair of every sprite of the second group, as
+        groupcollide with dokill_b does: it goes through the first group in
+        order, and the first sprite that hits a sprite of the second group
+        removes it before the later sprites are tested.
+
+        Returns:
+            CollisionPairs: The remaining pairs, still sorted by the first index.
+        """
+        _, first_pairs = np.unique(self.second_indices, return_index=True)
+        first_pairs.sort()
+        return self._replace(first_indices=self.first_indices[first_pairs],
+                             second_indices=self.second_indices[first_pairs])
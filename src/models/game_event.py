@@ -0,0 +1,19 @@
+from typing import NamedTuple
+from app_enums import GameEventType
+from models.size import Size
+
+
+class GameEvent(NamedTuple):
+    """
+    Something that happened in the game during one tick, for example
+    an enemy that was killed. The consumers of the event bus react to it.
+
+    Attributes:
+        type: The kind of the event.
+        position: The (x, y) center of where it happened.
+        size: The size of the object the event is about.
+    """
+
+    type: GameEventType
+    position: tuple
+    size: Size
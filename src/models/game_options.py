@@ -0,0 +1,77 @@
+from app_enums import CollisionMode, LoopMode, RenderMode
+
+
+class GameOptions:
+    """
+    Startup options that select between alternative implementations
+    of the game internals. The defaults play like the original game.
+    """
+
+    def __init__(self, render_mode=RenderMode.FULL, seed=None, loop_mode=LoopMode.FRAME,
+                 endless=False, collision_mode=CollisionMode.PYGAME, pixel_collisions=False):
+        """
+        Initialize the game options.
+
+        Args:
+            render_mode: How the game screen is pushed to the display.
+            seed: Seed of the game's random numbers. Random if not given.
+            loop_mode: How the simulation steps and the frames are timed.
+            endless: Whether the game goes on after the final level.
+            collision_mode: How the colliding sprites are found.
+            pixel_collisions: Whether the collisions are checked by the image pixels.
+        """
+        self._render_mode = RenderMode(render_mode)
+        self._seed = seed
+        self._loop_mode = LoopMode(loop_mode)
+        self._endless = endless
+        self._collision_mode = CollisionMode(collision_mode)
+        self._pixel_collisions = pixel_collisions
+
+    @property
+    def render_mode(self):
+        """
+        Returns:
+            RenderMode: How the game screen is pushed to the display.
+        """
+        return self._render_mode
+
+    @property
+    def seed(self):
+        """
+        Returns:
+            int or None: Seed of the game's random numbers.
+        """
+        return self._seed
+
+    @property
+    def loop_mode(self):
+        """
+        Returns:
+            LoopMode: How the simulation steps and the frames are timed.
+        """
+        return self._loop_mode
+
+    @property
+    def endless(self):
+        """
+        Returns:
+            bool: Whether the game goes on after the final level.
+        """
+        return self._endless
+
+    @property
+    def collision_mode(self):
+        """
+        Returns:
+            CollisionMode: How the colliding sprites are found.
+        """
+        return self._collision_mode
+
+    @property
+    def pixel_collisions(self):
+        """
+        Returns:
+            bool: Whether the collisions are checked by the image pixels
+            instead of the sprite rectangles.
+        """
+        return self._pixel_collisions
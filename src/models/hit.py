@@ -5,6 +5,8 @@ class Hit:
     Max hits tells how many hits the sprite can take. 
     """
 
+    __slots__ = ("hitcount", "_max_hits")
+
     def __init__(self, hitcount: int, max_hits: int):
         """
         Initialize the Hit object.
@@ -13,27 +15,9 @@ class Hit:
             hitcount: The current number of hits the sprite has taken.
             max_hits: The maximum number of hits the sprite can take.
         """
-        self._hitcount = hitcount
+        self.hitcount = hitcount
         self._max_hits = max_hits
 
-    @property
-    def hitcount(self):
-        """
-        Returns:
-            hitcount: The current number of hits the sprite has taken.
-        """
-        return self._hitcount
-
-    @hitcount.setter
-    def hitcount(self, value):
-        """
-        Set the current number of hits.
-
-        Args:
-            value: The new hit count.
-        """
-        self._hitcount = value
-
     @property
     def max_hits(self):
         """
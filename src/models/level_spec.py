@@ -0,0 +1,35 @@
+from typing import NamedTuple
+
+
+class LevelSpec(NamedTuple):
+    """
+    The compiled settings of one game level.
+
+    A level never changes once it has been compiled, so it is stored as
+    a tuple and its values are read as attributes instead of dictionary keys.
+
+    Attributes:
+        level: The level number.
+        cooldown: Time in seconds between the shots of one enemy.
+        shooting_probability: Chance that a ready enemy shoots on a tick.
+        cols: Number of enemy columns.
+        rows: Number of enemy rows.
+        speed: Starting speed of the enemies.
+        bullet_speed: Speed of the enemy bullets.
+        max_hits: How many hits an enemy can take.
+        image: Image file of the enemies.
+        points: Points for destroying an enemy.
+        bullet_points: Points for shooting down an enemy bullet.
+    """
+
+    level: int
+    cooldown: float
+    shooting_probability: float
+    cols: int
+    rows: int
+    speed: int
+    bullet_speed: int
+    max_hits: int
+    image: str
+    points: int
+    bullet_points: int
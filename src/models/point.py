@@ -1,8 +1,13 @@
 class Point:
     """
     Represents a position point in 2D space with x and y coordinates.
+
+    The coordinates are plain slot attributes, so reading and writing
+    them does not go through a property and the object has no instance dict.
     """
 
+    __slots__ = ("x", "y")
+
     def __init__(self, x, y):
         """
         Initializes a Point object.
@@ -11,48 +16,12 @@ class Point:
             x: The x-coordinate.
             y: The y-coordinate.
         """
-        self._x = x
-        self._y = y
-
-    @property
-    def x(self):
-        """
-        Returns:
-            x: The current x-coordinate of the point.
-        """
-        return self._x
-
-    @x.setter
-    def x(self, value):
-        """
-        Set a new x-coordinate.
-
-        Args:
-            value: The new x value.
-        """
-        self._x = value
-
-    @property
-    def y(self):
-        """
-        Returns:
-            y: The current y-coordinate of the point.
-        """
-        return self._y
-
-    @y.setter
-    def y(self, value):
-        """
-        Set a new y-coordinate.
-
-        Args:
-            value: The new y value.
-        """
-        self._y = value
+        self.x = x
+        self.y = y
 
     def as_tuple(self):
         """
         Returns:
             tuple: A tuple (x, y) representing the point's coordinates.
         """
-        return (self._x, self._y)
+        return (self.x, self.y)
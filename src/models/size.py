@@ -1,31 +1,16 @@
-class Size:
+from typing import NamedTuple
+
+
+class Size(NamedTuple):
     """
     Represents the size (width and height) of a sprite or game object.
-    """
 
-    def __init__(self, width, height):
-        """
-        Initialize the Size with a given width and height.
+    A size never changes, so it is stored as a tuple.
 
-        Args:
-            width: The width of the object.
-            height: The height of the object.
-        """
-        self._width = width
-        self._height = height
-
-    @property
-    def width(self):
-        """
-        Returns:
-            width: The width of the object.
-        """
-        return self._width
+    Attributes:
+        width: The width of the object.
+        height: The height of the object.
+    """
 
-    @property
-    def height(self):
-        """
-        Returns:
-            height: The height of the object.
-        """
-        return self._height
+    width: int
+    height: int
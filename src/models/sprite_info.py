@@ -19,6 +19,8 @@ class SpriteInfo:
                    and the max hits allowed.
     """
 
+    __slots__ = ("_position", "_size", "_speed", "_hit")
+
     def __init__(self, position: Point, size: Size, speed: int, hit: Hit):
         """
         Initialize the SpriteInfo object.
@@ -34,6 +36,15 @@ class SpriteInfo:
         self._speed = speed
         self._hit = hit
 
+    @property
+    def position(self):
+        """
+        Returns:
+            Point: The position object of the sprite. Hot paths can read and
+            write its x and y directly instead of going through the properties.
+        """
+        return self._position
+
     @property
     def size(self):
         """
@@ -0,0 +1,154 @@
+import numpy as np
+from config import AABB_CHUNK_SIZE
+
+
+def _static_overlap(first, second):
+    a_x, a_y, a_width, a_height = first[:4]
+    b_x, b_y, b_width, b_height = second[:4]
+    return ((a_x < b_x + b_width) & (b_x < a_x + a_width)
+            & (a_y < b_y + b_height) & (b_y < a_y + a_height))
+
+
+def _axis_interval(distance, motion, low, high):
+    """
+    The open interval of u, how far back along the motion, where
+    low < distance - u * motion < high.
+    """
+    moving = motion != 0
+    step = np.where(moving, motion, 1)
+    first = (distance - high) / step
+    second = (distance - low) / step
+    inside = (low < distance) & (distance < high)
+    enter = np.where(moving, np.minimum(first, second), np.where(inside, -np.inf, np.inf))
+    leave = np.where(moving, np.maximum(first, second), np.where(inside, np.inf, -np.inf))
+    return enter, leave
+
+
+def _swept_overlap(first, second):
+    a_x, a_y, a_width, a_height, a_dx, a_dy = first
+    b_x, b_y, b_width, b_height, b_dx, b_dy = second
+    enter_x, leave_x = _axis_interval(b_x - a_x, b_dx - a_dx, -b_width, a_width)
+    enter_y, leave_y = _axis_interval(b_y - a_y, b_dy - a_dy, -b_height, a_height)
+    enter = np.maximum(enter_x, enter_y)
+    leave = np.minimum(leave_x, leave_y)
+    return ((a_width > 0) & (a_height > 0) & (b_width > 0) & (b_height > 0)
+            & (enter < leave) & (enter < 1) & (leave > 0))
+
+
+def _swept_bounds(values):
+    """
+    The (x, y, width, height) of the area each rectangle covered on the tick.
+    """
+    x, y, width, height, dx, dy = values
+    return (x - np.maximum(dx, 0), y - np.maximum(dy, 0),
+            width + np.abs(dx), height + np.abs(dy))
+
+
+def _pairs(first, second, chunk_size, overlap):
+    first = [np.asarray(values) for values in first]
+    second = [np.asarray(values) for values in second]
+    if len(first[0]) == 0 or len(second[0]) == 0:
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty
+
+    b_valid = np.flatnonzero((second[2] > 0) & (second[3] > 0))
+    second = [values[b_valid] for values in second]
+
+    rows = max(1, chunk_size // max(1, len(b_valid)))
+    first_indices = []
+    second_indices = []
+    for start in range(0, len(first[0]), rows):
+        chunk = [values[start:start + rows, None] for values in first]
+        hits = (chunk[2] > 0) & (chunk[3] > 0) & overlap(chunk, second)
+        i, j = np.nonzero(hits)
+        first_indices.append(i + start)
+        second_indices.append(b_valid[j])
+    return np.concatenate(first_indices), np.concatenate(second_indices)
+
+
+def overlap_pairs(first, second, chunk_size=AABB_CHUNK_SIZE):
+    """
+    Find all overlapping pairs of two groups of axis aligned rectangles
+    in a few NumPy operations instead of one test per pair.
+
+    The rectangles are given as arrays, for example the x, y, width and
+    height arrays of a BulletPool or a Formation. Rectangles overlap like
+    pygame.Rect.colliderect: touching edges do not overlap, and a rectangle
+    with no width or height overlaps nothing. The pairs are tested in chunks,
+    so the temporary arrays stay below chunk_size elements.
+
+    Args:
+        first: (x, y, width, height) arrays of the first group.
+        second: (x, y, width, height) arrays of the second group.
+        chunk_size: Largest number of pairs tested in one operation.
+
+    Returns:
+        tuple: (first_indices, second_indices) arrays of the overlapping
+        pairs, sorted by the first index and then by the second.
+    """
+    return _pairs(first, second, chunk_size, _static_overlap)
+
+
+def swept_overlap_pairs(first, first_motion, second, second_motion,
+                        chunk_size=AABB_CHUNK_SIZE):
+    """
+    Find the pairs of two groups of moving rectangles that overlap at any
+    point of the last tick, not only at its end.
+
+    Every rectangle has moved in a straight line by its motion during the
+    tick and is now at its given position. A pair collides if the segment
+    of the relative motion crosses the rectangle of the other, grown by
+    the size of the first (segment against AABB). A fast bullet can so
+    not pass through a thin target between two ticks. Only the pairs whose
+    swept bounds overlap get the exact test. Without motion the result is
+    the same as with overlap_pairs.
+
+    Args:
+        first: (x, y, width, height) arrays of the first group at the end of the tick.
+        first_motion: (dx, dy) arrays of how far the first group moved.
+        second: (x, y, width, height) arrays of the second group.
+        second_motion: (dx, dy) arrays of how far the second group moved.
+        chunk_size: Largest number of pairs tested in one operation.
+
+    Returns:
+        tuple: (first_indices, second_indices) arrays of the colliding
+        pairs, sorted by the first index and then by the second.
+    """
+    first = [np.asarray(values) for values in (*first, *first_motion)]
+    second = [np.asarray(values) for values in (*second, *second_motion)]
+    first_indices, second_indices = _pairs(_swept_bounds(first), _swept_bounds(second),
+                                           chunk_size, _static_overlap)
+    hits = _swept_overlap([values[first_indices] for values in first],
+                          [values[second_indices] for values in second])
+    return first_indices[hits], second_indices[hits]
+
+
+def swept_overlap(first, first_motion, second, second_motion):
+    """
+    Test one pair of moving rectangles like swept_overlap_pairs, without NumPy.
+
+    Args:
+        first, second: (x, y, width, height) at the end of the tick.
+        first_motion, second_motion: (dx, dy) moved during the tick.
+
+    Returns:
+        bool: Whether the rectangles overlap at any point of the tick.
+    """
+    a_x, a_y, a_width, a_height = first
+    b_x, b_y, b_width, b_height = second
+    if a_width <= 0 or a_height <= 0 or b_width <= 0 or b_height <= 0:
+        return False
+
+    enter, leave = -1.0, 2.0
+    for distance, motion, low, high in (
+            (b_x - a_x, second_motion[0] - first_motion[0], -b_width, a_width),
+            (b_y - a_y, second_motion[1] - first_motion[1], -b_height, a_height)):
+        if motion == 0:
+            if not low < distance < high:
+                return False
+            continue
+        start, end = (distance - high) / motion, (distance - low) / motion
+        if start > end:
+            start, end = end, start
+        enter, leave = max(enter, start), min(leave, end)
+    return enter < leave and enter < 1 and leave > 0
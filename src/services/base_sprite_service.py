@@ -13,6 +13,8 @@ class BaseSpriteService:
         _sprite_info (SpriteInfo): The underlying data object containing sprite state.
     """
 
+    __slots__ = ("_sprite_info",)
+
     def __init__(self, sprite_info: SpriteInfo):
         """
         Initialize the service with a SpriteInfo object.
@@ -59,6 +61,15 @@ class BaseSpriteService:
         """
         self._sprite_info.y = value
 
+    @property
+    def point(self):
+        """
+        Returns:
+            Point: The position object of the sprite for hot paths
+            that move the sprite every frame.
+        """
+        return self._sprite_info.position
+
     @property
     def position(self):
         """
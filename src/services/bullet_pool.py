@@ -0,0 +1,197 @@
+import numpy as np
+from models.point import Point
+from models.size import Size
+from config import BULLET_POOL_CAPACITY, LOWER_BOUNDARY, UPPER_BOUNDARY
+
+UP = -1
+DOWN = 1
+
+
+class BulletPool():
+    """
+    Stores the state of all bullets in preallocated NumPy arrays
+    (struct of arrays) instead of one service object per bullet.
+
+    A bullet is a slot index into the arrays. Released slots are reused
+    for new bullets, so shooting does not allocate once the pool has
+    grown to the largest number of bullets on screen. All alive bullets
+    are moved and culled in one vectorized step per frame.
+
+    Every slot has a generation number that changes when the slot is
+    released. A bullet handle (slot, generation) that outlives its bullet
+    can not release the bullet that reuses the slot.
+
+    Attributes:
+        x, y, width, height, speed: Integer arrays of the bullet rectangles and speeds.
+        dy: How far each bullet moved on the last update, for swept collisions.
+        direction: UP (-1) or DOWN (1) for each slot.
+        alive: True for the slots of bullets that are still moving.
+    """
+
+    def __init__(self, capacity=BULLET_POOL_CAPACITY,
+                 upper_boundary=UPPER_BOUNDARY, lower_boundary=LOWER_BOUNDARY):
+        """
+        Args:
+            capacity: How many bullets fit in the pool before it grows.
+            upper_boundary: Bullets moving up are removed above this y.
+            lower_boundary: Bullets moving down are removed below this y.
+        """
+        self._upper_boundary = upper_boundary
+        self._lower_boundary = lower_boundary
+        self._allocate(capacity)
+        self._free = list(range(capacity - 1, -1, -1))
+        self._y_values = self.y.tolist()
+        self._dy_values = self.dy.tolist()
+        self._alive_values = self.alive.tolist()
+
+    def _allocate(self, capacity):
+        self.x = np.zeros(capacity, dtype=np.int32)
+        self.y = np.zeros(capacity, dtype=np.int32)
+        self.width = np.zeros(capacity, dtype=np.int32)
+        self.height = np.zeros(capacity, dtype=np.int32)
+        self.speed = np.zeros(capacity, dtype=np.int32)
+        self.dy = np.zeros(capacity, dtype=np.int32)
+        self.direction = np.zeros(capacity, dtype=np.int8)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.generation = np.zeros(capacity, dtype=np.int64)
+
+    def _grow(self):
+        """
+        Double the capacity of the pool. Existing slots keep their indices.
+        """
+        old_capacity = self.capacity
+        old_arrays = (self.x, self.y, self.width, self.height, self.speed,
+                      self.dy, self.direction, self.alive, self.generation)
+        self._allocate(old_capacity * 2)
+        new_arrays = (self.x, self.y, self.width, self.height, self.speed,
+                      self.dy, self.direction, self.alive, self.generation)
+        for old, new in zip(old_arrays, new_arrays):
+            new[:old_capacity] = old
+        self._free.extend(range(self.capacity - 1, old_capacity - 1, -1))
+        self._y_values = self.y.tolist()
+        self._dy_values = self.dy.tolist()
+        self._alive_values = self.alive.tolist()
+
+    @property
+    def capacity(self):
+        return len(self.alive)
+
+    def __len__(self):
+        """
+        Returns:
+            int: Number of slots in use.
+        """
+        return self.capacity - len(self._free)
+
+    def spawn(self, position: Point, size: Size, speed, direction="up"):
+        """
+        Put a new bullet into a free slot.
+
+        Args:
+            position: Top left corner of the bullet.
+            size: Size of the bullet.
+            speed: Pixels the bullet moves per frame.
+            direction: "up" or "down".
+
+        Returns:
+            tuple: (slot, generation) handle of the bullet.
+        """
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        self.x[slot] = position.x
+        self.y[slot] = position.y
+        self.width[slot] = size.width
+        self.height[slot] = size.height
+        self.speed[slot] = speed
+        self.dy[slot] = 0
+        self.direction[slot] = UP if direction == "up" else DOWN
+        self.alive[slot] = True
+        self._y_values[slot] = position.y
+        self._dy_values[slot] = 0
+        self._alive_values[slot] = True
+        return slot, int(self.generation[slot])
+
+    def release(self, slot, generation):
+        """
+        Free the slot of a bullet so that it can be reused.
+        Releasing a bullet that has already been released does nothing.
+
+        Returns:
+            bool: Whether the slot was released.
+        """
+        if self.generation[slot] != generation:
+            return False
+        self.generation[slot] += 1
+        self.alive[slot] = False
+        self._alive_values[slot] = False
+        self._free.append(slot)
+        return True
+
+    def clear(self):
+        """
+        Release all bullets.
+        """
+        self.generation[:] += 1
+        self.alive[:] = False
+        self._alive_values = self.alive.tolist()
+        self._free = list(range(self.capacity - 1, -1, -1))
+
+    def update(self):
+        """
+        Move all alive bullets in their direction, limited by the screen
+        boundaries, and mark the bullets that have left the screen as dead.
+        Matches BulletService.move and BulletService.is_moving.
+
+        Returns:
+            int: Number of bullets that left the screen.
+        """
+        alive = self.alive
+        up = alive & (self.direction == UP)
+        down = alive & (self.direction == DOWN)
+        previous_y = self.y.copy()
+
+        self.y[up] = np.maximum(self._upper_boundary - self.height[up],
+                                self.y[up] - self.speed[up])
+        self.y[down] = np.minimum(self._lower_boundary + self.height[down],
+                                  self.y[down] + self.speed[down])
+
+        gone = (up & (self.y < self._upper_boundary)) | (
+            down & (self.y > self._lower_boundary))
+        alive &= ~gone
+        np.subtract(self.y, previous_y, out=self.dy)
+
+        self._y_values = self.y.tolist()
+        self._dy_values = self.dy.tolist()
+        self._alive_values = alive.tolist()
+        return int(np.count_nonzero(gone))
+
+    def get_y(self, slot):
+        """
+        Returns:
+            int: The y coordinate of the bullet as a Python int.
+        """
+        return self._y_values[slot]
+
+    def get_dy(self, slot):
+        """
+        Returns:
+            int: How far the bullet moved on the last update as a Python int.
+        """
+        return self._dy_values[slot]
+
+    def is_alive(self, slot):
+        """
+        Returns:
+            bool: Whether the bullet in the slot is still on screen.
+        """
+        return self._alive_values[slot]
+
+    def get_position(self, slot):
+        return int(self.x[slot]), int(self.y[slot])
+
+    def get_size(self, slot):
+        return Size(int(self.width[slot]), int(self.height[slot]))
+
+    def get_direction(self, slot):
+        return "up" if self.direction[slot] == UP else "down"
@@ -60,14 +60,15 @@ class BulletService():
         Returns:
             int: The updated y-position after moving.
         """
-        if self.direction == "up":
-            self._sprite.y = max(self._upper_boundary,
-                                 self._sprite.y - self._sprite.speed)
-        elif self.direction == "down":
-            self._sprite.y = min(self._lower_boundary,
-                                 self._sprite.y + self._sprite.speed)
+        point = self._sprite.point
+        if self._direction == "up":
+            point.y = max(self._upper_boundary,
+                          point.y - self._sprite.speed)
+        elif self._direction == "down":
+            point.y = min(self._lower_boundary,
+                          point.y + self._sprite.speed)
         # else do nothing
-        return self._sprite.y
+        return point.y
 
     def update(self):
         """
@@ -87,8 +88,9 @@ class BulletService():
         Returns:
             bool: If the bullet has reached its end boundary -> False, otherwise -> True.
         """
-        if self.direction == "down" and self._sprite.y > LOWER_BOUNDARY:
+        y = self._sprite.point.y
+        if self._direction == "down" and y > LOWER_BOUNDARY:
             return False
-        if self.direction == "up" and self._sprite.y < UPPER_BOUNDARY:
+        if self._direction == "up" and y < UPPER_BOUNDARY:
             return False
         return True
@@ -0,0 +1,86 @@
+import time
+from config import GAME_FPS
+
+
+class WallClock():
+    """
+    Reads the real time. The cooldowns follow the wall clock
+    no matter how fast the game runs.
+    """
+
+    def now(self):
+        """
+        Returns:
+            float: The current time in seconds.
+        """
+        return time.time()
+
+
+class TickClock():
+    """
+    Counts the game time in simulation steps. The game advances the clock
+    once per step, so the cooldowns follow the game speed, also when the
+    simulation runs faster or slower than real time.
+    """
+
+    def __init__(self, steps_per_second=GAME_FPS):
+        """
+        Args:
+            steps_per_second: How many steps make one second of game time.
+        """
+        self._step = 1 / steps_per_second
+        self._tick = 0
+        self._now = 0.0
+
+    @property
+    def tick(self):
+        return self._tick
+
+    def now(self):
+        """
+        Returns:
+            float: The game time in seconds.
+        """
+        return self._now
+
+    def advance(self, ticks=1):
+        """
+        Move the game time forward.
+
+        Args:
+            ticks: Number of simulation steps.
+        """
+        self._tick += ticks
+        self._now = self._tick * self._step
+
+
+class FakeClock():
+    """
+    A clock that only moves when told to. For tests.
+    """
+
+    def __init__(self, start=0.0):
+        """
+        Args:
+            start: The starting time in seconds.
+        """
+        self._now = start
+
+    def now(self):
+        """
+        Returns:
+            float: The time in seconds.
+        """
+        return self._now
+
+    def advance(self, seconds):
+        """
+        Move the time forward.
+
+        Args:
+            seconds: How much the time moves.
+        """
+        self._now += seconds
+
+
+WALL_CLOCK = WallClock()
@@ -0,0 +1,14 @@
+class MovementSystem():
+    """
+    Moves the entities of a World with the rules of the game.
+    """
+
+    def move_bullets(self, world):
+        """
+        Move the bullets and mark the ones that have left the screen as dead,
+        see BulletPool.update.
+
+        Returns:
+            int: Number of bullets that left the screen.
+        """
+        return world.bullets.update()
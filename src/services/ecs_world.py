@@ -0,0 +1,41 @@
+from config import BULLET_POOL_CAPACITY
+from services.bullet_pool import BulletPool
+
+
+class World():
+    """
+    Holds the struct-of-arrays storages of the game entities, which the
+    systems in ecs_systems update in vectorized steps.
+
+    The bullets are stored in a BulletPool. A bullet entity is a
+    (slot, generation) handle of the pool, so the sprites and the
+    shooting services work on the pool directly.
+
+    The enemies and the player are not entities of the world. The
+    enemies of a wave already move in the arrays of a Formation and are
+    picked to shoot by the FireScheduler, and the player is a single
+    sprite with its PlayerService.
+
+    Attributes:
+        bullets: The BulletPool of the player and enemy bullets.
+    """
+
+    def __init__(self, bullet_capacity=BULLET_POOL_CAPACITY):
+        """
+        Args:
+            bullet_capacity: How many bullets fit in the world before the pool grows.
+        """
+        self.bullets = BulletPool(capacity=bullet_capacity)
+
+    def __len__(self):
+        """
+        Returns:
+            int: Number of entities in the world.
+        """
+        return len(self.bullets)
+
+    def clear(self):
+        """
+        Remove all entities.
+        """
+        self.bullets.clear()
@@ -17,17 +17,20 @@ class EnemyService():
     specific to enemy movement patterns and boundary handling.
     """
 
-    def __init__(self, sprite_info, cooldown=ENEMY_COOLDOWN):
+    def __init__(self, sprite_info, cooldown=ENEMY_COOLDOWN, clock=None):
         """
         Initialize the enemy with its sprite info and shooting cooldown.
 
         Args:
             sprite_info: The enemy's position, size, speed, and hit data.
             cooldown: Time in seconds between allowed shots.
+            clock: Gives the time for the shooting cooldown. Defaults to the wall clock.
         """
         self._sprite = BaseSpriteService(sprite_info)
-        self._shooter = ShootingService(cooldown=cooldown)
+        self._shooter = ShootingService(cooldown=cooldown, clock=clock)
         self.direction = "right"
+        self._formation = None
+        self._slot = None
 
     @property
     def width(self):
@@ -41,10 +44,20 @@ class EnemyService():
     def size(self):
         return self._sprite.size
 
+    @property
+    def speed(self):
+        return self._sprite.speed
+
     @property
     def position(self):
+        if self._formation is not None:
+            return self._formation.get_position(self._slot)
         return self._sprite.position
 
+    @property
+    def formation(self):
+        return self._formation
+
     @property
     def is_dead(self):
         return self._sprite.is_dead()
@@ -55,7 +68,8 @@ class EnemyService():
             size,
             speed,
             enemy_max_hits,
-            enemy_cooldown):
+            enemy_cooldown,
+            clock=None):
         """
         Creates EnemyService object. Simplifies the creation
         compared to the constructor.
@@ -67,6 +81,7 @@ class EnemyService():
             - enemy_max_hits: how many hits the enemy can take
             - enemy_cooldown: how long the enemy waits 
                             before a new shooting attempt
+            - clock: gives the time for the shooting cooldown
 
         Returns:
             EnemyService object
@@ -77,24 +92,66 @@ class EnemyService():
                 size,
                 speed,
                 enemy_max_hits),
-            cooldown=enemy_cooldown)
+            cooldown=enemy_cooldown,
+            clock=clock)
 
     def add_hit(self):
         return self._sprite.add_hit()
 
     def try_shoot(self):
-        return self._shooter.try_shoot(self._sprite.position, self._sprite.size, direction="down")
+        return self._shooter.try_shoot(self.position, self._sprite.size, direction="down")
+
+    def try_shoot_into(self, bullet_pool):
+        return self._shooter.try_shoot_into(bullet_pool,
+                                            self.position,
+                                            self._sprite.size,
+                                            direction="down")
+
+    def shoot_into(self, bullet_pool):
+        return self._shooter.shoot_into(bullet_pool,
+                                        self.position,
+                                        self._sprite.size,
+                                        direction="down")
 
     def can_shoot(self):
         return self._shooter.can_shoot()
 
+    def join_formation(self, formation, slot):
+        """
+        Let a Formation move the enemy together with the rest of the wave.
+
+        Args:
+            formation: The Formation of the wave.
+            slot: The index of the enemy in the formation.
+        """
+        self._formation = formation
+        self._slot = slot
+
+    def leave_formation(self):
+        """
+        Take the position, direction and speed back from the formation
+        and stop moving with it.
+        """
+        if self._formation is None:
+            return
+        self._sprite.x, self._sprite.y = self._formation.get_position(self._slot)
+        self.direction = self._formation.get_direction(self._slot)
+        self._sprite.speed = self._formation.get_speed(self._slot)
+        self._formation.remove(self._slot)
+        self._formation = None
+        self._slot = None
+
     def move(self):
         """
         Handles enemy movement, including boundary checks and direction changes.
+        An enemy in a formation has already been moved by Formation.update.
 
         Returns:
             tuple: The new (x, y) position of the enemy.
         """
+        if self._formation is not None:
+            return self.position
+
         if self._has_hit_bottom():
             return self._stop_at_bottom()
 
@@ -176,7 +233,8 @@ class EnemyService():
         """
         Move the enemy one step in its current direction.
         """
+        point = self._sprite.point
         if self.direction == "left":
-            self._sprite.x -= self._sprite.speed
+            point.x -= self._sprite.speed
         else:
-            self._sprite.x += self._sprite.speed
+            point.x += self._sprite.speed
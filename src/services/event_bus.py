@@ -0,0 +1,63 @@
+from models.game_event import GameEvent
+
+
+class EventBus():
+    """
+    Collects the gameplay events of one tick and hands them to the
+    consumers in one batch.
+
+    The collision checks only emit events. Scoring, hit effects, player
+    health and statistics are consumers, and each of them goes through
+    the events of the tick once, when the bus is dispatched.
+    """
+
+    def __init__(self):
+        self._events = []
+        self._consumers = []
+
+    def __len__(self):
+        """
+        Returns:
+            int: Number of events waiting for the next dispatch.
+        """
+        return len(self._events)
+
+    def subscribe(self, consumer):
+        """
+        Add a consumer. The consumers are called in the order they were added.
+
+        Args:
+            consumer: Function that takes the list of events of a tick.
+        """
+        self._consumers.append(consumer)
+
+    def emit(self, event_type, position, size):
+        """
+        Add an event to the buffer of the current tick.
+
+        Args:
+            event_type: A GameEventType.
+            position: The (x, y) center of where it happened.
+            size: The size of the object the event is about.
+        """
+        self._events.append(GameEvent(event_type, position, size))
+
+    def dispatch(self):
+        """
+        Hand the events of the tick to every consumer and empty the buffer.
+
+        Returns:
+            int: Number of events dispatched.
+        """
+        if not self._events:
+            return 0
+        events, self._events = self._events, []
+        for consumer in self._consumers:
+            consumer(events)
+        return len(events)
+
+    def clear(self):
+        """
+        Drop the events that have not been dispatched.
+        """
+        self._events = []
@@ -0,0 +1,76 @@
+import numpy as np
+from config import GAME_FPS
+from level_config import ENEMY_COOLDOWN, ENEMY_SHOOTING_PROBABILITY
+from services.clock import TickClock
+
+
+class FireScheduler():
+    """
+    Picks the enemies of a wave that shoot on each game tick.
+
+    Every enemy that is alive and out of cooldown shoots with the same
+    probability. Instead of one random number per enemy, the number of
+    shooters is drawn from a binomial distribution and the shooters are
+    chosen from the candidates in one call. The result has the same
+    distribution as separate draws, but the cost per tick depends on the
+    number of shooters.
+
+    The cooldowns are counted in the ticks of a TickClock instead of wall
+    clock time, and the random numbers come from a seedable generator, so
+    the same seed and the same inputs give the same shots. The game gives
+    its own TickClock, so the shooting follows the same simulation time
+    as the rest of the game.
+    """
+
+    def __init__(self, enemy_count, shooting_probability=ENEMY_SHOOTING_PROBABILITY,
+                 cooldown=ENEMY_COOLDOWN, seed=None, rng=None, clock=None):
+        """
+        Args:
+            enemy_count: Number of enemies in the wave (slots of the formation).
+            shooting_probability: Chance that a ready enemy shoots on a tick.
+            cooldown: Time in seconds between the shots of one enemy.
+            seed: Seed of the random generator. Random if not given.
+            rng: A numpy Generator to use instead of a new one.
+            clock: The TickClock of the game, which the game advances once per step.
+                   If not given, the scheduler advances its own clock on every select.
+        """
+        self._probability = shooting_probability
+        self._cooldown_ticks = max(1, round(cooldown * GAME_FPS))
+        self._rng = rng if rng is not None else np.random.default_rng(seed)
+        self._owns_clock = clock is None
+        self._clock = TickClock() if clock is None else clock
+        self._last_shot = np.full(enemy_count, self._clock.tick - self._cooldown_ticks,
+                                  dtype=np.int64)
+
+    @property
+    def tick(self):
+        return self._clock.tick
+
+    @property
+    def cooldown_ticks(self):
+        return self._cooldown_ticks
+
+    def select(self, alive):
+        """
+        Pick the enemies that shoot on the current tick.
+        A scheduler with its own clock advances it by one tick first.
+
+        Args:
+            alive: Boolean array of the enemies that are still alive.
+
+        Returns:
+            list: Slots of the shooting enemies.
+        """
+        if self._owns_clock:
+            self._clock.advance()
+        tick = self._clock.tick
+        ready = alive & (tick - self._last_shot >= self._cooldown_ticks)
+        candidates = np.flatnonzero(ready)
+        count = self._rng.binomial(len(candidates), self._probability) if len(
+            candidates) else 0
+        if count == 0:
+            return []
+
+        shooters = self._rng.choice(candidates, size=count, replace=False)
+        self._last_shot[shooters] = tick
+        return shooters.tolist()
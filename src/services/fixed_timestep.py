@@ -0,0 +1,84 @@
+from config import GAME_FPS, MAX_FRAME_TIME, MAX_STEPS_PER_FRAME
+
+# rounding error allowed when the accumulated time is divided into steps
+EPSILON = 1e-9
+
+
+class FixedTimestep():
+    """
+    Accumulates the real time between frames and tells how many fixed
+    simulation steps to run for each rendered frame.
+
+    When rendering is slow, several steps are run before the next frame,
+    so the game keeps its speed and skips frames instead. The number of
+    steps per frame is limited, and the time that does not fit is dropped,
+    so a very slow frame can not make the game fall further and further behind.
+
+    After the steps, alpha tells how far the real time is between the
+    last two simulation states, which is used to interpolate the drawing.
+    """
+
+    def __init__(self, steps_per_second=GAME_FPS, max_steps=MAX_STEPS_PER_FRAME,
+                 max_frame_time=MAX_FRAME_TIME):
+        """
+        Args:
+            steps_per_second: Simulation steps per second.
+            max_steps: Maximum number of steps run for one frame.
+            max_frame_time: Longest frame time in seconds that is accumulated.
+        """
+        self._step = 1 / steps_per_second
+        self._max_steps = max_steps
+        self._max_frame_time = max_frame_time
+        self._accumulator = 0.0
+        self._dropped_steps = 0
+
+    @property
+    def step(self):
+        """
+        Returns:
+            float: Length of one simulation step in seconds.
+        """
+        return self._step
+
+    @property
+    def alpha(self):
+        """
+        Returns:
+            float: Position of the real time between the previous (0)
+            and the current (1) simulation state.
+        """
+        return min(1.0, self._accumulator / self._step)
+
+    @property
+    def dropped_steps(self):
+        """
+        Returns:
+            int: How many steps have been dropped because the game fell behind.
+        """
+        return self._dropped_steps
+
+    def advance(self, frame_time):
+        """
+        Add the real time of a frame and take out the whole steps.
+
+        Args:
+            frame_time: Seconds since the previous frame.
+
+        Returns:
+            int: Number of simulation steps to run now.
+        """
+        self._accumulator += min(frame_time, self._max_frame_time)
+        steps = int((self._accumulator + EPSILON) // self._step)
+        if steps > self._max_steps:
+            self._dropped_steps += steps - self._max_steps
+            steps = self._max_steps
+            self._accumulator = 0.0
+        else:
+            self._accumulator = max(0.0, self._accumulator - steps * self._step)
+        return steps
+
+    def reset(self):
+        """
+        Forget the accumulated time, e.g. after a level change.
+        """
+        self._accumulator = 0.0
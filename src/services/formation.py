@@ -0,0 +1,115 @@
+import numpy as np
+from config import LEFT_BOUNDARY, LOWER_BOUNDARY, RIGHT_BOUNDARY
+
+LEFT = -1
+RIGHT = 1
+
+
+class Formation():
+    """
+    Moves a whole enemy wave in one batched update.
+
+    The positions, sizes, speeds and directions of the enemies are kept
+    in NumPy arrays. Every enemy follows the same rules as EnemyService.move:
+    an enemy at the bottom stops there, an enemy that hits the left or
+    right wall drops down one row, turns around and speeds up, and other
+    enemies move one step in their direction.
+
+    An EnemyService that has joined the formation reads its position
+    from here, so its own move does not run every frame.
+    """
+
+    def __init__(self, enemy_services=(), speed_increase=1,
+                 left_boundary=LEFT_BOUNDARY, right_boundary=RIGHT_BOUNDARY,
+                 lower_boundary=LOWER_BOUNDARY):
+        """
+        Args:
+            enemy_services: The EnemyService objects of the wave. They leave
+                            their previous formation and join this one.
+            speed_increase: How much an enemy speeds up when it turns at a wall.
+            left_boundary, right_boundary, lower_boundary: The walls of the screen.
+        """
+        self._speed_increase = speed_increase
+        self._left_boundary = left_boundary
+        self._right_boundary = right_boundary
+        self._lower_boundary = lower_boundary
+
+        enemy_services = list(enemy_services)
+        for enemy in enemy_services:
+            enemy.leave_formation()
+        self.x = np.array([enemy.position[0] for enemy in enemy_services], dtype=np.int32)
+        self.y = np.array([enemy.position[1] for enemy in enemy_services], dtype=np.int32)
+        self.width = np.array([enemy.width for enemy in enemy_services], dtype=np.int32)
+        self.height = np.array([enemy.height for enemy in enemy_services], dtype=np.int32)
+        self.speed = np.array([enemy.speed for enemy in enemy_services], dtype=np.int32)
+        self.direction = np.array([RIGHT if enemy.direction == "right" else LEFT
+                                   for enemy in enemy_services], dtype=np.int8)
+        self.alive = np.ones(len(enemy_services), dtype=bool)
+        self._sync_values()
+
+        for slot, enemy in enumerate(enemy_services):
+            enemy.join_formation(self, slot)
+
+    def __len__(self):
+        """
+        Returns:
+            int: Number of enemies still in the formation.
+        """
+        return int(np.count_nonzero(self.alive))
+
+    def _sync_values(self):
+        """
+        Copy the positions to Python lists so that reading
+        one enemy does not go through NumPy.
+        """
+        self._x_values = self.x.tolist()
+        self._y_values = self.y.tolist()
+
+    def update(self):
+        """
+        Move every enemy of the wave one step.
+        """
+        alive = self.alive
+        x, y = self.x, self.y
+        width, height = self.width, self.height
+
+        at_bottom = alive & (y + height >= self._lower_boundary)
+        y[at_bottom] = self._lower_boundary - height[at_bottom]
+        moving = alive & ~at_bottom
+
+        left_wall = moving & (x <= self._left_boundary) & (self.direction == LEFT)
+        y[left_wall] += height[left_wall]
+        x[left_wall] = self._left_boundary
+        self.direction[left_wall] = RIGHT
+        moving &= ~left_wall
+
+        right_wall = moving & (x + width >= self._right_boundary) & (
+            self.direction == RIGHT)
+        x[right_wall] = self._right_boundary - width[right_wall]
+        y[right_wall] += height[right_wall]
+        self.direction[right_wall] = LEFT
+        moving &= ~right_wall
+
+        self.speed[left_wall | right_wall] += self._speed_increase
+        x[moving] += self.direction[moving] * self.speed[moving]
+
+        self._sync_values()
+
+    def remove(self, slot):
+        """
+        Stop moving a dead enemy.
+        """
+        self.alive[slot] = False
+
+    def get_position(self, slot):
+        """
+        Returns:
+            tuple: The (x, y) position of the enemy as Python ints.
+        """
+        return self._x_values[slot], self._y_values[slot]
+
+    def get_direction(self, slot):
+        return "right" if self.direction[slot] == RIGHT else "left"
+
+    def get_speed(self, slot):
+        return int(self.speed[slot])
@@ -1,17 +1,22 @@
-from app_enums import LevelAttributes
+from config import BULLET_POINTS_COEFFICIENT
 from level_config import (ENEMY_COOLDOWN, ENEMY_SHOOTING_PROBABILITY,
                           ENEMY_COLS, ENEMY_ROWS, ENEMY_SPEED, FINAL_LEVEL,
                           ENEMY_BULLET_SPEED, ENEMY_MAX_HITS, ENEMY_IMAGE,
                           ENEMY_BULLET_SPEED_2, ENEMY_MAX_HITS_2, ENEMY_IMAGE_2,
-                          ENEMY_BULLET_SPEED_3, ENEMY_MAX_HITS_3, ENEMY_IMAGE_3)
+                          ENEMY_BULLET_SPEED_3, ENEMY_MAX_HITS_3, ENEMY_IMAGE_3,
+                          LEVELS_PER_GROUP, ENEMY_SHOOTING_PROBABILITY_STEP,
+                          ENEMY_COLS_STEP, ENEMY_MAX_ROWS, ENDLESS_SPEED_STEP)
+from models.level_spec import LevelSpec
 
 
 class LevelService():
     """
     Handles the configuration and data for different game levels.
 
-    This service builds a dictionary of levels based on configuration constants.
-    This makes scaling and adjusting level difficulty easier.
+    Each level is compiled from the configuration constants into an
+    immutable LevelSpec the first time it is asked for, and the result
+    is kept for the next time. Levels after the final level are compiled
+    the same way, so an endless game can go on without a limit.
     """
 
     def __init__(self):
@@ -20,19 +25,22 @@ class LevelService():
         """
         self.levels = {}
         self.final_level = FINAL_LEVEL
-        self.initialize_levels()
 
     def get_level(self, level):
         """
         Get the configuration for a specific level.
 
         Args:
-            level: The level number.
+            level: The level number, starting from 1.
 
         Returns:
-            dict: The configuration dictionary for the requested level.
+            LevelSpec: The compiled settings of the level.
         """
-        return self.levels[level]
+        spec = self.levels.get(level)
+        if spec is None:
+            spec = self.compile_level(level)
+            self.levels[level] = spec
+        return spec
 
     def get_final_level(self):
         """
@@ -44,60 +52,54 @@ class LevelService():
         """
         return self.final_level
 
-    def initialize_levels(self):
-        """
-        Build a dictionary levels. Each level will be
-        a new dictionary. 
-        Example: levels[1] = {"enemy_cooldown":3, "enemy_cols":4 ...}
-        """
-        for level in range(1, FINAL_LEVEL + 1):
-            self.levels[level] = {}
-            self.create_common_level_attributes(level)
-            self.create_specific_level_attributes(level)
-            if not self.is_starting_level(level):
-                self.scale_from_previous_level(level)
-
-    def create_common_level_attributes(self, level):
+    def compile_level(self, level):
         """
-        Add shared common attributes to the given level.
+        Compile the settings of a level. The first level of a group
+        starts from the group attributes, the other levels are
+        slightly harder than the previous level.
 
         Args:
-            level: The level number.
-        """
-        self.levels[level][LevelAttributes.ENEMY_COOLDOWN] = ENEMY_COOLDOWN
-        self.levels[level][LevelAttributes.ENEMY_SHOOT_PROB] = ENEMY_SHOOTING_PROBABILITY
-        self.levels[level][LevelAttributes.ENEMY_COLS] = ENEMY_COLS
-        self.levels[level][LevelAttributes.ENEMY_ROWS] = ENEMY_ROWS
-        self.levels[level][LevelAttributes.ENEMY_SPEED] = ENEMY_SPEED
-
-    def create_specific_level_attributes(self, level):
-        """
-        Add level-specific attributes like enemy bullet speed and image.
-
-        Args:
-            level: The level number.
-        """
-        level_attributes = self.get_level_specific_attributes(level)
-        bullet_speed, enemy_max_hits, enemy_image = level_attributes
-        self.levels[level][LevelAttributes.ENEMY_BULLET_SPEED] = bullet_speed
-        self.levels[level][LevelAttributes.ENEMY_MAX_HITS] = enemy_max_hits
-        self.levels[level][LevelAttributes.ENEMY_IMAGE] = enemy_image
+            level: The level number, starting from 1.
 
-    def scale_from_previous_level(self, level):
+        Returns:
+            LevelSpec: The compiled settings of the level.
+        """
+        if level < 1:
+            raise ValueError(f"Level must be at least 1, got {level}")
+
+        if not self.is_starting_level(level):
+            return self.scale_from_previous_level(self.get_level(level - 1))
+
+        bullet_speed, enemy_max_hits, enemy_image = self.get_level_specific_attributes(
+            level)
+        points = int(''.join([char for char in enemy_image if char in "123"]))
+        return LevelSpec(level=level,
+                         cooldown=ENEMY_COOLDOWN,
+                         shooting_probability=ENEMY_SHOOTING_PROBABILITY,
+                         cols=ENEMY_COLS,
+                         rows=ENEMY_ROWS,
+                         speed=ENEMY_SPEED + self.get_endless_round(level) * ENDLESS_SPEED_STEP,
+                         bullet_speed=bullet_speed,
+                         max_hits=enemy_max_hits,
+                         image=enemy_image,
+                         points=points,
+                         bullet_points=points * BULLET_POINTS_COEFFICIENT)
+
+    def scale_from_previous_level(self, previous):
         """
         Slightly increase difficulty compared to the previous level.
 
         Args:
-            level: The current level number.
+            previous: LevelSpec of the previous level.
+
+        Returns:
+            LevelSpec: The settings of the next level.
         """
-        prev = level - 1
-        shoot_prob = LevelAttributes.ENEMY_SHOOT_PROB
-        enemy_cols = LevelAttributes.ENEMY_COLS
-        enemy_rows = LevelAttributes.ENEMY_ROWS
-        self.levels[level][shoot_prob] = self.levels[prev][shoot_prob] + 0.0001
-        self.levels[level][enemy_cols] = self.levels[prev][enemy_cols] + 1
-        self.levels[level][enemy_rows] = min(
-            4, self.levels[prev][enemy_rows] + 1)
+        return previous._replace(
+            level=previous.level + 1,
+            shooting_probability=previous.shooting_probability + ENEMY_SHOOTING_PROBABILITY_STEP,
+            cols=previous.cols + ENEMY_COLS_STEP,
+            rows=min(ENEMY_MAX_ROWS, previous.rows + 1))
 
     def get_level_specific_attributes(self, level):
         """
@@ -116,6 +118,19 @@ class LevelService():
 
         return (ENEMY_BULLET_SPEED_3, ENEMY_MAX_HITS_3, ENEMY_IMAGE_3)
 
+    def get_endless_round(self, level):
+        """
+        Args:
+            level: The level number.
+
+        Returns:
+            int: 0 for the levels up to the final level, then 1, 2, ...
+            for every group of levels played after it.
+        """
+        if level <= self.final_level:
+            return 0
+        return (level - self.final_level - 1) // LEVELS_PER_GROUP + 1
+
     def is_starting_level(self, level):
         """
         Check if the level is a starting point for a new level set.
@@ -128,4 +143,4 @@ class LevelService():
                 - True: If a starting level of level group.
                 - False: Not a starting level.
         """
-        return level in (1, 6, 11)
+        return (level - 1) % LEVELS_PER_GROUP == 0
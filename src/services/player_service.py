@@ -12,7 +12,8 @@ class PlayerService():
 
     def __init__(self, sprite_info: SpriteInfo,
                  cooldown=PLAYER_COOLDOWN,
-                 points: int = 0):
+                 points: int = 0,
+                 clock=None):
         """
         Initialize the player with sprite information and shooting cooldown.
 
@@ -20,9 +21,10 @@ class PlayerService():
             sprite_info (SpriteInfo): The player's position, size, speed, and health.
             cooldown (float): The cooldown time between player shots.
             points (int, optional): The initial points of the player. Defaults to 0.
+            clock: Gives the time for the shooting cooldown. Defaults to the wall clock.
         """
         self._sprite = BaseSpriteService(sprite_info)
-        self._shooter = ShootingService(cooldown=cooldown)
+        self._shooter = ShootingService(cooldown=cooldown, clock=clock)
         self.points = points
 
     @property
@@ -58,7 +60,8 @@ class PlayerService():
             point,
             size,
             speed=PLAYER_SPEED,
-            player_max_hits=PLAYER_MAX_HITS):
+            player_max_hits=PLAYER_MAX_HITS,
+            clock=None):
         """
         Creates EnemyService object. Simplifies the creation
         compared to the constructor.
@@ -70,6 +73,7 @@ class PlayerService():
             - player_max_hits: how many hits the enemy can take
             - enemy_cooldown: how long the enemy waits 
                             before a new shooting attempt
+            - clock: gives the time for the shooting cooldown
 
         Returns:
             EnemyService object
@@ -80,7 +84,8 @@ class PlayerService():
                 size,
                 speed,
                 player_max_hits),
-            cooldown=PLAYER_COOLDOWN)
+            cooldown=PLAYER_COOLDOWN,
+            clock=clock)
 
     def add_hit(self):
         return self._sprite.add_hit()
@@ -90,6 +95,12 @@ class PlayerService():
                                        self._sprite.size,
                                        direction="up")
 
+    def try_shoot_into(self, bullet_pool):
+        return self._shooter.try_shoot_into(bullet_pool,
+                                            self._sprite.position,
+                                            self._sprite.size,
+                                            direction="up")
+
     def can_shoot(self):
         return self._shooter.can_shoot()
 
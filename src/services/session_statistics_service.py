@@ -0,0 +1,91 @@
+from collections import Counter
+from services.user_statistics_service import UserStatisticsService
+
+
+class SessionStatisticsService:
+    """
+    Keeps an in-memory snapshot of the player's statistics for one game session.
+
+    The statistics are fetched from the database once when the session is
+    loaded. The game reads the snapshot on every frame, so the game loop
+    does not touch the database. The snapshot is refreshed only after the
+    session results have been saved.
+
+    The gameplay events of the session (kills, hits) are counted in memory.
+    """
+
+    def __init__(self, user_statistics_service: UserStatisticsService):
+        """
+        Args:
+            user_statistics_service: Service for reading and saving user statistics.
+        """
+        self._user_statistics_service = user_statistics_service
+        self._user_id = None
+        self._user_statistics = None
+        self._event_counts = Counter()
+
+    @property
+    def user_id(self):
+        """
+        Returns:
+            int: The user whose statistics are kept, or None if not loaded.
+        """
+        return self._user_id
+
+    @property
+    def user_statistics(self):
+        """
+        Returns:
+            UserStatistics or None: The snapshot of the user's statistics.
+        """
+        return self._user_statistics
+
+    @property
+    def event_counts(self):
+        """
+        Returns:
+            Counter: How many events of each GameEventType the session has had.
+        """
+        return self._event_counts
+
+    def record_events(self, events):
+        """
+        Count the gameplay events of a tick. Used as an event bus consumer.
+
+        Args:
+            events: List of GameEvent.
+        """
+        self._event_counts.update(event.type for event in events)
+
+    def load(self, user_id):
+        """
+        Fetch the user's statistics from the database into the snapshot.
+
+        Args:
+            user_id: The ID of the user.
+
+        Returns:
+            UserStatistics or None: The loaded statistics.
+        """
+        self._user_id = user_id
+        self._user_statistics, _ = self._user_statistics_service.get_user_statistics(
+            user_id)
+        return self._user_statistics
+
+    def save(self, points, level):
+        """
+        Save the session results and refresh the snapshot with the saved statistics.
+
+        Args:
+            points: The points of the session.
+            level: The level reached in the session.
+
+        Returns:
+            tuple: (UserStatistics or None, str or None) as returned by
+            UserStatisticsService.upsert_user_statistics.
+        """
+        user_statistics, message = self._user_statistics_service.upsert_user_statistics(
+            self._user_id, points, level)
+        if user_statistics:
+            self._user_statistics = user_statistics
+        return user_statistics, message
@@ -1,5 +1,5 @@
-import time
 from services.bullet_service import BulletService
+from services.clock import WALL_CLOCK
 from models.point import Point
 from models.size import Size
 from config import (
@@ -18,7 +18,7 @@ class ShootingService():
     """
 
     def __init__(self, cooldown=PLAYER_COOLDOWN,
-                 left_boundary=LEFT_BOUNDARY, right_boundary=RIGHT_BOUNDARY):
+                 left_boundary=LEFT_BOUNDARY, right_boundary=RIGHT_BOUNDARY, clock=None):
         """
         Initialize the shooting sprite with sprite info and shooting behavior.
 
@@ -27,11 +27,13 @@ class ShootingService():
             cooldown (float): Time in seconds between shots.
             left_boundary (int): Minimum x-coordinate allowed.
             right_boundary (int): Maximum x-coordinate allowed.
+            clock: Gives the time for the cooldown. Defaults to the wall clock.
         """
         self.left_boundary = left_boundary
         self.right_boundary = right_boundary
         self.cooldown = cooldown
-        self.last_shot = 0
+        self.clock = clock if clock else WALL_CLOCK
+        self.last_shot = float("-inf")
 
     def can_shoot(self):
         """
@@ -42,7 +44,7 @@ class ShootingService():
         Returns:
             bool: True if the sprite can shoot, False otherwise.
         """
-        current_time = time.time()
+        current_time = self.clock.now()
         if current_time - self.last_shot >= self.cooldown:
             self.last_shot = current_time
             return True
@@ -62,6 +64,38 @@ class ShootingService():
             return self.shoot(sprite_position, sprite_size, direction)
         return None
 
+    def try_shoot_into(self, bullet_pool, sprite_position, sprite_size, direction="up"):
+        """
+        Attempt to shoot a bullet into the bullet pool if cooldown is over.
+
+        Args:
+            bullet_pool: The BulletPool the bullet is added to.
+            direction: The shooting direction ("up" or "down"). Defaults to "up".
+
+        Returns:
+            tuple or None: (slot, generation) handle of the bullet
+            if shooting was possible, otherwise None.
+        """
+        if self.can_shoot():
+            return self.shoot_into(bullet_pool, sprite_position, sprite_size, direction)
+        return None
+
+    def shoot_into(self, bullet_pool, sprite_position, sprite_size, direction="up"):
+        """
+        Add a new bullet to the bullet pool without checking the cooldown.
+
+        Args:
+            bullet_pool: The BulletPool the bullet is added to.
+            direction: The shooting direction ("up" or "down"). Defaults to "up".
+
+        Returns:
+            tuple: (slot, generation) handle of the bullet.
+        """
+        position, size, speed = self.get_bullet_spawn(sprite_position,
+                                                      sprite_size,
+                                                      direction)
+        return bullet_pool.spawn(position, size, speed, direction)
+
     def shoot(self,
               sprite_position,
               sprite_size,
@@ -79,6 +113,26 @@ class ShootingService():
         Returns:
             BulletService: The created bullet object.
         """
+        position, size, speed = self.get_bullet_spawn(sprite_position,
+                                                      sprite_size,
+                                                      direction,
+                                                      bullet_size)
+        bullet_sprite_info = create_sprite_info(position, size, speed, 1)
+
+        return BulletService(sprite_info=bullet_sprite_info, direction=direction)
+
+    def get_bullet_spawn(self,
+                         sprite_position,
+                         sprite_size,
+                         direction="up",
+                         bullet_size=Size(BULLET_WIDTH, BULLET_HEIGHT)
+                         ):
+        """
+        Calculate where a new bullet starts and how fast it moves.
+
+        Returns:
+            tuple: (Point, Size, speed) of the new bullet.
+        """
         sprite_x, sprite_y = sprite_position
 
         bullet_x = sprite_x + sprite_size.width // 2 - bullet_size.width // 2
@@ -90,14 +144,9 @@ class ShootingService():
         )
 
         bullet_speed = PLAYER_BULLET_SPEED if direction == "up" else ENEMY_BULLET_SPEED
-        bullet_sprite_info = create_sprite_info(
-            Point(bullet_x, bullet_y),
-            Size(bullet_size.width, bullet_size.height),
-            bullet_speed,
-            1
-        )
-
-        return BulletService(sprite_info=bullet_sprite_info, direction=direction)
+        return (Point(bullet_x, bullet_y),
+                Size(bullet_size.width, bullet_size.height),
+                bullet_speed)
 
     def _get_bullet_y(self, direction, sprite_y, sprite_height, bullet_height):
         """
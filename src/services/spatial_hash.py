@@ -0,0 +1,76 @@
+from config import SPATIAL_HASH_CELL_SIZE
+
+
+class SpatialHash():
+    """
+    A uniform grid that finds the items near a rectangle without
+    going through all items.
+
+    Every item is stored in each grid cell its rectangle touches.
+    A query only looks at the items in the cells the query rectangle
+    touches, so the cost depends on how crowded the area is, not on the
+    total number of items. The caller still checks the exact overlap.
+    """
+
+    def __init__(self, cell_size=SPATIAL_HASH_CELL_SIZE):
+        """
+        Args:
+            cell_size: Width and height of a grid cell in pixels.
+        """
+        self._cell_size = cell_size
+        self._cells = {}
+
+    @property
+    def cell_size(self):
+        return self._cell_size
+
+    def __len__(self):
+        """
+        Returns:
+            int: Number of grid cells in use.
+        """
+        return len(self._cells)
+
+    def _cell_range(self, x, y, width, height):
+        size = self._cell_size
+        return (x // size, (x + max(width, 1) - 1) // size,
+                y // size, (y + max(height, 1) - 1) // size)
+
+    def insert(self, item, x, y, width, height):
+        """
+        Add an item with its rectangle.
+        """
+        cells = self._cells
+        left, right, top, bottom = self._cell_range(x, y, width, height)
+        for cell_x in range(left, right + 1):
+            for cell_y in range(top, bottom + 1):
+                cell = cells.get((cell_x, cell_y))
+                if cell is None:
+                    cells[(cell_x, cell_y)] = [item]
+                else:
+                    cell.append(item)
+
+    def query(self, x, y, width, height):
+        """
+        Find the items whose cells the rectangle touches.
+
+        Returns:
+            list: The items near the rectangle, each once.
+        """
+        cells = self._cells
+        left, right, top, bottom = self._cell_range(x, y, width, height)
+        if left == right and top == bottom:
+            return cells.get((left, top), [])
+
+        found = {}
+        for cell_x in range(left, right + 1):
+            for cell_y in range(top, bottom + 1):
+                for item in cells.get((cell_x, cell_y), ()):
+                    found[id(item)] = item
+        return list(found.values())
+
+    def clear(self):
+        """
+        Remove all items.
+        """
+        self._cells = {}
@@ -0,0 +1,31 @@
+import unittest
+import pygame
+from config import LOWER_BOUNDARY, RIGHT_BOUNDARY
+from models.size import Size
+from ui.game_views.game.animation import AnimationLibrary, HIT_FRAMES
+from ui.resources.surface_cache import SurfaceCache
+
+
+class TestAnimationLibrary(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((RIGHT_BOUNDARY, LOWER_BOUNDARY))
+        self.library = AnimationLibrary(SurfaceCache(), max_size=2)
+
+    def test_frames_are_scaled_to_size(self):
+        frames = self.library.get_frames(HIT_FRAMES, Size(30, 20))
+        self.assertEqual(len(frames), 4)
+        for frame in frames:
+            self.assertEqual(frame.get_size(), (30, 20))
+
+    def test_animations_of_same_size_share_frames(self):
+        first = self.library.create(HIT_FRAMES, (10, 10), Size(40, 40))
+        second = self.library.create(HIT_FRAMES, (50, 50), Size(40, 40))
+        self.assertIs(first.images, second.images)
+        self.assertEqual(first.index, 0)
+
+    def test_library_size_is_capped(self):
+        self.library.get_frames(HIT_FRAMES, Size(10, 10))
+        self.library.get_frames(HIT_FRAMES, Size(20, 20))
+        self.library.get_frames(HIT_FRAMES, Size(30, 30))
+        self.assertEqual(len(self.library), 2)
@@ -0,0 +1,48 @@
+import unittest
+from utils.atlas_packing import pack_sprites
+
+
+def overlaps(a, b):
+    _, ax, ay, aw, ah = a
+    _, bx, by, bw, bh = b
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+class TestAtlasPacking(unittest.TestCase):
+    def test_sprites_do_not_overlap(self):
+        sizes = {f"sprite{i}.png": (10 + i, 20 - i) for i in range(10)}
+        placements, _ = pack_sprites(sizes, max_size=50)
+        names = list(placements)
+        for i, first in enumerate(names):
+            for second in names[i + 1:]:
+                if placements[first][0] == placements[second][0]:
+                    self.assertFalse(overlaps(placements[first],
+                                              placements[second]))
+
+    def test_sprites_fit_on_their_pages(self):
+        sizes = {f"sprite{i}.png": (30, 30) for i in range(10)}
+        placements, page_sizes = pack_sprites(sizes, max_size=64)
+        for page, x, y, width, height in placements.values():
+            page_width, page_height = page_sizes[page]
+            self.assertLessEqual(x + width, page_width)
+            self.assertLessEqual(y + height, page_height)
+            self.assertLessEqual(page_width, 64)
+            self.assertLessEqual(page_height, 64)
+
+    def test_full_page_starts_a_new_page(self):
+        sizes = {f"sprite{i}.png": (30, 30) for i in range(5)}
+        _, page_sizes = pack_sprites(sizes, max_size=64, padding=0)
+        self.assertEqual(len(page_sizes), 2)
+
+    def test_all_sprites_on_one_page_if_they_fit(self):
+        sizes = {"a.png": (10, 10), "b.png": (20, 5)}
+        placements, page_sizes = pack_sprites(sizes, padding=0)
+        self.assertEqual(page_sizes, [(30, 10)])
+        self.assertEqual(placements["a.png"], (0, 0, 0, 10, 10))
+
+    def test_too_large_sprite_raises_error(self):
+        with self.assertRaises(ValueError):
+            pack_sprites({"huge.png": (100, 10)}, max_size=50)
+
+    def test_no_sprites_gives_no_pages(self):
+        self.assertEqual(pack_sprites({}), ({}, []))
@@ -0,0 +1,75 @@
+import unittest
+from services.bullet_pool import BulletPool
+from services.bullet_service import BulletService
+from models.point import Point
+from models.size import Size
+from config import UPPER_BOUNDARY, LOWER_BOUNDARY
+from utils.service_helpers import create_sprite_info
+
+
+class TestBulletPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = BulletPool(capacity=4)
+        self.size = Size(10, 10)
+
+    def test_spawned_bullet_moves_up(self):
+        slot, _ = self.pool.spawn(Point(100, 500), self.size, 5, "up")
+        self.pool.update()
+        self.assertEqual(self.pool.get_y(slot), 495)
+        self.assertTrue(self.pool.is_alive(slot))
+
+    def test_motion_of_last_update_is_stored(self):
+        slot, _ = self.pool.spawn(Point(100, 500), self.size, 5, "up")
+        self.assertEqual(self.pool.get_dy(slot), 0)
+        self.pool.update()
+        self.assertEqual(self.pool.get_dy(slot), -5)
+
+    def test_spawned_bullet_moves_down(self):
+        slot, _ = self.pool.spawn(Point(100, 0), self.size, 5, "down")
+        self.pool.update()
+        self.assertEqual(self.pool.get_y(slot), 5)
+
+    def test_bullet_leaving_screen_is_culled(self):
+        up, _ = self.pool.spawn(Point(100, UPPER_BOUNDARY + 2), self.size, 5, "up")
+        down, _ = self.pool.spawn(Point(100, LOWER_BOUNDARY - 2), self.size, 5, "down")
+        gone = self.pool.update()
+        self.assertEqual(gone, 2)
+        self.assertFalse(self.pool.is_alive(up))
+        self.assertFalse(self.pool.is_alive(down))
+
+    def test_pool_matches_bullet_service(self):
+        for direction, start_y in (("up", 40), ("down", 560)):
+            slot, _ = self.pool.spawn(Point(100, start_y), self.size, 7, direction)
+            bullet = BulletService(create_sprite_info(Point(100, start_y), self.size, 7, 1),
+                                   direction=direction)
+            while bullet.is_moving():
+                bullet.move()
+                self.pool.update()
+                self.assertEqual(self.pool.get_y(slot), bullet.position[1])
+            self.assertFalse(self.pool.is_alive(slot))
+
+    def test_released_slot_is_reused(self):
+        handle = self.pool.spawn(Point(0, 100), self.size, 5)
+        self.pool.release(*handle)
+        new_slot, _ = self.pool.spawn(Point(0, 100), self.size, 5)
+        self.assertEqual(new_slot, handle[0])
+        self.assertEqual(len(self.pool), 1)
+
+    def test_stale_handle_does_not_release_new_bullet(self):
+        handle = self.pool.spawn(Point(0, 100), self.size, 5)
+        self.pool.release(*handle)
+        new_slot, _ = self.pool.spawn(Point(0, 100), self.size, 5)
+        self.assertFalse(self.pool.release(*handle))
+        self.assertTrue(self.pool.is_alive(new_slot))
+
+    def test_pool_grows_when_full(self):
+        slots = [self.pool.spawn(Point(0, 100 + i), self.size, 5)[0] for i in range(6)]
+        self.assertEqual(len(set(slots)), 6)
+        self.assertEqual(self.pool.capacity, 8)
+        self.assertEqual(self.pool.get_position(slots[0]), (0, 100))
+
+    def test_clear_releases_all_bullets(self):
+        handle = self.pool.spawn(Point(0, 100), self.size, 5)
+        self.pool.clear()
+        self.assertEqual(len(self.pool), 0)
+        self.assertFalse(self.pool.release(*handle))
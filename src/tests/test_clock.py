@@ -0,0 +1,22 @@
+import unittest
+from services.clock import FakeClock, TickClock, WallClock
+
+
+class TestClock(unittest.TestCase):
+    def test_tick_clock_counts_game_time(self):
+        clock = TickClock(steps_per_second=60)
+        self.assertEqual(clock.now(), 0)
+        clock.advance(30)
+        self.assertEqual(clock.tick, 30)
+        self.assertAlmostEqual(clock.now(), 0.5)
+
+    def test_fake_clock_moves_only_when_told(self):
+        clock = FakeClock(start=2)
+        self.assertEqual(clock.now(), 2)
+        clock.advance(1.5)
+        self.assertEqual(clock.now(), 3.5)
+
+    def test_wall_clock_does_not_go_backwards(self):
+        clock = WallClock()
+        first = clock.now()
+        self.assertGreaterEqual(clock.now(), first)
@@ -0,0 +1,238 @@
+import unittest
+import numpy as np
+import pygame
+from app_enums import CollisionMode
+from benchmarks.collision_benchmark import check_all, create_scene, pair_set
+from models.point import Point
+from models.size import Size
+from services.aabb import overlap_pairs, swept_overlap, swept_overlap_pairs
+from services.bullet_pool import BulletPool
+from services.spatial_hash import SpatialHash
+from ui.game_views.game.collisions import (BroadphaseCollisionDetector,
+                                           NumpyCollisionDetector,
+                                           PygameCollisionDetector,
+                                           SpatialHashCollisionDetector,
+                                           SweepAndPruneCollisionDetector,
+                                           create_collision_detector)
+
+
+def create_sprite(x, y, width=10, height=10, *groups):
+    sprite = pygame.sprite.Sprite(*groups)
+    sprite.rect = pygame.Rect(x, y, width, height)
+    return sprite
+
+
+def create_ball(x, y, size, *groups):
+    sprite = create_sprite(x, y, size, size, *groups)
+    sprite.image = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(sprite.image, (255, 255, 255), (size // 2, size // 2), size // 2)
+    sprite.mask = pygame.mask.from_surface(sprite.image)
+    return sprite
+
+
+def create_random_boxes(rng, count):
+    return [rng.integers(0, 200, count), rng.integers(0, 200, count),
+            rng.integers(0, 40, count), rng.integers(0, 40, count)]
+
+
+class TestSpatialHash(unittest.TestCase):
+    def setUp(self):
+        self.grid = SpatialHash(cell_size=50)
+
+    def test_query_finds_items_in_touched_cells(self):
+        self.grid.insert("near", 10, 10, 10, 10)
+        self.grid.insert("far", 300, 300, 10, 10)
+        self.assertEqual(self.grid.query(0, 0, 20, 20), ["near"])
+
+    def test_item_over_many_cells_is_returned_once(self):
+        self.grid.insert("wide", 0, 0, 200, 10)
+        self.assertEqual(len(self.grid), 4)
+        self.assertEqual(self.grid.query(0, 0, 200, 10), ["wide"])
+
+
+class TestOverlapPairs(unittest.TestCase):
+    def test_pairs_match_colliderect(self):
+        rng = np.random.default_rng(5)
+        first = [rng.integers(0, 200, 30), rng.integers(0, 200, 30),
+                 rng.integers(0, 40, 30), rng.integers(0, 40, 30)]
+        second = [rng.integers(0, 200, 50), rng.integers(0, 200, 50),
+                  rng.integers(0, 40, 50), rng.integers(0, 40, 50)]
+        expected = [(i, j) for i in range(30) for j in range(50)
+                    if pygame.Rect([int(values[i]) for values in first]).colliderect(
+                        pygame.Rect([int(values[j]) for values in second]))]
+        for chunk_size in (1, 64, 1 << 20):
+            first_indices, second_indices = overlap_pairs(first, second, chunk_size)
+            self.assertEqual(list(zip(first_indices.tolist(), second_indices.tolist())),
+                             expected)
+
+    def test_touching_edges_and_empty_rects_do_not_overlap(self):
+        first_indices, _ = overlap_pairs(([0, 0], [0, 0], [10, 0], [10, 10]),
+                                         ([10, 5], [0, 5], [10, 5], [10, 5]))
+        self.assertEqual(first_indices.tolist(), [0])
+
+    def test_swept_pairs_match_one_pair_test(self):
+        rng = np.random.default_rng(7)
+        first, second = create_random_boxes(rng, 30), create_random_boxes(rng, 50)
+        first_motion = [rng.integers(-60, 60, 30), rng.integers(-60, 60, 30)]
+        second_motion = [rng.integers(-60, 60, 50), np.zeros(50, dtype=int)]
+        expected = [(i, j) for i in range(30) for j in range(50)
+                    if swept_overlap([int(values[i]) for values in first],
+                                     [int(values[i]) for values in first_motion],
+                                     [int(values[j]) for values in second],
+                                     [int(values[j]) for values in second_motion])]
+        first_indices, second_indices = swept_overlap_pairs(
+            first, first_motion, second, second_motion, chunk_size=100)
+        self.assertEqual(list(zip(first_indices.tolist(), second_indices.tolist())),
+                         expected)
+
+    def test_swept_pairs_without_motion_match_overlap_pairs(self):
+        rng = np.random.default_rng(8)
+        first, second = create_random_boxes(rng, 40), create_random_boxes(rng, 40)
+        still = [np.zeros(40, dtype=int)] * 2
+        for expected, found in zip(overlap_pairs(first, second),
+                                   swept_overlap_pairs(first, still, second, still)):
+            self.assertEqual(found.tolist(), expected.tolist())
+
+    def test_fast_bullet_does_not_pass_through_target(self):
+        target = ([100], [100], [40], [10])
+        bullet = ([110], [60], [10], [20])
+        self.assertEqual(len(overlap_pairs(target, bullet)[0]), 0)
+        self.assertEqual(len(swept_overlap_pairs(target, ([0], [0]), bullet, ([0], [-80]))[0]), 1)
+        self.assertFalse(swept_overlap((100, 100, 40, 10), (0, 0), (110, 60, 10, 20), (0, -15)))
+        self.assertTrue(swept_overlap((100, 100, 40, 10), (0, 0), (110, 60, 10, 20), (0, -80)))
+
+    def test_bullet_pool_arrays_plug_in(self):
+        pool = BulletPool(capacity=4)
+        pool.spawn(Point(15, 15), Size(10, 20), 5)
+        pool.spawn(Point(500, 15), Size(10, 20), 5)
+        enemies = ([0, 480], [0, 0], [40, 40], [40, 40])
+        _, bullets = overlap_pairs(enemies, (pool.x, pool.y, pool.width, pool.height))
+        self.assertTrue(pool.alive[bullets].all())
+        self.assertEqual(sorted(bullets.tolist()), [0, 1])
+
+
+class TestCollisionDetectors(unittest.TestCase):
+    def test_broadphase_finds_same_collisions_as_pygame(self):
+        for enemies, bullets in ((8, 20), (100, 300), (300, 1000)):
+            scene = create_scene(enemies, bullets, seed=enemies)
+            expected = check_all(PygameCollisionDetector(), scene)
+            self.assertEqual(check_all(SpatialHashCollisionDetector(), scene), expected)
+            self.assertEqual(check_all(SweepAndPruneCollisionDetector(), scene), expected)
+            self.assertEqual(check_all(NumpyCollisionDetector(), scene), expected)
+
+    def test_sweep_keeps_up_with_moving_added_and_removed_sprites(self):
+        scene = create_scene(50, 200, seed=3)
+        _, enemies, player_bullets, enemy_bullets = scene
+        sweep = SweepAndPruneCollisionDetector()
+        for tick in range(30):
+            for enemy in enemies:
+                enemy.rect.x = (enemy.rect.x + 7) % 760
+            for bullet in player_bullets:
+                bullet.rect.y -= 5
+            for bullet in enemy_bullets.sprites()[:3]:
+                bullet.kill()
+            create_sprite(tick * 20, 300, 10, 20, enemy_bullets)
+            self.assertEqual(check_all(sweep, scene),
+                             check_all(PygameCollisionDetector(), scene))
+
+    def test_removed_sprites_do_not_collide_after_prepare(self):
+        enemies = pygame.sprite.Group()
+        bullets = pygame.sprite.Group()
+        enemy = create_sprite(0, 0, 40, 40, enemies)
+        bullet = create_sprite(10, 10, 10, 20, bullets)
+        detector = SpatialHashCollisionDetector()
+        detector.prepare((enemies, bullets))
+        self.assertEqual(detector.groupcollide(enemies, bullets, False, True),
+                         {enemy: [bullet]})
+        self.assertFalse(bullet.alive())
+        self.assertEqual(detector.spritecollide(enemy, bullets, False), [])
+
+    def test_detectors_find_bullet_that_moved_through_enemy(self):
+        enemies = pygame.sprite.Group()
+        bullets = pygame.sprite.Group()
+        enemy = create_sprite(100, 100, 40, 40, enemies)
+        bullet = create_sprite(110, 40, 10, 20, bullets)
+        bullet.motion = (0, -90)
+        for mode in CollisionMode:
+            detector = create_collision_detector(mode)
+            detector.prepare((enemies, bullets))
+            self.assertEqual(pair_set(detector.collide_pairs(enemies, bullets)),
+                             {(enemy, bullet)}, mode)
+            self.assertEqual(detector.spritecollide(enemy, bullets, False), [bullet], mode)
+
+    def test_pixel_precise_detectors_skip_transparent_corners(self):
+        enemies = pygame.sprite.Group()
+        bullets = pygame.sprite.Group()
+        enemy = create_ball(100, 100, 40, enemies)
+        corner = create_ball(132, 132, 20, bullets)
+        for mode in CollisionMode:
+            detector = create_collision_detector(mode)
+            detector.prepare((enemies, bullets))
+            self.assertEqual(len(detector.collide_pairs(enemies, bullets).first_indices), 1)
+            detector = create_collision_detector(mode, pixel_precise=True)
+            detector.prepare((enemies, bullets))
+            self.assertEqual(len(detector.collide_pairs(enemies, bullets).first_indices), 0)
+            self.assertEqual(detector.spritecollide(enemy, bullets, False), [], mode)
+
+    def test_pixel_precise_detectors_follow_the_path(self):
+        enemies = pygame.sprite.Group()
+        bullets = pygame.sprite.Group()
+        enemy = create_ball(100, 100, 40, enemies)
+        bullet = create_ball(118, 30, 4, bullets)
+        bullet.motion = (0, -100)
+        for mode in CollisionMode:
+            detector = create_collision_detector(mode, pixel_precise=True)
+            detector.prepare((enemies, bullets))
+            self.assertEqual(detector.spritecollide(enemy, bullets, False), [bullet], mode)
+
+    def test_numpy_pairs_skip_sprites_removed_after_prepare(self):
+        enemies = pygame.sprite.Group()
+        bullets = pygame.sprite.Group()
+        enemy = create_sprite(0, 0, 40, 40, enemies)
+        first = create_sprite(10, 10, 10, 20, bullets)
+        second = create_sprite(20, 10, 10, 20, bullets)
+        detector = NumpyCollisionDetector()
+        detector.prepare((enemies, bullets))
+        first.kill()
+        self.assertEqual(pair_set(detector.collide_pairs(enemies, bullets)),
+                         {(enemy, second)})
+        self.assertEqual(detector.spritecollide(enemy, bullets, True), [second])
+        self.assertEqual(len(bullets), 0)
+
+    def test_groupcollide_kills_each_sprite_at_its_first_hit(self):
+        for detector in (PygameCollisionDetector(), SpatialHashCollisionDetector(),
+                         SweepAndPruneCollisionDetector(), NumpyCollisionDetector()):
+            with self.subTest(detector=type(detector).__name__):
+                enemies = pygame.sprite.Group()
+                bullets = pygame.sprite.Group()
+                first = create_sprite(100, 100, 40, 40, enemies)
+                second = create_sprite(110, 100, 40, 40, enemies)
+                bullet = create_sprite(115, 110, 10, 20, bullets)
+                detector.prepare((enemies, bullets))
+                self.assertEqual(detector.groupcollide(enemies, bullets, False, True),
+                                 {first: [bullet]})
+                self.assertIn(second, enemies)
+
+    def test_spritecollide_kills_the_hit_sprites(self):
+        group = pygame.sprite.Group()
+        create_sprite(5, 5, 10, 10, group)
+        player = create_sprite(0, 0, 20, 20)
+        detector = SpatialHashCollisionDetector()
+        detector.prepare((group,))
+        self.assertEqual(len(detector.spritecollide(player, group, True)), 1)
+        self.assertEqual(len(group), 0)
+
+    def test_broadphase_without_structure_tests_every_sprite(self):
+        scene = create_scene(50, 200, seed=5)
+        self.assertEqual(check_all(BroadphaseCollisionDetector(), scene),
+                         check_all(PygameCollisionDetector(), scene))
+
+    def test_mode_selects_detector(self):
+        self.assertIsInstance(create_collision_detector(CollisionMode.SPATIAL_HASH),
+                              SpatialHashCollisionDetector)
+        self.assertIsInstance(create_collision_detector(CollisionMode.SWEEP_AND_PRUNE),
+                              SweepAndPruneCollisionDetector)
+        self.assertIsInstance(create_collision_detector(CollisionMode.NUMPY),
+                              NumpyCollisionDetector)
+        self.assertIsInstance(create_collision_detector(CollisionMode.PYGAME),
+                              PygameCollisionDetector)
@@ -0,0 +1,24 @@
+import unittest
+import pygame
+from config import LOWER_BOUNDARY, RIGHT_BOUNDARY
+from benchmarks.draw_benchmark import percentile, run_benchmark
+
+
+class TestDrawBenchmark(unittest.TestCase):
+    def test_percentile_interpolates_between_ranks(self):
+        values = [4, 1, 3, 2]
+        self.assertEqual(percentile(values, 0), 1)
+        self.assertEqual(percentile(values, 50), 2.5)
+        self.assertEqual(percentile(values, 100), 4)
+
+    def test_report_has_a_result_per_renderer_and_population(self):
+        pygame.init()
+        pygame.display.set_mode((RIGHT_BOUNDARY, LOWER_BOUNDARY))
+        report = run_benchmark(populations=[1, 5], frames=3, warmup=1,
+                               render_modes=["full", "dirty"])
+
+        results = report["results"]
+        self.assertEqual([(r["renderer"], r["population"]) for r in results],
+                         [("full", 1), ("full", 5), ("dirty", 1), ("dirty", 5)])
+        self.assertEqual(results[1]["sprites"], 15)
+        self.assertLessEqual(results[0]["p50_ms"], results[0]["p99_ms"])
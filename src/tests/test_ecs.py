@@ -0,0 +1,33 @@
+import unittest
+from config import UPPER_BOUNDARY
+from models.point import Point
+from models.size import Size
+from services.ecs_systems import MovementSystem
+from services.ecs_world import World
+
+
+class TestWorld(unittest.TestCase):
+    def setUp(self):
+        self.world = World(bullet_capacity=2)
+        self.size = Size(10, 10)
+
+    def test_world_counts_its_bullets(self):
+        for i in range(3):
+            self.world.bullets.spawn(Point(0, 100 + i), self.size, 5)
+        self.assertEqual(len(self.world), 3)
+
+    def test_clear_removes_all_entities(self):
+        handle = self.world.bullets.spawn(Point(0, 100), self.size, 5)
+        self.world.clear()
+        self.assertEqual(len(self.world), 0)
+        self.assertFalse(self.world.bullets.release(*handle))
+
+
+class TestMovementSystem(unittest.TestCase):
+    def test_bullets_of_world_are_moved_and_culled(self):
+        world = World()
+        moving, _ = world.bullets.spawn(Point(100, 500), Size(10, 10), 5, "up")
+        gone, _ = world.bullets.spawn(Point(100, UPPER_BOUNDARY + 2), Size(10, 10), 5, "up")
+        self.assertEqual(MovementSystem().move_bullets(world), 1)
+        self.assertEqual(world.bullets.get_y(moving), 495)
+        self.assertFalse(world.bullets.is_alive(gone))
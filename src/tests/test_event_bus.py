@@ -0,0 +1,39 @@
+import unittest
+from app_enums import GameEventType
+from models.size import Size
+from services.event_bus import EventBus
+
+
+class TestEventBus(unittest.TestCase):
+    def setUp(self):
+        self.bus = EventBus()
+        self.batches = []
+        self.bus.subscribe(self.batches.append)
+
+    def test_events_are_dispatched_in_one_batch(self):
+        self.bus.emit(GameEventType.ENEMY_KILLED, (10, 10), Size(40, 40))
+        self.bus.emit(GameEventType.PLAYER_HIT, (20, 20), Size(40, 40))
+        self.assertEqual(len(self.bus), 2)
+        self.assertEqual(self.bus.dispatch(), 2)
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual([event.type for event in self.batches[0]],
+                         [GameEventType.ENEMY_KILLED, GameEventType.PLAYER_HIT])
+        self.assertEqual(len(self.bus), 0)
+
+    def test_consumers_are_not_called_without_events(self):
+        self.assertEqual(self.bus.dispatch(), 0)
+        self.assertEqual(self.batches, [])
+
+    def test_consumers_are_called_in_subscription_order(self):
+        calls = []
+        bus = EventBus()
+        bus.subscribe(lambda events: calls.append("first"))
+        bus.subscribe(lambda events: calls.append("second"))
+        bus.emit(GameEventType.BULLET_HIT, (0, 0), Size(10, 20))
+        bus.dispatch()
+        self.assertEqual(calls, ["first", "second"])
+
+    def test_clear_drops_pending_events(self):
+        self.bus.emit(GameEventType.ENEMY_HIT, (0, 0), Size(40, 40))
+        self.bus.clear()
+        self.assertEqual(self.bus.dispatch(), 0)
@@ -0,0 +1,55 @@
+import unittest
+import numpy as np
+from services.clock import TickClock
+from services.fire_scheduler import FireScheduler
+
+
+class TestFireScheduler(unittest.TestCase):
+    def test_same_seed_gives_same_shooters(self):
+        alive = np.ones(50, dtype=bool)
+        first = FireScheduler(50, 0.05, cooldown=0.1, seed=7)
+        second = FireScheduler(50, 0.05, cooldown=0.1, seed=7)
+        for _ in range(300):
+            self.assertEqual(first.select(alive), second.select(alive))
+
+    def test_dead_enemies_do_not_shoot(self):
+        alive = np.zeros(10, dtype=bool)
+        alive[3] = True
+        scheduler = FireScheduler(10, 1.0, cooldown=0.1, seed=1)
+        self.assertEqual(scheduler.select(alive), [3])
+
+    def test_enemy_waits_for_cooldown_ticks(self):
+        alive = np.ones(1, dtype=bool)
+        scheduler = FireScheduler(1, 1.0, cooldown=0.1, seed=1)
+        ticks = [scheduler.tick for _ in range(20) if scheduler.select(alive)]
+        self.assertEqual(scheduler.cooldown_ticks, 6)
+        self.assertEqual(ticks, [1, 7, 13, 19])
+
+    def test_shooting_rate_matches_probability(self):
+        alive = np.ones(100, dtype=bool)
+        scheduler = FireScheduler(100, 0.01, cooldown=0, seed=3)
+        shots = sum(len(scheduler.select(alive)) for _ in range(1000))
+        self.assertAlmostEqual(shots / (100 * 1000), 0.01, delta=0.002)
+
+    def test_no_enemies_no_shots(self):
+        scheduler = FireScheduler(0, 1.0, seed=1)
+        self.assertEqual(scheduler.select(np.zeros(0, dtype=bool)), [])
+
+    def test_shared_clock_is_read_not_advanced(self):
+        alive = np.ones(1, dtype=bool)
+        clock = TickClock()
+        scheduler = FireScheduler(1, 1.0, cooldown=0.1, seed=1, clock=clock)
+        ticks = []
+        for _ in range(20):
+            clock.advance()
+            if scheduler.select(alive):
+                ticks.append(scheduler.tick)
+        self.assertEqual(clock.tick, 20)
+        self.assertEqual(ticks, [1, 7, 13, 19])
+
+    def test_new_scheduler_on_running_clock_can_shoot_at_once(self):
+        clock = TickClock()
+        clock.advance(100)
+        scheduler = FireScheduler(1, 1.0, cooldown=0.1, seed=1, clock=clock)
+        clock.advance()
+        self.assertEqual(scheduler.select(np.ones(1, dtype=bool)), [0])
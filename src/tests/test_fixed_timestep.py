@@ -0,0 +1,54 @@
+import unittest
+import pygame
+from services.fixed_timestep import FixedTimestep
+from ui.game_views.game.interpolation import SpriteInterpolator
+
+
+class TestFixedTimestep(unittest.TestCase):
+    def test_steps_follow_real_time(self):
+        timestep = FixedTimestep(steps_per_second=10)
+        self.assertEqual(timestep.advance(0.05), 0)
+        self.assertEqual(timestep.advance(0.06), 1)
+        self.assertAlmostEqual(timestep.alpha, 0.1)
+
+    def test_slow_frame_runs_several_steps(self):
+        timestep = FixedTimestep(steps_per_second=10, max_steps=5)
+        self.assertEqual(timestep.advance(0.2), 2)
+        self.assertEqual(timestep.dropped_steps, 0)
+
+    def test_steps_over_limit_are_dropped(self):
+        timestep = FixedTimestep(steps_per_second=10, max_steps=2, max_frame_time=1)
+        self.assertEqual(timestep.advance(0.5), 2)
+        self.assertEqual(timestep.dropped_steps, 3)
+        self.assertEqual(timestep.alpha, 0)
+
+    def test_long_frame_is_clamped(self):
+        timestep = FixedTimestep(steps_per_second=10, max_steps=100, max_frame_time=0.25)
+        self.assertEqual(timestep.advance(10), 2)
+
+    def test_reset_forgets_accumulated_time(self):
+        timestep = FixedTimestep(steps_per_second=10)
+        timestep.advance(0.09)
+        timestep.reset()
+        self.assertEqual(timestep.advance(0.02), 0)
+
+
+class TestSpriteInterpolator(unittest.TestCase):
+    def setUp(self):
+        self.sprite = pygame.sprite.Sprite()
+        self.sprite.rect = pygame.Rect(0, 0, 10, 10)
+        self.interpolator = SpriteInterpolator(max_distance=20)
+
+    def test_sprite_is_drawn_between_steps_and_restored(self):
+        self.interpolator.snapshot([self.sprite])
+        self.sprite.rect.topleft = (10, 4)
+        self.interpolator.apply(0.5)
+        self.assertEqual(self.sprite.rect.topleft, (5, 2))
+        self.interpolator.restore()
+        self.assertEqual(self.sprite.rect.topleft, (10, 4))
+
+    def test_long_jump_is_not_interpolated(self):
+        self.interpolator.snapshot([self.sprite])
+        self.sprite.rect.topleft = (0, 40)
+        self.interpolator.apply(0.5)
+        self.assertEqual(self.sprite.rect.topleft, (0, 40))
@@ -0,0 +1,71 @@
+import unittest
+from config import LOWER_BOUNDARY, RIGHT_BOUNDARY
+from models.point import Point
+from models.size import Size
+from services.enemy_service import EnemyService
+from services.formation import Formation
+
+
+def create_enemy(x, y, speed=1, direction="right"):
+    enemy = EnemyService.create(Point(x, y), Size(40, 40), speed, 1, 30)
+    enemy.direction = direction
+    return enemy
+
+
+def create_wave():
+    return [create_enemy(50, 100, 1, "right"),
+            create_enemy(RIGHT_BOUNDARY - 45, 100, 3, "right"),
+            create_enemy(2, 200, 2, "left"),
+            create_enemy(300, LOWER_BOUNDARY - 50, 4, "left"),
+            create_enemy(400, LOWER_BOUNDARY - 10, 1, "right")]
+
+
+class TestFormation(unittest.TestCase):
+    def test_formation_moves_like_separate_enemies(self):
+        expected = create_wave()
+        actual = create_wave()
+        formation = Formation(actual)
+
+        for _ in range(2000):
+            formation.update()
+            for expected_enemy, actual_enemy in zip(expected, actual):
+                self.assertEqual(actual_enemy.move(), expected_enemy.move())
+
+        for expected_enemy, actual_enemy in zip(expected, actual):
+            actual_enemy.leave_formation()
+            self.assertEqual(actual_enemy.direction, expected_enemy.direction)
+            self.assertEqual(actual_enemy.speed, expected_enemy.speed)
+
+    def test_enemy_speeds_up_and_turns_at_right_wall(self):
+        enemy = create_enemy(RIGHT_BOUNDARY - 40, 100)
+        formation = Formation([enemy])
+        formation.update()
+        self.assertEqual(enemy.position, (RIGHT_BOUNDARY - 40, 140))
+        self.assertEqual(formation.get_direction(0), "left")
+        self.assertEqual(formation.get_speed(0), 2)
+
+    def test_enemy_stops_at_bottom(self):
+        enemy = create_enemy(100, LOWER_BOUNDARY - 20)
+        formation = Formation([enemy])
+        formation.update()
+        formation.update()
+        self.assertEqual(enemy.position, (100, LOWER_BOUNDARY - 40))
+
+    def test_removed_enemy_does_not_move(self):
+        enemy = create_enemy(100, 100)
+        other = create_enemy(200, 100)
+        formation = Formation([enemy, other])
+        enemy.leave_formation()
+        formation.update()
+        self.assertEqual(enemy.position, (100, 100))
+        self.assertEqual(other.position, (201, 100))
+        self.assertEqual(len(formation), 1)
+
+    def test_enemy_moves_to_new_formation(self):
+        enemy = create_enemy(100, 100)
+        old = Formation([enemy])
+        old.update()
+        new = Formation([enemy])
+        new.update()
+        self.assertEqual(enemy.position, (102, 100))
+        self.assertEqual(len(old), 0)
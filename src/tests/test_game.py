@@ -1,8 +1,16 @@
 import unittest
 import pygame
-from app_enums import GameAttributes
-from config import LOWER_BOUNDARY, RIGHT_BOUNDARY
+from app_enums import CollisionMode, GameAttributes, LoopMode
+from config import (BULLET_HEIGHT, BULLET_WIDTH, ENEMY_HEIGHT, ENEMY_WIDTH,
+                    LOWER_BOUNDARY, PLAYER_MAX_HITS, RIGHT_BOUNDARY)
+from level_config import ENEMY_IMAGE
+from models.game_options import GameOptions
+from models.point import Point
+from models.size import Size
+from services.enemy_service import EnemyService
 from ui.game_views.game.game import Game
+from ui.sprites.bullet import BULLET_SPRITES
+from ui.sprites.enemy import EnemySprite
 
 
 class TestGame(unittest.TestCase):
@@ -13,3 +21,146 @@ class TestGame(unittest.TestCase):
 
     def test_game_is_initialized_correctly(self):
         self.assertEqual(self.game.gameover_data[GameAttributes.RUNNING], True)
+
+    def test_default_loop_is_frame_locked_like_the_original_game(self):
+        self.assertEqual(self.game.options.loop_mode, LoopMode.FRAME)
+
+    def test_draw_does_not_move_the_player(self):
+        player = self.game.player
+        player.player_service.move("d")
+        self.game.draw()
+        self.assertNotEqual(player.rect.topleft, player.player_service.position)
+        self.game.update()
+        self.assertEqual(player.rect.topleft, player.player_service.position)
+
+
+class TestGameCollisions(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((RIGHT_BOUNDARY, LOWER_BOUNDARY))
+        self.game = Game(self.screen)
+        self.groups = self.game.game_groups
+        self.player_x, self.player_y = self.game.player.rect.topleft
+
+    def add_enemy(self, x, y, max_hits=1):
+        enemy_service = EnemyService.create(Point(x, y), Size(ENEMY_WIDTH, ENEMY_HEIGHT),
+                                            1, max_hits, 1)
+        enemy = EnemySprite(enemy_service, self.groups[GameAttributes.ENEMY_BULLETS],
+                            self.game.world.bullets, ENEMY_IMAGE)
+        self.groups[GameAttributes.ENEMIES].add(enemy)
+        return enemy
+
+    def add_bullet(self, x, y, direction="up"):
+        handle = self.game.world.bullets.spawn(Point(x, y),
+                                               Size(BULLET_WIDTH, BULLET_HEIGHT), 5, direction)
+        group = (GameAttributes.PLAYER_BULLETS if direction == "up"
+                 else GameAttributes.ENEMY_BULLETS)
+        self.groups[group].add(BULLET_SPRITES.acquire(self.game.world.bullets, handle))
+
+    @property
+    def points(self):
+        return self.game.player.player_service.points
+
+    @property
+    def player_hits(self):
+        return self.game.player.player_service.hitcount
+
+    def test_killed_enemies_give_points(self):
+        self.add_enemy(100, 100)
+        self.add_enemy(200, 100)
+        self.add_bullet(110, 110)
+        self.add_bullet(210, 110)
+        self.game.check_sprite_collisions()
+
+        self.assertEqual(self.points, 2 * self.game.level_spec.points)
+        self.assertEqual(len(self.groups[GameAttributes.ENEMIES]), 0)
+        self.assertEqual(len(self.groups[GameAttributes.PLAYER_BULLETS]), 0)
+        self.assertEqual(len(self.groups[GameAttributes.HITS]), 2)
+        self.assertEqual(len(self.game.world), 0)
+
+    def test_enemy_takes_one_hit_per_bullet(self):
+        enemy = self.add_enemy(100, 100, max_hits=3)
+        self.add_bullet(105, 110)
+        self.add_bullet(120, 110)
+        self.game.check_sprite_collisions()
+
+        self.assertEqual(self.points, 0)
+        self.assertIn(enemy, self.groups[GameAttributes.ENEMIES])
+        self.assertEqual(len(self.groups[GameAttributes.PLAYER_BULLETS]), 0)
+        self.assertEqual(len(self.groups[GameAttributes.HITS]), 1)
+
+        self.add_bullet(110, 110)
+        self.game.check_sprite_collisions()
+        self.assertEqual(self.points, self.game.level_spec.points)
+        self.assertNotIn(enemy, self.groups[GameAttributes.ENEMIES])
+
+    def test_shot_down_enemy_bullet_gives_bullet_points(self):
+        self.add_bullet(300, 300, "down")
+        self.add_bullet(305, 305, "up")
+        self.game.check_sprite_collisions()
+
+        self.assertEqual(self.points, self.game.level_spec.bullet_points)
+        self.assertEqual(len(self.groups[GameAttributes.ENEMY_BULLETS]), 0)
+        self.assertEqual(len(self.groups[GameAttributes.PLAYER_BULLETS]), 0)
+        self.assertEqual(len(self.groups[GameAttributes.HITS]), 1)
+
+    def test_bullet_hits_only_the_first_of_two_enemies(self):
+        for mode in CollisionMode:
+            with self.subTest(mode=mode):
+                self.game = Game(self.screen, options=GameOptions(collision_mode=mode))
+                self.groups = self.game.game_groups
+                first = self.add_enemy(100, 100)
+                second = self.add_enemy(110, 100)
+                self.add_bullet(115, 110)
+                self.game.check_sprite_collisions()
+
+                self.assertNotIn(first, self.groups[GameAttributes.ENEMIES])
+                self.assertIn(second, self.groups[GameAttributes.ENEMIES])
+                self.assertEqual(self.points, self.game.level_spec.points)
+                self.assertEqual(len(self.groups[GameAttributes.HITS]), 1)
+
+    def test_player_bullet_stops_only_the_first_of_two_enemy_bullets(self):
+        for mode in CollisionMode:
+            with self.subTest(mode=mode):
+                self.game = Game(self.screen, options=GameOptions(collision_mode=mode))
+                self.groups = self.game.game_groups
+                self.add_bullet(300, 300, "down")
+                self.add_bullet(305, 300, "down")
+                self.add_bullet(302, 310, "up")
+                self.game.check_sprite_collisions()
+
+                self.assertEqual(len(self.groups[GameAttributes.ENEMY_BULLETS]), 1)
+                self.assertEqual(len(self.groups[GameAttributes.PLAYER_BULLETS]), 0)
+                self.assertEqual(self.points, self.game.level_spec.bullet_points)
+                self.assertEqual(len(self.groups[GameAttributes.HITS]), 1)
+
+    def test_enemy_bullets_hit_player_once(self):
+        self.add_bullet(self.player_x + 5, self.player_y + 10, "down")
+        self.add_bullet(self.player_x + 20, self.player_y + 10, "down")
+        self.game.check_sprite_collisions()
+
+        self.assertEqual(self.player_hits, 1)
+        self.assertEqual(len(self.groups[GameAttributes.ENEMY_BULLETS]), 0)
+        self.assertEqual(len(self.groups[GameAttributes.HITS]), 1)
+
+    def test_each_collision_rule_hits_player_once(self):
+        self.add_enemy(self.player_x + 10, self.player_y - 20)
+        self.add_enemy(self.player_x - 20, self.player_y - 20)
+        self.add_bullet(self.player_x + 5, self.player_y + 10, "down")
+        self.game.check_sprite_collisions()
+
+        self.assertEqual(self.player_hits, 2)
+        self.assertEqual(len(self.groups[GameAttributes.ENEMIES]), 0)
+        self.assertEqual(len(self.groups[GameAttributes.HITS]), 2)
+        self.assertEqual(self.points, 0)
+
+    def test_dead_player_is_removed(self):
+        player_group = pygame.sprite.Group(self.game.player)
+        for _ in range(PLAYER_MAX_HITS - 1):
+            self.game.player.player_service.add_hit()
+        self.add_bullet(self.player_x + 5, self.player_y + 10, "down")
+        self.game.check_sprite_collisions()
+
+        self.assertTrue(self.game.player.is_dead())
+        self.assertTrue(self.game.is_game_over())
+        self.assertNotIn(self.game.player, player_group)
@@ -0,0 +1,49 @@
+import unittest
+import pygame
+from app_enums import AppState
+from config import LOWER_BOUNDARY, RIGHT_BOUNDARY
+from ui.game_views.managers.event_loop import EventLoop
+from ui.game_views.managers.idle_events import needs_redraw, wait_for_events
+
+
+class CountingView:
+    def __init__(self):
+        self.user = None
+        self.renders = 0
+
+    def render(self):
+        self.renders += 1
+
+
+class TestIdleEvents(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((RIGHT_BOUNDARY, LOWER_BOUNDARY))
+        pygame.event.clear()
+
+    def test_wait_returns_empty_list_on_timeout(self):
+        self.assertEqual(wait_for_events(timeout=1), [])
+
+    def test_wait_returns_all_pending_events(self):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_b))
+        events = wait_for_events(timeout=1)
+        self.assertEqual(len(events), 2)
+
+    def test_key_press_needs_redraw(self):
+        event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)
+        self.assertTrue(needs_redraw([event]))
+
+    def test_mouse_motion_does_not_need_redraw(self):
+        event = pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1))
+        self.assertFalse(needs_redraw([event]))
+        self.assertFalse(needs_redraw([]))
+
+    def test_event_loop_renders_only_after_changes(self):
+        view = CountingView()
+        pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1)))
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE,
+                                             unicode=""))
+        state, _ = EventLoop(view, esc_state=AppState.START_SCREEN).run()
+        self.assertEqual(state, AppState.START_SCREEN)
+        self.assertEqual(view.renders, 1)
@@ -0,0 +1,23 @@
+import unittest
+from ui.game_views.game.layers import CachedLayer
+
+
+class TestCachedLayer(unittest.TestCase):
+    def setUp(self):
+        self.layer = CachedLayer(lambda hearts, broken: f"{hearts}/{broken}")
+
+    def test_layer_is_rendered_once_for_same_inputs(self):
+        for _ in range(60):
+            self.assertEqual(self.layer.get(3, 0), "3/0")
+        self.assertEqual(self.layer.render_count, 1)
+
+    def test_layer_is_rendered_again_when_inputs_change(self):
+        self.layer.get(3, 0)
+        self.assertEqual(self.layer.get(2, 1), "2/1")
+        self.assertEqual(self.layer.render_count, 2)
+
+    def test_invalidate_renders_again(self):
+        self.layer.get(3, 0)
+        self.layer.invalidate()
+        self.layer.get(3, 0)
+        self.assertEqual(self.layer.render_count, 2)
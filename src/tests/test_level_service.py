@@ -8,3 +8,32 @@ class TestLevelService(unittest.TestCase):
 
     def test_final_level_is_set_correctly(self):
         self.assertEqual(self.level_service.get_final_level(), 15)
+
+    def test_levels_scale_inside_a_group(self):
+        first = self.level_service.get_level(1)
+        third = self.level_service.get_level(3)
+        self.assertEqual(third.cols, first.cols + 2)
+        self.assertEqual(third.rows, 4)
+        self.assertAlmostEqual(third.shooting_probability,
+                               first.shooting_probability + 0.0002)
+
+    def test_new_group_starts_from_its_own_attributes(self):
+        level = self.level_service.get_level(6)
+        self.assertEqual(level.cols, 4)
+        self.assertEqual(level.image, "enemy2.png")
+        self.assertEqual(level.points, 2)
+        self.assertEqual(level.bullet_points, 4)
+
+    def test_level_is_compiled_once(self):
+        self.assertIs(self.level_service.get_level(4),
+                      self.level_service.get_level(4))
+
+    def test_levels_after_final_level_get_faster(self):
+        final = self.level_service.get_level(15)
+        endless = self.level_service.get_level(26)
+        self.assertEqual(endless.image, final.image)
+        self.assertEqual(endless.speed, final.speed + 3)
+
+    def test_level_below_one_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.level_service.get_level(0)
@@ -7,6 +7,7 @@ from models.hit import Hit
 from models.sprite_info import SpriteInfo
 from config import RIGHT_BOUNDARY, BULLET_WIDTH, BULLET_HEIGHT
 from services.bullet_service import BulletService
+from services.clock import FakeClock
 
 
 def create_player_bullet(player_service):
@@ -134,6 +135,16 @@ class TestPlayer(unittest.TestCase):
         can_shoot = self.player_service.can_shoot()
         self.assertEqual(can_shoot, False)
 
+    def test_cooldown_follows_injected_clock(self):
+        clock = FakeClock()
+        player_service = PlayerService(sprite_info=self.sprite_info,
+                                       cooldown=0.5, clock=clock)
+        self.assertEqual(player_service.can_shoot(), True)
+        clock.advance(0.4)
+        self.assertEqual(player_service.can_shoot(), False)
+        clock.advance(0.1)
+        self.assertEqual(player_service.can_shoot(), True)
+
     def test_player_is_not_dead_if_one_hit(self):
         self.player_service._sprite.add_hit()
         is_dead = self.player_service.is_dead
@@ -0,0 +1,65 @@
+import unittest
+import pygame
+from app_enums import RenderMode
+from config import BLACK, LOWER_BOUNDARY, RIGHT_BOUNDARY, WHITE
+from ui.game_views.game.renderers import (DirtyRectRenderer,
+                                          FullRedrawRenderer,
+                                          create_renderer)
+
+
+class TestRenderers(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((RIGHT_BOUNDARY, LOWER_BOUNDARY))
+        self.surface = pygame.Surface((10, 10))
+        self.surface.fill(WHITE)
+
+    def test_render_mode_selects_renderer(self):
+        self.assertIsInstance(create_renderer(RenderMode.DIRTY, self.screen),
+                              DirtyRectRenderer)
+        self.assertIsInstance(create_renderer(RenderMode.FULL, self.screen),
+                              FullRedrawRenderer)
+
+    def test_dirty_renderer_remembers_drawn_areas(self):
+        renderer = DirtyRectRenderer(self.screen)
+        renderer.begin_frame()
+        renderer.blit(self.surface, (0, 0))
+        renderer.blit(self.surface, (100, 100))
+        renderer.end_frame()
+        self.assertEqual(renderer.dirty_rect_count, 2)
+
+    def test_dirty_renderer_clears_previous_areas(self):
+        renderer = DirtyRectRenderer(self.screen)
+        renderer.begin_frame()
+        renderer.blit(self.surface, (0, 0))
+        renderer.end_frame()
+
+        renderer.begin_frame()
+        renderer.blit(self.surface, (100, 100))
+        renderer.end_frame()
+
+        self.assertEqual(self.screen.get_at((5, 5))[:3], BLACK)
+        self.assertEqual(self.screen.get_at((105, 105))[:3], WHITE)
+
+    def test_invalidate_forgets_drawn_areas(self):
+        renderer = DirtyRectRenderer(self.screen)
+        renderer.begin_frame()
+        renderer.blit(self.surface, (0, 0))
+        renderer.end_frame()
+        renderer.invalidate()
+        self.assertEqual(renderer.dirty_rect_count, 0)
+
+    def test_dirty_renderer_restores_previous_areas_from_background(self):
+        background = pygame.Surface(self.screen.get_size())
+        background.fill(WHITE)
+        black = pygame.Surface((10, 10))
+        black.fill(BLACK)
+        renderer = DirtyRectRenderer(self.screen)
+        renderer.begin_frame(background)
+        renderer.blit(black, (0, 0))
+        renderer.end_frame()
+
+        renderer.begin_frame(background)
+        renderer.end_frame()
+
+        self.assertEqual(self.screen.get_at((5, 5))[:3], WHITE)
@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import Mock
+from app_enums import GameEventType
+from models.game_event import GameEvent
+from models.size import Size
+from services.session_statistics_service import SessionStatisticsService
+from utils.db_setup_helpers import (create_test_database_connection,
+                                    get_database, get_user_service,
+                                    get_user_statistics_service)
+
+
+class TestSessionStatisticsService(unittest.TestCase):
+    def setUp(self):
+        self.connection = create_test_database_connection()
+        self.db = get_database(self.connection)
+        self.user_service = get_user_service(self.db)
+        self.user_statistics_service = get_user_statistics_service(self.db)
+        _, _, self.user = self.user_service.register_user("elaine", "marley")
+        self.user_statistics_service.create_user_statistics(
+            self.user.user_id, 10, 2)
+        self.session = SessionStatisticsService(self.user_statistics_service)
+
+    def tearDown(self):
+        self.connection.close()
+
+    def test_load_fetches_user_statistics(self):
+        self.session.load(self.user.user_id)
+        self.assertEqual(self.session.user_statistics.high_score, 10)
+
+    def test_load_without_statistics_returns_none(self):
+        self.assertIsNone(self.session.load(self.user.user_id + 1))
+
+    def test_snapshot_is_read_without_database_queries(self):
+        repository = Mock(wraps=self.user_statistics_service.user_statistics_repository)
+        self.user_statistics_service.user_statistics_repository = repository
+        self.session.load(self.user.user_id)
+
+        for _ in range(60):
+            self.assertEqual(self.session.user_statistics.high_score, 10)
+
+        self.assertEqual(repository.get_user_statistics.call_count, 1)
+
+    def test_save_refreshes_snapshot(self):
+        self.session.load(self.user.user_id)
+        self.session.save(25, 3)
+        self.assertEqual(self.session.user_statistics.high_score, 25)
+        self.assertEqual(self.session.user_statistics.level, 3)
+
+    def test_save_lower_score_keeps_high_score(self):
+        self.session.load(self.user.user_id)
+        self.session.save(5, 1)
+        self.assertEqual(self.session.user_statistics.high_score, 10)
+
+    def test_record_events_counts_event_types(self):
+        kill = GameEvent(GameEventType.ENEMY_KILLED, (0, 0), Size(40, 40))
+        hit = GameEvent(GameEventType.PLAYER_HIT, (0, 0), Size(40, 40))
+        self.session.record_events([kill, kill, hit])
+        self.assertEqual(self.session.event_counts[GameEventType.ENEMY_KILLED], 2)
+        self.assertEqual(self.session.event_counts[GameEventType.PLAYER_HIT], 1)
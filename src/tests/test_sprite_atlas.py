@@ -0,0 +1,59 @@
+import tempfile
+import unittest
+import os
+import pygame
+from config import LOWER_BOUNDARY, RIGHT_BOUNDARY
+from models.size import Size
+from ui.build_atlas import build_atlas
+from ui.resources.atlas import SpriteAtlas
+from ui.resources.surface_cache import SurfaceCache
+
+
+def save_image(directory, name, size, color):
+    image = pygame.Surface(size, pygame.SRCALPHA)
+    image.fill(color)
+    pygame.image.save(image, os.path.join(directory, name))
+
+
+class TestSpriteAtlas(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((RIGHT_BOUNDARY, LOWER_BOUNDARY))
+        self.directory = tempfile.TemporaryDirectory()
+        save_image(self.directory.name, "red.png", (10, 20), (255, 0, 0, 255))
+        save_image(self.directory.name, "blue.png", (30, 5), (0, 0, 255, 255))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_atlas_is_not_loaded_if_not_built(self):
+        self.assertIsNone(SpriteAtlas.load(self.directory.name))
+
+    def test_sprites_are_subsurfaces_of_one_page(self):
+        build_atlas(self.directory.name)
+        atlas = SpriteAtlas.load(self.directory.name)
+
+        red = atlas.get("red.png")
+        blue = atlas.get("blue.png")
+        self.assertEqual(atlas.page_count, 1)
+        self.assertEqual(red.get_size(), (10, 20))
+        self.assertEqual(blue.get_size(), (30, 5))
+        self.assertIs(red.get_parent(), blue.get_parent())
+        self.assertEqual(red.get_at((5, 5)), (255, 0, 0, 255))
+
+    def test_rebuilding_does_not_pack_old_pages(self):
+        build_atlas(self.directory.name)
+        manifest = build_atlas(self.directory.name)
+        self.assertEqual(sorted(manifest["sprites"]), ["blue.png", "red.png"])
+
+    def test_surface_cache_slices_images_from_atlas(self):
+        build_atlas(self.directory.name)
+        cache = SurfaceCache(assets_dir=self.directory.name)
+        original = cache.get_original("blue.png")
+        self.assertIsNotNone(original.get_parent())
+        self.assertEqual(cache.get("blue.png", Size(15, 5)).get_size(), (15, 5))
+
+    def test_surface_cache_can_skip_atlas(self):
+        build_atlas(self.directory.name)
+        cache = SurfaceCache(assets_dir=self.directory.name, use_atlas=False)
+        self.assertIsNone(cache.get_original("blue.png").get_parent())
@@ -0,0 +1,62 @@
+import unittest
+import pygame
+from config import LOWER_BOUNDARY, RIGHT_BOUNDARY
+from models.point import Point
+from models.size import Size
+from services.bullet_pool import BulletPool
+from ui.game_views.game.animation import AnimationLibrary, HIT_FRAMES
+from ui.resources.surface_cache import SurfaceCache
+from ui.sprites.bullet import BulletSprite
+from ui.sprites.sprite_pool import SpritePool
+
+
+class TestSpritePool(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((RIGHT_BOUNDARY, LOWER_BOUNDARY))
+        self.bullet_pool = BulletPool(capacity=4)
+        self.sprites = SpritePool(BulletSprite, max_size=1)
+        self.group = pygame.sprite.Group()
+
+    def spawn(self, y=100, direction="up"):
+        handle = self.bullet_pool.spawn(Point(10, y), Size(10, 20), 5, direction)
+        sprite = self.sprites.acquire(self.bullet_pool, handle)
+        self.group.add(sprite)
+        return sprite
+
+    def test_killed_sprite_is_reused(self):
+        first = self.spawn()
+        first.kill()
+        second = self.spawn(y=300, direction="down")
+
+        self.assertIs(first, second)
+        self.assertEqual(second.rect.topleft, (10, 300))
+        self.assertEqual(self.sprites.stats(),
+                         {"hits": 1, "misses": 1, "dropped": 0, "free": 0})
+
+    def test_sprite_is_released_once(self):
+        sprite = self.spawn()
+        sprite.kill()
+        sprite.kill()
+        self.assertEqual(len(self.sprites), 1)
+
+    def test_free_list_is_limited(self):
+        first = self.spawn()
+        second = self.spawn()
+        first.kill()
+        second.kill()
+        self.assertEqual(len(self.sprites), 1)
+        self.assertEqual(self.sprites.dropped, 1)
+
+    def test_finished_animation_is_reused(self):
+        library = AnimationLibrary(SurfaceCache())
+        first = library.create(HIT_FRAMES, (10, 10), Size(40, 40))
+        first.index = len(HIT_FRAMES)
+        first.kill()
+        second = library.create(HIT_FRAMES, (100, 100), Size(20, 20))
+
+        self.assertIs(first, second)
+        self.assertEqual(second.index, 0)
+        self.assertEqual(second.rect.size, (20, 20))
+        self.assertEqual(second.rect.center, (100, 100))
+        self.assertEqual(library.sprites.hits, 1)
@@ -0,0 +1,61 @@
+import unittest
+import pygame
+from config import LOWER_BOUNDARY, RIGHT_BOUNDARY
+from models.size import Size
+from ui.resources.surface_cache import SurfaceCache, preload_game_images
+
+
+class TestSurfaceCache(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        pygame.display.set_mode((RIGHT_BOUNDARY, LOWER_BOUNDARY))
+        self.cache = SurfaceCache(max_size=2)
+
+    def test_same_image_and_size_returns_shared_surface(self):
+        first = self.cache.get("enemy1.png", Size(40, 40))
+        second = self.cache.get("enemy1.png", Size(40, 40))
+        self.assertIs(first, second)
+        self.assertEqual(first.get_size(), (40, 40))
+
+    def test_different_sizes_are_cached_separately(self):
+        small = self.cache.get("enemy1.png", Size(20, 20))
+        large = self.cache.get("enemy1.png", Size(40, 40))
+        self.assertIsNot(small, large)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_original_image_is_loaded_once(self):
+        first = self.cache.get_original("heart.png")
+        second = self.cache.get_original("heart.png")
+        self.assertIs(first, second)
+
+    def test_least_recently_used_surface_is_evicted(self):
+        self.cache.get("enemy1.png", Size(40, 40))
+        self.cache.get("enemy2.png", Size(40, 40))
+        self.cache.get("enemy1.png", Size(40, 40))
+        self.cache.get("enemy3.png", Size(40, 40))
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIn(("enemy1.png", 40, 40), self.cache)
+        self.assertNotIn(("enemy2.png", 40, 40), self.cache)
+
+    def test_mask_is_made_once_and_leaves_transparent_corners_out(self):
+        first = self.cache.get_mask("enemy1.png", Size(40, 40))
+        second = self.cache.get_mask("enemy1.png", Size(40, 40))
+        self.assertIs(first, second)
+        self.assertEqual(first.get_size(), (40, 40))
+        self.assertEqual(first.get_at((0, 0)), 0)
+        self.assertGreater(first.count(), 0)
+
+    def test_mask_is_evicted_with_its_surface(self):
+        first = self.cache.get_mask("enemy1.png", Size(40, 40))
+        self.cache.get("enemy2.png", Size(40, 40))
+        self.cache.get("enemy3.png", Size(40, 40))
+        self.assertIsNot(self.cache.get_mask("enemy1.png", Size(40, 40)), first)
+
+    def test_preload_game_images_loads_all_level_enemies(self):
+        cache = SurfaceCache()
+        preload_game_images(cache)
+        self.assertIn(("enemy1.png", 40, 40), cache)
+        self.assertIn(("enemy2.png", 40, 40), cache)
+        self.assertIn(("enemy3.png", 40, 40), cache)
+        self.assertIn(("player.png", 40, 40), cache)
@@ -0,0 +1,45 @@
+import unittest
+import pygame
+from config import SILVER, WHITE
+from ui.resources.text_cache import TextCache, get_font
+
+
+class TestTextCache(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.font = get_font(30)
+        self.cache = TextCache(max_size=2)
+
+    def test_same_font_size_returns_shared_font(self):
+        self.assertIs(get_font(30), self.font)
+
+    def test_repeated_text_is_rendered_once(self):
+        first = self.cache.render(self.font, "Level 1", WHITE)
+        second = self.cache.render(self.font, "Level 1", WHITE)
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_color_is_part_of_the_key(self):
+        white = self.cache.render(self.font, "Level 1", WHITE)
+        silver = self.cache.render(self.font, "Level 1", SILVER)
+        self.assertIsNot(white, silver)
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_least_recently_used_text_is_evicted(self):
+        self.cache.render(self.font, "a", WHITE)
+        self.cache.render(self.font, "b", WHITE)
+        self.cache.render(self.font, "a", WHITE)
+        self.cache.render(self.font, "c", WHITE)
+        self.assertEqual(len(self.cache), 2)
+
+        self.cache.render(self.font, "a", WHITE)
+        self.assertEqual(self.cache.hits, 2)
+        self.cache.render(self.font, "b", WHITE)
+        self.assertEqual(self.cache.misses, 4)
+
+    def test_clear_resets_counters(self):
+        self.cache.render(self.font, "a", WHITE)
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.misses, 0)
@@ -0,0 +1,43 @@
+import unittest
+import pygame
+from app_enums import RenderMode
+from config import BLACK, LOWER_BOUNDARY, RIGHT_BOUNDARY, WHITE
+from ui.game_views.game.renderers import create_renderer
+from ui.game_views.game.texture_renderer import TextureRenderer
+
+
+class TestTextureRenderer(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((RIGHT_BOUNDARY, LOWER_BOUNDARY))
+        self.surface = pygame.Surface((10, 10))
+        self.surface.fill(WHITE)
+        self.renderer = TextureRenderer(self.screen)
+
+    def tearDown(self):
+        self.renderer.close()
+
+    def test_render_mode_selects_texture_renderer(self):
+        self.assertIsInstance(create_renderer(RenderMode.TEXTURE, self.screen),
+                              TextureRenderer)
+
+    def test_blit_draws_surface_on_frame(self):
+        self.renderer.begin_frame()
+        rect = self.renderer.blit(self.surface, (100, 100))
+        frame = self.renderer.to_surface()
+
+        self.assertEqual(rect, pygame.Rect(100, 100, 10, 10))
+        self.assertEqual(frame.get_at((105, 105))[:3], WHITE)
+        self.assertEqual(frame.get_at((5, 5))[:3], BLACK)
+
+    def test_frame_starts_from_background(self):
+        background = pygame.Surface(self.screen.get_size())
+        background.fill(WHITE)
+        self.renderer.begin_frame(background)
+        self.assertEqual(self.renderer.to_surface().get_at((5, 5))[:3], WHITE)
+
+    def test_close_can_be_called_twice(self):
+        self.renderer.begin_frame()
+        self.renderer.end_frame()
+        self.renderer.close()
+        self.renderer.close()
@@ -0,0 +1,74 @@
+"""
+This script packs the game sprites into atlas images and writes a manifest
+of the sprite rectangles next to them in the assets directory.
+
+At runtime the sprites are sliced from the atlas pages as subsurfaces, so
+the game opens and decodes only a few image files instead of one per sprite.
+
+Usage:
+    Run from the project root:
+        python3 src/ui/build_atlas.py
+"""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+import pygame
+from config import ASSETS_DIR, ATLAS_MANIFEST, ATLAS_MAX_SIZE, ATLAS_PAGE_NAME
+from utils.atlas_packing import pack_sprites
+
+
+def find_sprite_images(assets_dir=ASSETS_DIR):
+    """
+    Returns:
+        list: File names of all sprite images in the assets directory.
+        Earlier atlas pages are not included.
+    """
+    return sorted(name for name in os.listdir(assets_dir)
+                  if name.endswith(".png")
+                  and not name.startswith(ATLAS_PAGE_NAME))
+
+
+def build_atlas(assets_dir=ASSETS_DIR, max_size=ATLAS_MAX_SIZE):
+    """
+    Pack all sprite images into atlas pages and write the manifest.
+
+    Args:
+        assets_dir: Directory of the sprite images and the atlas output.
+        max_size: Maximum width and height of one atlas page.
+
+    Returns:
+        dict: The written manifest.
+    """
+    images = {name: pygame.image.load(os.path.join(assets_dir, name))
+              for name in find_sprite_images(assets_dir)}
+    sizes = {name: image.get_size() for name, image in images.items()}
+    placements, page_sizes = pack_sprites(sizes, max_size)
+
+    pages = [pygame.Surface(size, pygame.SRCALPHA) for size in page_sizes]
+    for name, (page, x, y, _, _) in placements.items():
+        pages[page].blit(images[name], (x, y))
+
+    page_names = []
+    for index, page in enumerate(pages):
+        page_name = f"{ATLAS_PAGE_NAME}_{index}.png"
+        pygame.image.save(page, os.path.join(assets_dir, page_name))
+        page_names.append(page_name)
+
+    manifest = {
+        "pages": page_names,
+        "sprites": {name: list(placement)
+                    for name, placement in sorted(placements.items())}
+    }
+    with open(os.path.join(assets_dir, ATLAS_MANIFEST), "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2)
+
+    print(f"Packed {len(placements)} sprites into {len(page_names)} atlas page(s).")
+    return manifest
+
+
+if __name__ == "__main__":
+    build_atlas()
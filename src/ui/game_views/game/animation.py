@@ -1,4 +1,12 @@
+from collections import OrderedDict
 import pygame
+from config import ANIMATION_CACHE_MAX_SIZE, SPRITE_POOL_MAX_SIZE
+from models.size import Size
+from ui.resources.surface_cache import SURFACE_CACHE, SurfaceCache
+from ui.sprites.sprite_pool import SpritePool
+
+HIT_FRAMES = tuple(f"hit{i}.png" for i in range(1, 5))
+PLAYER_HIT_FRAMES = tuple(f"player_hit{i}.png" for i in range(1, 9))
 
 
 class AnimationSprite(pygame.sprite.Sprite):
@@ -7,25 +15,34 @@ class AnimationSprite(pygame.sprite.Sprite):
     When the animation is finished the sprite removes itself.
     """
 
-    def __init__(self, position, size, image_paths, duration=400):
+    def __init__(self, position, frames, duration=400):
         """
         Initialize the animation sprite.
 
         Args:
         position (tuple): The (x, y) center position of the animation on the screen.
-        size (Size): A Size object to scale images to same size.
-        image_paths (list): All images in the animation.
+        frames (tuple): Shared, already scaled frames of the animation.
         duration (int): Total time in milliseconds the animation should take. Default is 400.
         """
         super().__init__()
-        self._images = [pygame.image.load(path)
-                        .convert_alpha() for path in image_paths]
-        self._images = [pygame.transform
-                        .scale(img, (size.width, size.height)) for img in self._images]
+        self.sprite_pool = None
+        self._rect = None
+        self.reset(position, frames, duration)
+
+    def reset(self, position, frames, duration=400):
+        """
+        Restart the sprite as a new animation. Used by the sprite pool.
+        Takes the same arguments as the constructor.
+        """
+        self._images = frames
 
         self._index = 0
         self._image = self._images[self.index]
-        self._rect = self._image.get_rect(center=position)
+        if self._rect is None:
+            self._rect = self._image.get_rect(center=position)
+        else:
+            self._rect.size = self._image.get_size()
+            self._rect.center = position
 
         self._last_update = pygame.time.get_ticks()
         self._frame_rate = duration // len(self._images)
@@ -90,3 +107,96 @@ class AnimationSprite(pygame.sprite.Sprite):
                 self.image = self.images[self.index]
             else:
                 self.kill()
+
+    def kill(self):
+        """
+        Remove the sprite from all groups and give it back to its sprite pool.
+        """
+        super().kill()
+        if self.sprite_pool is not None:
+            sprite_pool, self.sprite_pool = self.sprite_pool, None
+            sprite_pool.release(self)
+
+
+class AnimationLibrary:
+    """
+    Keeps the frames of every animation decoded and scaled only once.
+
+    The original frame images come from the surface cache. Scaled frame
+    sequences are memoized per (frames, width, height) and evicted in
+    least recently used order when the library is full. Animation sprites
+    only hold a reference to the shared frames and their own frame index.
+    Finished animation sprites are pooled and restarted for new animations.
+    """
+
+    def __init__(self, surface_cache: SurfaceCache = SURFACE_CACHE,
+                 max_size=ANIMATION_CACHE_MAX_SIZE,
+                 sprite_pool_max_size=SPRITE_POOL_MAX_SIZE):
+        """
+        Args:
+            surface_cache: Where the original frame images are loaded from.
+            max_size: How many scaled frame sequences are kept.
+            sprite_pool_max_size: How many finished animation sprites are kept for reuse.
+        """
+        self._surface_cache = surface_cache
+        self._max_size = max_size
+        self._sequences = OrderedDict()
+        self._sprites = SpritePool(AnimationSprite, max_size=sprite_pool_max_size)
+
+    def __len__(self):
+        return len(self._sequences)
+
+    @property
+    def sprites(self):
+        """
+        Returns:
+            SpritePool: The pool of animation sprites.
+        """
+        return self._sprites
+
+    def get_frames(self, image_names, size: Size):
+        """
+        Get the frames of an animation scaled to the given size.
+
+        Args:
+            image_names: File names of the frames in order.
+            size: The size the frames are scaled to.
+
+        Returns:
+            tuple: Shared, scaled frame surfaces.
+        """
+        key = (tuple(image_names), size.width, size.height)
+        frames = self._sequences.get(key)
+        if frames is not None:
+            self._sequences.move_to_end(key)
+            return frames
+
+        frames = tuple(
+            pygame.transform.scale(self._surface_cache.get_original(name),
+                                   (size.width, size.height))
+            for name in image_names)
+        self._sequences[key] = frames
+        if len(self._sequences) > self._max_size:
+            self._sequences.popitem(last=False)
+        return frames
+
+    def create(self, image_names, position, size: Size, duration=400):
+        """
+        Get an animation sprite that uses shared frames.
+        A finished animation sprite is reused if there is one.
+
+        Args:
+            image_names: File names of the frames in order.
+            position: The (x, y) center position of the animation.
+            size: The size of the animation.
+            duration: Total time in milliseconds the animation should take.
+
+        Returns:
+            AnimationSprite: The started animation sprite.
+        """
+        return self._sprites.acquire(position,
+                                     self.get_frames(image_names, size),
+                                     duration)
+
+
+ANIMATIONS = AnimationLibrary()
@@ -0,0 +1,396 @@
+from bisect import bisect_left
+import numpy as np
+import pygame
+from app_enums import CollisionMode
+from config import SPATIAL_HASH_CELL_SIZE
+from models.collision_pairs import CollisionPairs
+from services.aabb import swept_overlap, swept_overlap_pairs
+from services.spatial_hash import SpatialHash
+
+STILL = (0, 0)
+
+
+def get_motion(sprite):
+    """
+    Returns:
+        tuple: (dx, dy) the sprite moved on the last tick. Sprites
+        without a motion are treated as still.
+    """
+    return getattr(sprite, "motion", STILL)
+
+
+def swept_bounds(sprite):
+    """
+    Returns:
+        tuple: (x, y, width, height) of the area the sprite rect covered
+        on the last tick.
+    """
+    rect = sprite.rect
+    dx, dy = get_motion(sprite)
+    return (rect.x - max(dx, 0), rect.y - max(dy, 0),
+            rect.width + abs(dx), rect.height + abs(dy))
+
+
+def swept_collide(sprite, other):
+    """
+    Collision test for pygame.sprite: the sprites collide if their rects
+    overlap at any point of their paths on the last tick, so a fast
+    bullet can not pass through a target between two ticks.
+    """
+    first_motion, second_motion = get_motion(sprite), get_motion(other)
+    if first_motion == second_motion:
+        return sprite.rect.colliderect(other.rect)
+    return swept_overlap(tuple(sprite.rect), first_motion,
+                         tuple(other.rect), second_motion)
+
+
+def pixel_collide(sprite, other):
+    """
+    Test the collision masks of two sprites whose rects collide. The masks
+    are tested at every pixel step of the relative motion on the last
+    tick, so a fast bullet can not pass between the pixels of a target.
+    Sprites without a mask are tested by their rect only.
+
+    Returns:
+        bool: Whether opaque pixels of the sprites overlap.
+    """
+    mask, other_mask = getattr(sprite, "mask", None), getattr(other, "mask", None)
+    if mask is None or other_mask is None:
+        return True
+
+    first_motion, second_motion = get_motion(sprite), get_motion(other)
+    dx, dy = second_motion[0] - first_motion[0], second_motion[1] - first_motion[1]
+    offset_x, offset_y = other.rect.x - sprite.rect.x, other.rect.y - sprite.rect.y
+    steps = max(abs(dx), abs(dy))
+    if steps == 0:
+        return mask.overlap(other_mask, (offset_x, offset_y)) is not None
+
+    overlap = mask.overlap
+    for back in range(steps, -1, -1):
+        offset = (offset_x - round(dx * back / steps), offset_y - round(dy * back / steps))
+        if overlap(other_mask, offset) is not None:
+            return True
+    return False
+
+
+def precise_collide(sprite, other):
+    """
+    Collision test for pygame.sprite: swept_collide on the rects first,
+    then pixel_collide on the masks only for the pairs that passed.
+    """
+    return swept_collide(sprite, other) and pixel_collide(sprite, other)
+
+
+class PygameCollisionDetector:
+    """
+    Finds colliding sprites with pygame.sprite, which tests every pair.
+    The methods work like pygame.sprite.groupcollide and spritecollide,
+    with swept_collide as the test. A pixel precise detector tests the
+    pairs that collide by rect also by their masks (precise_collide).
+    """
+
+    def __init__(self, pixel_precise=False):
+        """
+        Args:
+            pixel_precise: Whether the collisions are checked by the sprite masks.
+        """
+        self._pixel_precise = pixel_precise
+        self._collide = precise_collide if pixel_precise else swept_collide
+
+    def prepare(self, groups):
+        """
+        Called once per tick before the collision checks.
+
+        Args:
+            groups: The sprite groups the checks will test against.
+        """
+
+    def groupcollide(self, group_a, group_b, dokill_a, dokill_b):
+        """
+        Returns:
+            dict: Every sprite of group_a that collides, with the list of
+            sprites of group_b it collides with.
+        """
+        return pygame.sprite.groupcollide(group_a, group_b, dokill_a, dokill_b,
+                                          self._collide)
+
+    def spritecollide(self, sprite, group, dokill):
+        """
+        Returns:
+            list: The sprites of the group that collide with the sprite.
+        """
+        return pygame.sprite.spritecollide(sprite, group, dokill, self._collide)
+
+    def collide_pairs(self, group_a, group_b):
+        """
+        Find the colliding pairs of two groups without removing any sprite.
+
+        Returns:
+            CollisionPairs: The pairs as index arrays.
+        """
+        collisions = self.groupcollide(group_a, group_b, False, False)
+        second = list(dict.fromkeys(
+            sprite for hits in collisions.values() for sprite in hits))
+        index = {sprite: j for j, sprite in enumerate(second)}
+        first_indices = [i for i, hits in enumerate(collisions.values()) for _ in hits]
+        second_indices = [index[sprite] for hits in collisions.values() for sprite in hits]
+        return CollisionPairs(list(collisions), second,
+                              np.array(first_indices, dtype=np.intp),
+                              np.array(second_indices, dtype=np.intp))
+
+
+class BroadphaseCollisionDetector(PygameCollisionDetector):
+    """
+    Base class for detectors that prepare a search structure per group
+    once per tick and test only the candidates it returns. The structure
+    holds the swept bounds of the sprites, the area they covered on the tick.
+
+    Sprites that an earlier check has removed from the group are still in
+    the structure, so the candidates are checked against the group before
+    the exact swept test. The results are the same as with pygame.sprite.
+    Subclasses override prepare and _candidates. Without a search
+    structure every sprite of the group is tested, as with pygame.sprite.
+    """
+
+    def _candidates(self, sprite, group):
+        """
+        Returns:
+            list or None: The sprites of the group near the sprite,
+            or None if the group has not been prepared.
+        """
+        return None
+
+    def _collisions(self, sprite, group):
+        candidates = self._candidates(sprite, group)
+        if candidates is None:
+            return pygame.sprite.spritecollide(sprite, group, False, self._collide)
+
+        collide = self._collide
+        return [other for other in candidates
+                if other in group and collide(sprite, other)]
+
+    def groupcollide(self, group_a, group_b, dokill_a, dokill_b):
+        collisions = {}
+        for sprite in group_a.sprites():
+            hits = self._collisions(sprite, group_b)
+            if hits:
+                collisions[sprite] = hits
+                # like pygame, a killed sprite can not be hit by the later sprites
+                if dokill_b:
+                    for other in hits:
+                        other.kill()
+
+        if dokill_a:
+            for sprite in collisions:
+                sprite.kill()
+        return collisions
+
+    def spritecollide(self, sprite, group, dokill):
+        hits = self._collisions(sprite, group)
+        if dokill:
+            for other in hits:
+                other.kill()
+        return hits
+
+
+class SpatialHashCollisionDetector(BroadphaseCollisionDetector):
+    """
+    Finds colliding sprites with a spatial hash grid per group.
+    The grids are built again once per tick in prepare, because the
+    sprites do not move during the collision checks.
+    """
+
+    def __init__(self, cell_size=SPATIAL_HASH_CELL_SIZE, pixel_precise=False):
+        """
+        Args:
+            cell_size: Size of a grid cell in pixels.
+            pixel_precise: Whether the collisions are checked by the sprite masks.
+        """
+        super().__init__(pixel_precise)
+        self._cell_size = cell_size
+        self._grids = {}
+
+    def prepare(self, groups):
+        self._grids = {}
+        for group in groups:
+            grid = SpatialHash(self._cell_size)
+            for sprite in group:
+                grid.insert(sprite, *swept_bounds(sprite))
+            self._grids[id(group)] = (group, grid)
+
+    def _candidates(self, sprite, group):
+        prepared = self._grids.get(id(group))
+        if prepared is None or prepared[0] is not group:
+            return None
+        return prepared[1].query(*swept_bounds(sprite))
+
+
+class SweepAxis:
+    """
+    The sprites of one group sorted by the left edge of their swept bounds.
+
+    The order is kept from tick to tick. Bullets never change their x
+    and enemies move only a few pixels, so the list is almost sorted on
+    the next tick and sorting it again is close to linear.
+    """
+
+    def __init__(self, group):
+        self.group = group
+        self._sprites = []
+        self._members = set()
+        self.lefts = []
+        self.max_width = 0
+
+    def update(self):
+        """
+        Drop the removed sprites, add the new ones and sort again.
+        """
+        group = self.group
+        sprites = [sprite for sprite in self._sprites if sprite in group]
+        if len(sprites) != len(group):
+            members = set(sprites)
+            sprites.extend(sprite for sprite in group if sprite not in members)
+        bounds = sorted(((swept_bounds(sprite), sprite) for sprite in sprites),
+                        key=lambda item: item[0][0])
+        self._sprites = [sprite for _, sprite in bounds]
+        self.lefts = [box[0] for box, _ in bounds]
+        self.max_width = max((box[2] for box, _ in bounds), default=0)
+
+    def query(self, left, right):
+        """
+        Returns:
+            list: The sprites whose x interval can overlap [left, right).
+        """
+        start = bisect_left(self.lefts, left - self.max_width + 1)
+        end = bisect_left(self.lefts, right, start)
+        return self._sprites[start:end]
+
+
+class SweepAndPruneCollisionDetector(BroadphaseCollisionDetector):
+    """
+    Finds colliding sprites by sweeping along the x axis.
+
+    Every group keeps its sprites sorted by x between ticks (SweepAxis).
+    A sprite is tested only against the sprites of the other group whose
+    x interval overlaps its own, found by binary search.
+    """
+
+    def __init__(self, pixel_precise=False):
+        super().__init__(pixel_precise)
+        self._axes = {}
+
+    def prepare(self, groups):
+        axes = {}
+        for group in groups:
+            axis = self._axes.get(id(group))
+            if axis is None or axis.group is not group:
+                axis = SweepAxis(group)
+            axis.update()
+            axes[id(group)] = axis
+        self._axes = axes
+
+    def _candidates(self, sprite, group):
+        axis = self._axes.get(id(group))
+        if axis is None or axis.group is not group:
+            return None
+        x, _, width, _ = swept_bounds(sprite)
+        return axis.query(x, x + width)
+
+
+class NumpyCollisionDetector(PygameCollisionDetector):
+    """
+    Finds colliding sprites with the vectorized swept AABB kernel of
+    services.aabb.
+
+    The rects and motions of every group are copied into arrays once per
+    tick in prepare. A check between two groups is then one kernel call that
+    returns the index pairs of all overlaps. Sprites that an earlier check
+    has removed are dropped from the pairs, so the results are the same as
+    with pygame.sprite. A pixel precise detector tests only the pairs from
+    the kernel by their masks.
+    """
+
+    def __init__(self, pixel_precise=False):
+        super().__init__(pixel_precise)
+        self._boxes = {}
+
+    @staticmethod
+    def _box_arrays(group):
+        sprites = group.sprites()
+        boxes = np.array([sprite.rect for sprite in sprites], dtype=np.int64)
+        motions = np.array([get_motion(sprite) for sprite in sprites], dtype=np.int64)
+        return sprites, boxes.reshape(len(sprites), 4).T, motions.reshape(len(sprites), 2).T
+
+    def prepare(self, groups):
+        self._boxes = {id(group): (group, *self._box_arrays(group)) for group in groups}
+
+    def _prepared(self, group):
+        prepared = self._boxes.get(id(group))
+        if prepared is None or prepared[0] is not group:
+            return self._box_arrays(group)
+        return prepared[1:]
+
+    def collide_pairs(self, group_a, group_b):
+        first, first_boxes, first_motions = self._prepared(group_a)
+        second, second_boxes, second_motions = self._prepared(group_b)
+        first_indices, second_indices = swept_overlap_pairs(
+            first_boxes, first_motions, second_boxes, second_motions)
+        pixel_precise = self._pixel_precise
+        keep = [first[i] in group_a and second[j] in group_b
+                and (not pixel_precise or pixel_collide(first[i], second[j]))
+                for i, j in zip(first_indices.tolist(), second_indices.tolist())]
+        if not all(keep):
+            keep = np.array(keep, dtype=bool)
+            first_indices, second_indices = first_indices[keep], second_indices[keep]
+        return CollisionPairs(first, second, first_indices, second_indices)
+
+    def groupcollide(self, group_a, group_b, dokill_a, dokill_b):
+        pairs = self.collide_pairs(group_a, group_b)
+        if dokill_b:
+            pairs = pairs.consume_second()
+        collisions = {}
+        for i, j in zip(pairs.first_indices.tolist(), pairs.second_indices.tolist()):
+            collisions.setdefault(pairs.first[i], []).append(pairs.second[j])
+
+        if dokill_a:
+            for sprite in collisions:
+                sprite.kill()
+        if dokill_b:
+            for hits in collisions.values():
+                for sprite in hits:
+                    sprite.kill()
+        return collisions
+
+    def spritecollide(self, sprite, group, dokill):
+        others, boxes, motions = self._prepared(group)
+        rect = sprite.rect
+        dx, dy = get_motion(sprite)
+        _, indices = swept_overlap_pairs(
+            ([rect.x], [rect.y], [rect.width], [rect.height]), ([dx], [dy]),
+            boxes, motions)
+        hits = [others[j] for j in indices.tolist() if others[j] in group
+                and (not self._pixel_precise or pixel_collide(sprite, others[j]))]
+        if dokill:
+            for other in hits:
+                other.kill()
+        return hits
+
+
+def create_collision_detector(collision_mode, pixel_precise=False):
+    """
+    Create the collision detector selected at startup.
+
+    Args:
+        collision_mode: CollisionMode of the game.
+        pixel_precise: Whether the collisions are checked by the sprite masks.
+
+    Returns:
+        A collision detector for the collision checks of the game.
+    """
+    if collision_mode == CollisionMode.SPATIAL_HASH:
+        return SpatialHashCollisionDetector(pixel_precise=pixel_precise)
+    if collision_mode == CollisionMode.SWEEP_AND_PRUNE:
+        return SweepAndPruneCollisionDetector(pixel_precise)
+    if collision_mode == CollisionMode.NUMPY:
+        return NumpyCollisionDetector(pixel_precise)
+    return PygameCollisionDetector(pixel_precise)
@@ -1,10 +1,14 @@
-import os
 import pygame
 from app_enums import GameAttributes
-from config import ASSETS_DIR, BLACK, PLAYER_SPEED, UPPER_BOUNDARY, WHITE, SILVER
+from config import BLACK, PLAYER_SPEED, UPPER_BOUNDARY, WHITE, SILVER
 from models.point import Point
 from models.size import Size
-from ui.game_views.game.animation import AnimationSprite
+from ui.game_views.game.animation import (ANIMATIONS,
+                                          HIT_FRAMES,
+                                          PLAYER_HIT_FRAMES)
+from ui.game_views.game.layers import CachedLayer
+from ui.game_views.game.renderers import create_renderer
+from ui.resources.text_cache import TEXT_CACHE
 from utils.ui_helpers import (get_buffered_size,
                               get_ending_points,
                               get_player_lives,
@@ -20,84 +24,155 @@ class GameDrawer():
         """
         Args:
             game: Game instance, which must have at least:
-                  - screen, font, heart_data, game_groups, player, user
+                  - screen, font, heart_data, game_groups, player, user, options,
+                    interpolator
         """
         self.game = game
         self.screen = game.screen
         self.display_width = game.screen.get_width()
         self.display_height = game.screen.get_height()
         self.font = game.font
+        self.renderer = create_renderer(game.options.render_mode, game.screen)
+        self.background_layer = CachedLayer(self.render_background)
+        self.hearts_layer = CachedLayer(self.render_player_hearts)
+        self.level_title_layer = CachedLayer(self.render_level_title)
 
-    def draw(self):
+    def draw(self, alpha=1.0):
         """
         Renders the game screen.
-        Clears the screen.
-        Draws the player, enemies, bullets, hit animations and instruction text
+        Starts from the cached background with the player name and instruction text.
+        Draws the player, enemies, bullets, points, level, hearts and hit animations.
         Updates the display.
+
+        Args:
+            alpha: Where to draw the moving sprites between the previous (0)
+                   and the current (1) simulation step.
         """
-        self.screen.fill(BLACK)
-        self.game.player.draw(self.screen)
-        self.game.game_groups[GameAttributes.PLAYER_BULLETS].draw(self.screen)
-        self.game.game_groups[GameAttributes.ENEMY_BULLETS].draw(self.screen)
-        self.game.game_groups[GameAttributes.ENEMIES].draw(self.screen)
-        self.draw_player_name()
+        renderer = self.renderer
+        renderer.begin_frame(self.background_layer.get(self.game.user.username))
+        interpolator = self.game.interpolator
+        interpolator.apply(alpha)
+        renderer.blit(self.game.player.image, self.game.player.rect)
+        renderer.draw_group(self.game.game_groups[GameAttributes.PLAYER_BULLETS])
+        renderer.draw_group(self.game.game_groups[GameAttributes.ENEMY_BULLETS])
+        renderer.draw_group(self.game.game_groups[GameAttributes.ENEMIES])
         self.draw_player_points()
         self.draw_level_title()
         self.draw_player_hearts()
-        self.game.game_groups[GameAttributes.HITS].draw(self.screen)
-        self.draw_instructions_text()
-        pygame.display.update()
+        renderer.draw_group(self.game.game_groups[GameAttributes.HITS])
+        renderer.end_frame()
+        interpolator.restore()
+
+    def render_background(self, username):
+        """
+        Render the static background layer: black background,
+        player name and instructions.
+
+        Args:
+            username: The name of the player.
+
+        Returns:
+            Surface: The background layer.
+        """
+        background = pygame.Surface(self.screen.get_size()).convert()
+        background.fill(BLACK)
+        self.draw_player_name(background, username)
+        self.draw_instructions_text(background)
+        return background
+
+    def invalidate(self):
+        """
+        The screen has been drawn outside the game frame (level titles, 
+        animations). The next game frame redraws the whole screen.
+        """
+        self.renderer.invalidate()
+
+    def present_screen(self):
+        """
+        Show what has been drawn directly on the screen (level titles, game over).
+        """
+        self.renderer.present_screen()
+
+    def close(self):
+        """
+        The game has ended. Release what the renderer holds.
+        """
+        self.renderer.close()
 
-    def draw_player_name(self):
+    def draw_player_name(self, surface, username):
         """
-        Draw current player name on screen
+        Draw current player name on the background.
         """
-        text = f"Player: {self.game.user.username}"
-        self.draw_text(text, Point(20, 20), center=False)
+        text = f"Player: {username}"
+        surface.blit(*self.render_text(text, Point(20, 20), center=False))
 
     def draw_level_title(self):
         """
-        Draw current level on screen
+        Draw current level on screen. The title is rendered again
+        only when the level or the high score changes.
+        """
+        level = self.game.start_level_data[GameAttributes.LEVEL]
+        self.renderer.blit(*self.level_title_layer.get(level,
+                                                       self.game.all_time_high_score))
+
+    def render_level_title(self, level, high_score):
         """
+        Args:
+            level: The current level.
+            high_score: The all time high score.
 
-        self.game.all_time_high_score
-        text = f"Level {self.game.start_level_data[GameAttributes.LEVEL]} | High score {self.game.all_time_high_score}"
+        Returns:
+            tuple: (Surface, Rect) of the level title.
+        """
+        text = f"Level {level} | High score {high_score}"
         position = Point((self.display_width // 2 - (len(text) // 2)), 20)
-        self.draw_text(text, position, center=True, color=SILVER)
+        return self.render_text(text, position, center=True, color=SILVER)
 
-    def draw_instructions_text(self):
+    def draw_instructions_text(self, surface):
         """
-        Instructions for the player.
+        Instructions for the player on the background.
         """
         text = "Move the player with 'a' and 'd', Shoot with SPACE"
         y_offset = 40
         position = Point(self.display_width // 2,
                          self.display_height - y_offset)
-        self.draw_text(text, position, center=True)
+        surface.blit(*self.render_text(text, position, center=True))
 
     def draw_player_hearts(self):
         """
         Draw current player hearts and broken hearts on screen.
+        The hearts row is rendered again only when the player's lives change.
         """
         hearts, broken_hearts = get_player_lives(
             self.game.player.player_service)
+        self.renderer.blit(*self.hearts_layer.get(hearts, broken_hearts))
+
+    def render_player_hearts(self, hearts, broken_hearts):
+        """
+        Render the row of hearts and broken hearts.
+        The first heart is on the right.
+
+        Args:
+            hearts: Number of hearts left.
+            broken_hearts: Number of broken hearts.
+
+        Returns:
+            tuple: (Surface, Rect) of the hearts row.
+        """
         x_offset = self.display_width - 30
         y_position = 20
+        heart = self.game.heart_data[GameAttributes.HEARTS]
+        broken = self.game.heart_data[GameAttributes.BROKEN]
 
-        total_hearts = []
-        for h in range(0, hearts):
-            total_hearts.append(1)
+        total_hearts = [heart] * hearts + [broken] * broken_hearts
+        count = max(1, len(total_hearts))
+        width = (count - 1) * 30 + heart.get_width()
+        row = pygame.Surface((width, heart.get_height()), pygame.SRCALPHA)
 
-        for h in range(0, broken_hearts):
-            total_hearts.append(0)
+        for i, image in enumerate(total_hearts):
+            row.blit(image, ((count - 1 - i) * 30, 0))
 
-        for i, h in enumerate(total_hearts):
-            if h == 1:
-                self.screen.blit(self.game.heart_data[GameAttributes.HEARTS],
-                                 (x_offset - i * 30, y_position))
-            else:
-                self.screen.blit(self.game.heart_data[GameAttributes.BROKEN],
-                                 (x_offset - i * 30, y_position))
+        return row, row.get_rect(topleft=(x_offset - (count - 1) * 30, y_position))
 
     def draw_game_over_text(self):
         """
@@ -119,8 +194,7 @@ class GameDrawer():
         player_current_points = self.game.player.player_service.points
         user_statistics = None
         if self.game.user:
-            user_statistics, _ = self.game.user_statistics_service.get_user_statistics(
-                self.game.user.user_id)
+            user_statistics = self.game.session_statistics.user_statistics
 
         data = get_ending_points(player_current_points,
                                  user_statistics,
@@ -134,8 +208,8 @@ class GameDrawer():
         """
         Draws "Level <level_number>".
         """
-        text = self.font.render(
-            f"Level {self.game.start_level_data[GameAttributes.LEVEL]}", True, WHITE)
+        text = TEXT_CACHE.render(
+            self.font, f"Level {self.game.start_level_data[GameAttributes.LEVEL]}", WHITE)
         self.screen.blit(
             text, text.get_rect(center=(self.display_width // 2, self.display_height // 2)))
 
@@ -145,6 +219,7 @@ class GameDrawer():
         """
         clock = pygame.time.Clock()
         group = pygame.sprite.Group(animation_sprite)
+        self.invalidate()
 
         images = animation_sprite.image_count
 
@@ -153,7 +228,7 @@ class GameDrawer():
             group.update()
             self.screen.fill(BLACK)
             group.draw(self.screen)
-            pygame.display.update()
+            self.renderer.present_screen()
             clock.tick(60)
 
     def destroy_player_animation(self):
@@ -175,14 +250,10 @@ class GameDrawer():
             self.wait(5)
 
     def get_player_hit_animation(self, position, player_size):
-        self.image_paths = [os.path.join(
-            ASSETS_DIR, f"player_hit{i}.png") for i in range(1, 9)]
-        return AnimationSprite(position, player_size, self.image_paths, duration=300)
+        return ANIMATIONS.create(PLAYER_HIT_FRAMES, position, player_size, duration=300)
 
     def get_hit_animation(self, position, size):
-        self.image_paths = [os.path.join(
-            ASSETS_DIR, f"hit{i}.png") for i in range(1, 5)]
-        return AnimationSprite(position, size, self.image_paths, duration=200)
+        return ANIMATIONS.create(HIT_FRAMES, position, size, duration=200)
 
     def wait(self, n):
         """
@@ -197,6 +268,7 @@ class GameDrawer():
         """
         clock = pygame.time.Clock()
         current_y = self.game.player.player_service.y
+        self.invalidate()
 
         while current_y > UPPER_BOUNDARY:
             self.game.handle_events()
@@ -206,17 +278,26 @@ class GameDrawer():
             self.screen.fill(BLACK)
             self.game.player.update()
             self.game.player.draw(self.screen)
-            pygame.display.update()
+            self.renderer.present_screen()
             clock.tick(60)
 
     def draw_text(self, text, position: Point, center=False, color=WHITE):
         """
         General method for drawing text on the screen.
         """
-        text_surface = self.font.render(text, True, color)
+        self.renderer.blit(*self.render_text(text, position, center, color))
+
+    def render_text(self, text, position: Point, center=False, color=WHITE):
+        """
+        Render text and place it at the position.
+
+        Returns:
+            tuple: (Surface, Rect) of the text.
+        """
+        text_surface = TEXT_CACHE.render(self.font, text, color)
         rect = text_surface.get_rect()
         if center:
             rect.center = position.x, position.y
         else:
             rect.topleft = position.x, position.y
-        self.screen.blit(text_surface, rect)
+        return text_surface, rect
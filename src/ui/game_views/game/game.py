@@ -1,32 +1,45 @@
+from time import perf_counter
+import numpy as np
 import pygame
-from app_enums import AppState, GameAttributes
-from config import (BULLET_POINTS_COEFFICIENT,
+from app_enums import AppState, GameAttributes, GameEventType, LoopMode
+from config import (GAME_FPS,
                     ENEMY_WIDTH, ENEMY_HEIGHT,
                     ENEMY_START_Y_OFFSET, BLACK,
                     ENEMY_START_X_OFFSET)
 from db import Database
 from entities.user import User
+from models.game_options import GameOptions
 from models.point import Point
 from models.size import Size
 from repositories.general_statistics_repository import GeneralStatisticsRepository
 from repositories.user_repository import UserRepository
 from repositories.user_statistics_repository import UserStatisticsRepository
+from services.clock import TickClock
+from services.ecs_systems import MovementSystem
+from services.ecs_world import World
 from services.enemy_service import EnemyService
+from services.event_bus import EventBus
+from services.fire_scheduler import FireScheduler
+from services.fixed_timestep import FixedTimestep
+from services.formation import Formation
 from services.general_statistics_service import GeneralStatisticsService
+from services.session_statistics_service import SessionStatisticsService
 from services.user_service import UserService
 from services.user_statistics_service import UserStatisticsService
 from services.level_service import LevelService
+from ui.game_views.game.collisions import create_collision_detector
 from ui.game_views.game.draw import GameDrawer
+from ui.game_views.game.interpolation import SpriteInterpolator
 from ui.game_views.game.init import (create_player,
                                      init_display,
                                      init_game_groups,
                                      init_game_info,
+                                     init_sprite_images,
                                      init_ui_images)
 from utils.ui_helpers import (get_buffered_size,
                               get_game_over_initialization_data,
                               init_high_score,
-                              init_start_level_attributes,
-                              set_new_level_attributes)
+                              init_start_level_attributes)
 from ui.sprites.enemy import EnemySprite
 
 
@@ -38,19 +51,21 @@ class Game:
     and rendering the screen including the player and on-screen instructions.
     """
 
-    def __init__(self, screen, user=None, user_service=None, user_statistics_service=None):
+    def __init__(self, screen, user=None, user_service=None, user_statistics_service=None,
+                 options=None, general_statistics_service=None):
         """
         Initializes the game, including the display, player, clock, and font.
         Sets up the game window and player object.
         """
+        self.options = options if options else GameOptions()
 
         self.user_service = user_service if user_service else UserService(
             UserRepository(Database()))
         self.user_statistics_service = user_statistics_service if user_statistics_service else UserStatisticsService(
             UserStatisticsRepository(Database()))
-        self.general_statistics_service = GeneralStatisticsService(
+        self.general_statistics_service = general_statistics_service if general_statistics_service else GeneralStatisticsService(
             GeneralStatisticsRepository(Database()))
-        self.user = self.set_user(user)
+        self.set_user(user)
         self.reset_game(screen)
         self.drawer = GameDrawer(self)
 
@@ -70,36 +85,100 @@ class Game:
                 self.game_over()
                 self.reset_game(self.screen)
                 pygame.time.wait(2000)
+                self.drawer.close()
                 return AppState.START_SCREEN
             elif not self.start_level_data[GameAttributes.LEVEL_STARTED]:
                 self.start_new_level()
             else:
-                self.update()
-                self.check_sprite_collisions()
-                self.move_to_next_level()
-                self.draw()
-                self.clock.tick(60)
+                self.play_frame()
 
+        self.drawer.close()
         return AppState.QUIT
 
+    def play_frame(self):
+        """
+        Run the simulation and draw one frame as selected by the loop mode.
+
+        FRAME: one simulation step and one frame, at most GAME_FPS per second.
+        FIXED: the steps follow the real time at GAME_FPS steps per second.
+               A slow frame is followed by several steps (frames are skipped),
+               and the frame is drawn between the last two steps.
+        UNCAPPED: the steps run as fast as they can, and a frame is drawn
+                  only when GAME_FPS frames per second are due.
+        """
+        loop_mode = self.options.loop_mode
+        if loop_mode == LoopMode.FIXED:
+            steps = self.timestep.advance(self.clock.tick(GAME_FPS) / 1000)
+            for _ in range(steps):
+                self.interpolator.snapshot(self.get_moving_sprites())
+                if not self.step():
+                    break
+            self.draw(self.timestep.alpha)
+        elif loop_mode == LoopMode.UNCAPPED:
+            self.step()
+            now = perf_counter()
+            if self.frame_pacer.advance(now - self.last_frame_time):
+                self.draw()
+            self.last_frame_time = now
+        else:
+            self.step()
+            self.draw()
+            self.clock.tick(GAME_FPS)
+
+    def step(self):
+        """
+        Advance the simulation by one fixed step:
+        update, collisions and the level change.
+
+        Returns:
+            bool: True if the level goes on after the step.
+        """
+        self.update()
+        self.check_sprite_collisions()
+        self.move_to_next_level()
+        return (self.start_level_data[GameAttributes.LEVEL_STARTED]
+                and not self.gameover_data[GameAttributes.GAMEOVER]
+                and not self.is_game_over())
+
+    def get_moving_sprites(self):
+        """
+        Returns:
+            list: The player, the bullets and the enemies, which are interpolated.
+        """
+        sprites = [self.player]
+        for group in (GameAttributes.PLAYER_BULLETS,
+                      GameAttributes.ENEMY_BULLETS,
+                      GameAttributes.ENEMIES):
+            sprites.extend(self.game_groups[group])
+        return sprites
+
     def update(self):
         """
         Update the game state. 
-        This happens on every game loop.
+        This happens on every simulation step.
         """
+        self.tick_clock.advance()
         self.player.handle_input()
+        self.player.update()
+        self.movement.move_bullets(self.world)
+        self.formation.update()
+        self.fire_enemies()
         self.game_groups[GameAttributes.PLAYER_BULLETS].update()
         self.game_groups[GameAttributes.ENEMY_BULLETS].update()
         self.game_groups[GameAttributes.ENEMIES].update()
         self.game_groups[GameAttributes.HITS].update()
 
-    def draw(self):
+    def draw(self, alpha=1.0):
         """
         Draw game background, player, enemies, bullets and animations on screen. 
-        This happens on every game loop.
+        This happens on every rendered frame.
         All drawing is handled in a separate GameDrawer class. 
+
+        Args:
+            alpha: Where to draw the moving sprites between the previous (0)
+                   and the current (1) simulation step.
         """
-        self.drawer.draw()
+        self.drawer.draw(alpha)
 
     ################## INIT ######################
 
@@ -119,13 +198,34 @@ class Game:
         self.gameover_data = get_game_over_initialization_data()
         self.all_time_high_score = init_high_score(
             self.general_statistics_service)
+        self.session_statistics = SessionStatisticsService(
+            self.user_statistics_service)
+        self.session_statistics.load(self.get_statistics_user_id())
+        self.events = EventBus()
+        self.collision_detector = create_collision_detector(self.options.collision_mode,
+                                                            self.options.pixel_collisions)
+        self.subscribe_event_consumers()
 
         self.heart_data = init_ui_images()
+        init_sprite_images()
         self.init_levels()
         self.game_groups = init_game_groups()
+        self.world = World()
+        self.movement = MovementSystem()
+        self.rng = np.random.default_rng(self.options.seed)
+        self.formation = Formation()
+        self.wave = []
+        self.tick_clock = TickClock()
+        self.fire_scheduler = FireScheduler(0, rng=self.rng, clock=self.tick_clock)
+        self.timestep = FixedTimestep()
+        self.frame_pacer = FixedTimestep(max_steps=1)
+        self.last_frame_time = perf_counter()
+        self.interpolator = SpriteInterpolator()
         self.player = create_player(self.display_width,
                                     self.display_height,
-                                    self.game_groups)
+                                    self.game_groups,
+                                    self.world.bullets,
+                                    self.tick_clock)
 
     def init_levels(self):
         """
@@ -141,8 +241,7 @@ class Game:
         level service.
         """
         level = self.start_level_data[GameAttributes.LEVEL]
-        current_level = self.levels.get_level(level)
-        self.enemy_attributes = set_new_level_attributes(current_level)
+        self.level_spec = self.levels.get_level(level)
 
     def create_enemies(self, spacing=60):
         """
@@ -151,24 +250,31 @@ class Game:
         Args: 
             spacing: spacing between each enemy
         """
-        rows = self.enemy_attributes[GameAttributes.ROWS]
-        cols = self.enemy_attributes[GameAttributes.COLS]
-        enemy_shooting_probability = self.enemy_attributes[GameAttributes.SHOOT_PROB]
-        enemy_image = self.enemy_attributes[GameAttributes.IMAGE]
+        level_spec = self.level_spec
         margin_x = ENEMY_START_X_OFFSET
         margin_y = ENEMY_START_Y_OFFSET
 
-        for row in range(rows):
-            for col in range(cols):
+        for row in range(level_spec.rows):
+            for col in range(level_spec.cols):
                 x = margin_x + col * spacing
                 y = margin_y + row * spacing
 
                 enemy_sprite = EnemySprite(
                     self.get_enemy_service(x, y),
                     self.game_groups[GameAttributes.ENEMY_BULLETS],
-                    enemy_shooting_probability, enemy_image)
+                    self.world.bullets,
+                    level_spec.image)
                 self.game_groups[GameAttributes.ENEMIES].add(enemy_sprite)
 
+        self.wave = list(self.game_groups[GameAttributes.ENEMIES])
+        self.formation = Formation(enemy.enemy_service for enemy in self.wave)
+        self.fire_scheduler = FireScheduler(
+            len(self.wave),
+            level_spec.shooting_probability,
+            level_spec.cooldown,
+            rng=self.rng,
+            clock=self.tick_clock)
+
     def get_enemy_service(self, x, y):
         """
         Create a new enemy service for each enemy.
@@ -180,27 +286,33 @@ class Game:
         Returns:
             enemy_service
         """
-        enemy_width = ENEMY_WIDTH
-        enemy_height = ENEMY_HEIGHT
-        speed = self.enemy_attributes[GameAttributes.SPEED]
-        enemy_max_hits = self.enemy_attributes[GameAttributes.MAX_HITS]
-        enemy_cooldown = self.enemy_attributes[GameAttributes.COOLDOWN]
+        level_spec = self.level_spec
 
         return EnemyService.create(Point(x, y),
-                                   Size(enemy_width,
-                                        enemy_height),
-                                   speed,
-                                   enemy_max_hits,
-                                   enemy_cooldown)
+                                   Size(ENEMY_WIDTH,
+                                        ENEMY_HEIGHT),
+                                   level_spec.speed,
+                                   level_spec.max_hits,
+                                   level_spec.cooldown,
+                                   self.tick_clock)
 
     def new_level_reset(self):
         """
         Reset level attributes before it begins.
         """
-        self.game_groups[GameAttributes.PLAYER_BULLETS].empty()
-        self.game_groups[GameAttributes.ENEMY_BULLETS].empty()
+        for group in (GameAttributes.PLAYER_BULLETS,
+                      GameAttributes.ENEMY_BULLETS,
+                      GameAttributes.HITS):
+            # kill instead of empty so that the sprites go back to their pools
+            for sprite in self.game_groups[group].sprites():
+                sprite.kill()
+        self.world.clear()
         self.game_groups[GameAttributes.ENEMIES].empty()
-        self.game_groups[GameAttributes.HITS].empty()
+        self.formation = Formation()
+        self.wave = []
+        self.fire_scheduler = FireScheduler(0, rng=self.rng, clock=self.tick_clock)
+        self.timestep.reset()
+        self.interpolator.clear()
         self.start_level_data[GameAttributes.TRANSITION_TIMER] = 0
         self.start_level_data[GameAttributes.LEVEL_COUNTDOWN] = 3
         self.start_level_data[GameAttributes.TICKS_REMAINING] = 180
@@ -208,6 +320,13 @@ class Game:
 
     ########################### UPDATE ###########################
 
+    def fire_enemies(self):
+        """
+        Let the enemies picked by the fire scheduler shoot.
+        """
+        for slot in self.fire_scheduler.select(self.formation.alive):
+            self.wave[slot].fire()
+
     def handle_events(self):
         """
         Handles user input events such as closing the game window.
@@ -219,142 +338,194 @@ class Game:
 
     def check_sprite_collisions(self):
         """
-        Check all collisions per game loop.
+        Check all collisions per game tick. The checks emit events,
+        which are handled in one batch by the event bus consumers.
         """
+        self.collision_detector.prepare((self.game_groups[GameAttributes.ENEMIES],
+                                         self.game_groups[GameAttributes.PLAYER_BULLETS],
+                                         self.game_groups[GameAttributes.ENEMY_BULLETS]))
         self.check_enemy_and_player_bullet_collisions()
         self.check_enemy_bullet_and_player_bullet_collisions()
         self.check_player_and_enemy_bullet_collisions()
         self.check_player_and_enemies_collisions()
+        self.events.dispatch()
 
     def check_player_and_enemies_collisions(self):
-        hits = pygame.sprite.spritecollide(
+        hits = self.collision_detector.spritecollide(
             self.player, self.game_groups[GameAttributes.ENEMIES], dokill=True)
 
         if hits:
-            self.player.player_service.add_hit()
-
-            position = self.player.rect.center
-            size = self.player.player_service.size
-            explosion = self.drawer.get_hit_animation(position, size)
-            self.game_groups[GameAttributes.HITS].add(explosion)
-
-            if self.player.is_dead():
-                self.player.kill()
+            self.events.emit(GameEventType.PLAYER_HIT,
+                             self.player.rect.center,
+                             self.player.player_service.size)
 
     def check_player_and_enemy_bullet_collisions(self):
         """
         Handle player collisions with enemy bullets.
         """
-        collisions = pygame.sprite.spritecollide(
+        collisions = self.collision_detector.spritecollide(
             self.player, self.game_groups[GameAttributes.ENEMY_BULLETS], dokill=True)
 
         if collisions:
-            self.player.player_service.add_hit()
-
-            position = self.player.rect.center
-            size = self.player.player_service.size
-            explosion = self.drawer.get_hit_animation(position, size)
-            self.game_groups[GameAttributes.HITS].add(explosion)
-
-            if self.player.is_dead():
-                self.player.kill()
+            self.events.emit(GameEventType.PLAYER_HIT,
+                             self.player.rect.center,
+                             self.player.player_service.size)
 
     def check_enemy_and_player_bullet_collisions(self):
         """
-        Handle enemy collisions with player bullets. 
-        First get all player bullets. 
-        Then check collisions with each enemy.
-        Using pygame group collisions. 
-        Remove enemy.
-        Remove bullet.
+        Handle enemy collisions with player bullets.
+        Get the colliding (enemy, bullet) index pairs from the detector.
+        A bullet hits only the first enemy it collides with.
+        Remove the bullets.
+        Add one hit per bullet to each enemy and remove the dead enemies.
         """
-        collisions = pygame.sprite.groupcollide(
+        pairs = self.collision_detector.collide_pairs(
             self.game_groups[GameAttributes.ENEMIES],
-            self.game_groups[GameAttributes.PLAYER_BULLETS],
-            False,
-            True
-        )
+            self.game_groups[GameAttributes.PLAYER_BULLETS]).consume_second()
 
-        if collisions:
-            for enemy, bullets in collisions.items():
-                for _ in bullets:
-                    self.try_kill_enemy(enemy)
+        for index in np.unique(pairs.second_indices).tolist():
+            pairs.second[index].kill()
+
+        enemy_indices, hits = np.unique(pairs.first_indices, return_counts=True)
+        for index, count in zip(enemy_indices.tolist(), hits.tolist()):
+            enemy = pairs.first[index]
+            for _ in range(count):
+                self.try_kill_enemy(enemy)
 
-                position = enemy.rect.center
-                size = enemy.enemy_service.size
-                explosion = self.drawer.get_hit_animation(position, size)
-                self.game_groups[GameAttributes.HITS].add(explosion)
+            self.events.emit(GameEventType.ENEMY_HIT,
+                             enemy.rect.center,
+                             enemy.enemy_service.size)
 
     def try_kill_enemy(self, enemy):
         """
         Add a hit to an enemy. 
         Check if enemy is dead. If yes, remove enemy from
-        the class enemy group. Also, increase player points.
+        the class enemy group and emit a kill event.
         """
         enemy.enemy_service.add_hit()
         if enemy.is_dead():
-            self.increase_player_points()
+            enemy.enemy_service.leave_formation()
             enemy.remove(self.game_groups[GameAttributes.ENEMIES])
+            self.events.emit(GameEventType.ENEMY_KILLED,
+                             enemy.rect.center,
+                             enemy.enemy_service.size)
 
-    def increase_player_points(self, coefficient=1):
+    def increase_player_points(self, points=None):
         """
-        Add points to player multiplied by the coefficient.
+        Add points to player.
 
         Args: 
-            coefficient: points are multiplied by the coefficient.
+            points: How many points. Defaults to the points of one enemy of the level.
         """
-        level_enemy = self.enemy_attributes[GameAttributes.IMAGE]
-        points_char = ''.join([char for char in level_enemy if char in "123"])
-        points = int(points_char)
-        self.player.player_service.add_points(
-            points * coefficient)
+        if points is None:
+            points = self.level_spec.points
+        self.player.player_service.add_points(points)
 
     def check_enemy_bullet_and_player_bullet_collisions(self):
         """
         Handle enemy bullet collisions with player bullets.
+        A player bullet hits only the first enemy bullet it collides with.
         Remove enemy bullet.
         Remove player bullet.
         """
-        collisions = pygame.sprite.groupcollide(
+        pairs = self.collision_detector.collide_pairs(
             self.game_groups[GameAttributes.ENEMY_BULLETS],
-            self.game_groups[GameAttributes.PLAYER_BULLETS],
-            True,
-            True
-        )
+            self.game_groups[GameAttributes.PLAYER_BULLETS]).consume_second()
 
-        if collisions:
-            for enemy_bullet, player_bullet in collisions.items():
-                position = enemy_bullet.rect.center
-                buffered_size = get_buffered_size(enemy_bullet.bullet.size,
-                                                  10)
-                explosion = self.drawer.get_hit_animation(
-                    position, buffered_size)
-                self.increase_player_points(BULLET_POINTS_COEFFICIENT)
-                self.game_groups[GameAttributes.HITS].add(explosion)
+        for index in np.unique(pairs.second_indices).tolist():
+            pairs.second[index].kill()
+
+        for index in np.unique(pairs.first_indices).tolist():
+            enemy_bullet = pairs.first[index]
+            enemy_bullet.kill()
+            self.events.emit(GameEventType.BULLET_HIT,
+                             enemy_bullet.rect.center,
+                             enemy_bullet.size)
+
+    ########################### EVENTS ###########################
+
+    def subscribe_event_consumers(self):
+        """
+        Connect the consumers of the gameplay events. They are called
+        in this order once per tick with all events of the tick.
+        """
+        self.events.subscribe(self.score_events)
+        self.events.subscribe(self.show_hit_effects)
+        self.events.subscribe(self.damage_player)
+        self.events.subscribe(self.session_statistics.record_events)
+
+    def score_events(self, events):
+        """
+        Give the player the points of the killed enemies and
+        the shot down enemy bullets of a tick.
+        """
+        kills = 0
+        bullets = 0
+        for event in events:
+            if event.type == GameEventType.ENEMY_KILLED:
+                kills += 1
+            elif event.type == GameEventType.BULLET_HIT:
+                bullets += 1
+        points = kills * self.level_spec.points + bullets * self.level_spec.bullet_points
+        if points:
+            self.increase_player_points(points)
+
+    def show_hit_effects(self, events):
+        """
+        Start a hit animation for every hit of a tick.
+        """
+        explosions = []
+        for event in events:
+            if event.type == GameEventType.ENEMY_KILLED:
+                continue
+            size = event.size
+            if event.type == GameEventType.BULLET_HIT:
+                size = get_buffered_size(size, 10)
+            explosions.append(self.drawer.get_hit_animation(event.position, size))
+        if explosions:
+            self.game_groups[GameAttributes.HITS].add(*explosions)
+
+    def damage_player(self, events):
+        """
+        Add a hit to the player for every player hit of a tick.
+        Remove the player if it is dead.
+        """
+        for event in events:
+            if event.type == GameEventType.PLAYER_HIT:
+                self.player.player_service.add_hit()
+        if self.player.is_dead():
+            self.player.kill()
 
     def save_user_statistics(self):
         """
         Saves the player's score and level to the database if they are better than previous.
+        The session statistics snapshot is refreshed with the saved statistics.
         """
         if not self.user_statistics_service:
             return
 
-        user_id = self.user.user_id if self.user and self.user.user_id != 0 else 1
         points = self.player.player_service.points
         level = self.start_level_data[GameAttributes.LEVEL]
 
-        self.user_statistics_service.upsert_user_statistics(
-            user_id, points, level)
+        self.session_statistics.save(points, level)
+
+    def get_statistics_user_id(self):
+        """
+        Returns:
+            user_id: The user whose statistics are shown and saved. Guest if no user.
+        """
+        return self.user.user_id if self.user and self.user.user_id != 0 else 1
 
     def move_to_next_level(self):
         """
         Check if all enemies in the level are dead. 
         If the level was the last, player won the game.
-        Else move to the next level.
+        Else move to the next level. In endless mode there is no last level.
         """
         if not self.game_groups[GameAttributes.ENEMIES]:
             self.start_level_data[GameAttributes.LEVEL] += 1
-            if self.start_level_data[GameAttributes.LEVEL] > self.levels.get_final_level():
+            if (not self.options.endless
+                    and self.start_level_data[GameAttributes.LEVEL] > self.levels.get_final_level()):
                 self.win_game()
             else:
                 self.new_level_reset()
@@ -370,14 +541,15 @@ class Game:
             self.start_level_data[GameAttributes.TRANSITION_TIMER] = 1
             self.start_level_data[GameAttributes.TICKS_REMAINING] = 60
 
+        self.drawer.invalidate()
         self.screen.fill(BLACK)
 
         if self.start_level_data[GameAttributes.TICKS_REMAINING] > 0:
             self.drawer.draw_next_level_title()
-            pygame.display.update()
+            self.drawer.present_screen()
 
             self.start_level_data[GameAttributes.TICKS_REMAINING] -= 1
-            self.clock.tick(60)
+            self.clock.tick(GAME_FPS)
         else:
             self.start_level_data[GameAttributes.LEVEL_STARTED] = True
             self.start_level_data[GameAttributes.TRANSITION_TIMER] = 0
@@ -405,12 +577,13 @@ class Game:
         Draw player received points. 
         Update display.
         """
+        self.drawer.invalidate()
         self.screen.fill(BLACK)
         self.drawer.draw_game_over_text()
         points_position = Point(self.display_width//2,
                                 self.display_height//2 + 40)
         self.drawer.draw_player_points(position=points_position, center=True)
-        pygame.display.update()
+        self.drawer.present_screen()
 
     def is_game_over(self):
         """
@@ -1,8 +1,10 @@
 import pygame
 from pygame.sprite import Group
-import os
 from app_enums import GameAttributes
-from config import (ASSETS_DIR,
+from config import (BULLET_HEIGHT,
+                    BULLET_WIDTH,
+                    ENEMY_HEIGHT,
+                    ENEMY_WIDTH,
                     PLAYER_HEIGHT,
                     PLAYER_START_Y_OFFSET,
                     PLAYER_WIDTH)
@@ -10,8 +12,13 @@ from models.hit import Hit
 from models.point import Point
 from models.size import Size
 from models.sprite_info import SpriteInfo
+from services.bullet_pool import BulletPool
 from services.player_service import PlayerService
+from ui.game_views.game.animation import ANIMATIONS, HIT_FRAMES
+from ui.resources.surface_cache import SURFACE_CACHE, preload_game_images
+from ui.resources.text_cache import get_font
 from ui.sprites.player import PlayerSprite
+from utils.ui_helpers import get_buffered_size
 
 
 def init_display(screen):
@@ -28,7 +35,7 @@ def init_game_info():
     Initialize pygame information
     """
     clock = pygame.time.Clock()
-    font = pygame.font.Font(None, 30)
+    font = get_font(30)
     return clock, font
 
 
@@ -37,19 +44,24 @@ def init_ui_images():
     Load and scale the heart and broken-heart images.
     Returns a tuple (heart_image, broken_heart_image).
     """
-    heart = pygame.image.load(
-        os.path.join(ASSETS_DIR, "heart.png")
-    ).convert_alpha()
-    broken = pygame.image.load(
-        os.path.join(ASSETS_DIR, "broken_heart.png")
-    ).convert_alpha()
-
-    heart = pygame.transform.scale(heart, (25, 25))
-    broken = pygame.transform.scale(broken, (25, 25))
+    heart_size = Size(25, 25)
+    heart = SURFACE_CACHE.get("heart.png", heart_size)
+    broken = SURFACE_CACHE.get("broken_heart.png", heart_size)
 
     return {GameAttributes.HEARTS: heart, GameAttributes.BROKEN: broken}
 
 
+def init_sprite_images():
+    """
+    Load all player, bullet and enemy images and the explosion frames
+    once so that spawning sprites during the game does not touch the disk.
+    """
+    preload_game_images()
+    ANIMATIONS.get_frames(HIT_FRAMES, Size(ENEMY_WIDTH, ENEMY_HEIGHT))
+    ANIMATIONS.get_frames(HIT_FRAMES, get_buffered_size(
+        Size(BULLET_WIDTH, BULLET_HEIGHT), 10))
+
+
 def init_game_groups():
     """
     Initialize all pygame groups. 
@@ -62,14 +74,20 @@ def init_game_groups():
     }
 
 
-def create_player(display_width, display_height, game_groups):
+def create_player(display_width, display_height, game_groups, bullet_pool: BulletPool,
+                  clock=None):
     """
     Create new player with constant values.
+
+    Args:
+        clock: Gives the time for the shooting cooldown. Defaults to the wall clock.
     """
     player_position = Point(display_width // 2,
                             display_height - PLAYER_START_Y_OFFSET)
     player_size = Size(PLAYER_WIDTH, PLAYER_HEIGHT)
     player_service = PlayerService.create(player_position,
-                                          player_size)
+                                          player_size,
+                                          clock=clock)
 
-    return PlayerSprite(player_service, game_groups[GameAttributes.PLAYER_BULLETS])
+    return PlayerSprite(player_service, game_groups[GameAttributes.PLAYER_BULLETS],
+                        bullet_pool)
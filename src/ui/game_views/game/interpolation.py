@@ -0,0 +1,71 @@
+from config import INTERPOLATION_MAX_DISTANCE
+
+
+class SpriteInterpolator():
+    """
+    Draws the sprites between their last two simulation states.
+
+    Before a simulation step the positions of the sprites are saved.
+    When a frame is drawn, each sprite is moved for the drawing to the
+    point between its saved and its current position, and moved back
+    after the drawing, so the game state is never changed.
+
+    Sprites that were just created, or that jumped further than
+    max_distance (a pooled sprite reused for a new bullet, an enemy
+    dropping a row), are drawn at their current position.
+    """
+
+    def __init__(self, max_distance=INTERPOLATION_MAX_DISTANCE):
+        """
+        Args:
+            max_distance: Longest move in pixels that is interpolated.
+        """
+        self._max_distance = max_distance
+        self._previous = {}
+        self._moved = []
+
+    def snapshot(self, sprites):
+        """
+        Save the positions of the sprites before a simulation step.
+
+        Args:
+            sprites: Iterable of sprites that have a rect.
+        """
+        self._previous = {sprite: sprite.rect.topleft for sprite in sprites}
+
+    def apply(self, alpha):
+        """
+        Move the saved sprites between their previous and current position.
+
+        Args:
+            alpha: 0 draws the previous state, 1 the current state.
+        """
+        self._moved = []
+        if alpha >= 1:
+            return
+        max_distance = self._max_distance
+        for sprite, (previous_x, previous_y) in self._previous.items():
+            rect = sprite.rect
+            x, y = rect.topleft
+            if x == previous_x and y == previous_y:
+                continue
+            if abs(x - previous_x) > max_distance or abs(y - previous_y) > max_distance:
+                continue
+            self._moved.append((rect, x, y))
+            rect.topleft = (round(previous_x + (x - previous_x) * alpha),
+                            round(previous_y + (y - previous_y) * alpha))
+
+    def restore(self):
+        """
+        Move the sprites back to their current position after drawing.
+        """
+        for rect, x, y in self._moved:
+            rect.topleft = (x, y)
+        self._moved = []
+
+    def clear(self):
+        """
+        Forget the saved positions, e.g. when the level changes.
+        """
+        self._previous = {}
+        self._moved = []
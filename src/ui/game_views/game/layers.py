@@ -0,0 +1,49 @@
+class CachedLayer:
+    """
+    A pre-rendered part of the game screen that is rendered again
+    only when its inputs change.
+
+    The render function gets the inputs as arguments and returns the
+    layer (usually a surface or a (surface, rect) pair).
+    """
+
+    def __init__(self, render_function):
+        """
+        Args:
+            render_function: Function that renders the layer from its inputs.
+        """
+        self._render_function = render_function
+        self._inputs = None
+        self._layer = None
+        self._render_count = 0
+
+    @property
+    def render_count(self):
+        """
+        Returns:
+            int: How many times the layer has been rendered.
+        """
+        return self._render_count
+
+    def get(self, *inputs):
+        """
+        Get the layer for the given inputs.
+
+        Args:
+            inputs: Values the layer depends on.
+
+        Returns:
+            The cached layer, rendered again if the inputs have changed.
+        """
+        if self._layer is None or inputs != self._inputs:
+            self._layer = self._render_function(*inputs)
+            self._inputs = inputs
+            self._render_count += 1
+        return self._layer
+
+    def invalidate(self):
+        """
+        Render the layer again on the next get.
+        """
+        self._layer = None
+        self._inputs = None
@@ -0,0 +1,167 @@
+import pygame
+from app_enums import RenderMode
+from config import BLACK
+from ui.game_views.game.texture_renderer import TextureRenderer
+
+
+class FullRedrawRenderer:
+    """
+    Draws surfaces on the game screen and pushes the whole screen
+    to the display once per frame.
+    """
+
+    def __init__(self, screen):
+        """
+        Args:
+            screen: The pygame screen surface to draw on.
+        """
+        self.screen = screen
+
+    def begin_frame(self, background=None):
+        """
+        Clear the screen before the frame is drawn.
+
+        Args:
+            background: A screen-sized surface to start from. Black if not given.
+        """
+        if background is None:
+            self.screen.fill(BLACK)
+        else:
+            self.screen.blit(background, (0, 0))
+
+    def blit(self, surface, position):
+        """
+        Draw a surface on the screen.
+
+        Args:
+            surface: The surface to draw.
+            position: A pygame.Rect or (x, y) top left corner.
+
+        Returns:
+            pygame.Rect: The area of the screen that was drawn.
+        """
+        return self.screen.blit(surface, position)
+
+    def draw_group(self, group):
+        """
+        Draw all sprites of a sprite group.
+
+        Args:
+            group: A pygame sprite group.
+
+        Returns:
+            list: The areas of the screen that were drawn.
+        """
+        return self.screen.blits([(sprite.image, sprite.rect) for sprite in group])
+
+    def end_frame(self):
+        """
+        Push the drawn frame to the display.
+        """
+        pygame.display.update()
+
+    def present_screen(self):
+        """
+        Push what has been drawn directly on the screen to the display,
+        e.g. level titles and the game over screen.
+        """
+        pygame.display.update()
+
+    def invalidate(self):
+        """
+        Something else has drawn on the screen.
+        The next frame must redraw everything.
+        """
+
+    def close(self):
+        """
+        The game has ended. Nothing to release.
+        """
+
+
+class DirtyRectRenderer(FullRedrawRenderer):
+    """
+    Draws surfaces on the game screen but only clears and pushes
+    the areas that changed since the previous frame.
+
+    The areas drawn in the previous frame are cleared at the start
+    of the frame. At the end of the frame both the previous and the
+    current areas are pushed to the display.
+    """
+
+    def __init__(self, screen):
+        super().__init__(screen)
+        self._previous_rects = []
+        self._current_rects = []
+        self._full_redraw = True
+
+    def begin_frame(self, background=None):
+        """
+        Clear the areas drawn in the previous frame by restoring them
+        from the background. After invalidation the whole screen is cleared.
+
+        Args:
+            background: A screen-sized surface to restore from. Black if not given.
+        """
+        if self._full_redraw:
+            super().begin_frame(background)
+            return
+        for rect in self._previous_rects:
+            if background is None:
+                self.screen.fill(BLACK, rect)
+            else:
+                self.screen.blit(background, rect, rect)
+
+    def blit(self, surface, position):
+        rect = super().blit(surface, position)
+        self._current_rects.append(rect)
+        return rect
+
+    def draw_group(self, group):
+        rects = super().draw_group(group)
+        self._current_rects.extend(rects)
+        return rects
+
+    def end_frame(self):
+        """
+        Push only the changed areas to the display.
+        After invalidation the whole display is updated.
+        """
+        if self._full_redraw:
+            pygame.display.update()
+            self._full_redraw = False
+        else:
+            pygame.display.update(self._previous_rects + self._current_rects)
+        self._previous_rects = self._current_rects
+        self._current_rects = []
+
+    def invalidate(self):
+        self._full_redraw = True
+        self._previous_rects = []
+        self._current_rects = []
+
+    @property
+    def dirty_rect_count(self):
+        """
+        Returns:
+            int: How many areas were drawn in the previous frame.
+        """
+        return len(self._previous_rects)
+
+
+def create_renderer(render_mode, screen):
+    """
+    Create the renderer selected at startup.
+
+    Args:
+        render_mode: RenderMode of the game.
+        screen: The pygame screen surface to draw on.
+
+    Returns:
+        A renderer for the game screen.
+    """
+    if render_mode == RenderMode.DIRTY:
+        return DirtyRectRenderer(screen)
+    if render_mode == RenderMode.TEXTURE:
+        return TextureRenderer(screen)
+    return FullRedrawRenderer(screen)
@@ -0,0 +1,139 @@
+import weakref
+import pygame
+from pygame._sdl2 import video
+from config import BLACK
+
+
+class TextureRenderer:
+    """
+    Draws the game screen with SDL textures instead of software blits.
+
+    SDL does not allow a texture renderer on a window that already has
+    a display surface, so the game screen is shown in its own window while
+    the game runs. The menu window is hidden meanwhile and shown again
+    when the renderer is closed.
+
+    Every surface is uploaded to a texture the first time it is drawn.
+    The texture is kept as long as the surface exists, so the drawn
+    surfaces must not be changed afterwards. This is true for the images
+    of the surface cache, the text cache and the cached layers.
+    """
+
+    def __init__(self, screen):
+        """
+        Args:
+            screen: The pygame screen surface. Used for its size and for
+                    the screens that are drawn directly on it.
+        """
+        self.screen = screen
+        self._window = None
+        self._renderer = None
+        self._textures = weakref.WeakKeyDictionary()
+
+    def _open(self):
+        """
+        Open the game window on top of the menu window on first use.
+        """
+        if self._renderer is not None:
+            return
+        display_window = video.Window.from_display_module()
+        self._window = video.Window(pygame.display.get_caption()[0],
+                                    size=self.screen.get_size(),
+                                    position=display_window.position)
+        self._renderer = video.Renderer(self._window)
+        display_window.hide()
+
+    def _get_texture(self, surface):
+        """
+        Args:
+            surface: A surface that does not change after it is drawn.
+
+        Returns:
+            Texture: The surface uploaded to the GPU (or SDL's software renderer).
+        """
+        texture = self._textures.get(surface)
+        if texture is None:
+            texture = video.Texture.from_surface(self._renderer, surface)
+            self._textures[surface] = texture
+        return texture
+
+    def begin_frame(self, background=None):
+        """
+        Clear the frame.
+
+        Args:
+            background: A screen-sized surface to start from. Black if not given.
+        """
+        self._open()
+        if background is None:
+            self._renderer.draw_color = (*BLACK, 255)
+            self._renderer.clear()
+        else:
+            self._get_texture(background).draw()
+
+    def blit(self, surface, position):
+        """
+        Draw a surface on the frame.
+
+        Args:
+            surface: The surface to draw.
+            position: A pygame.Rect or (x, y) top left corner.
+
+        Returns:
+            pygame.Rect: The area of the frame that was drawn.
+        """
+        rect = surface.get_rect(topleft=tuple(position)[:2])
+        self._get_texture(surface).draw(dstrect=rect)
+        return rect
+
+    def draw_group(self, group):
+        """
+        Draw all sprites of a sprite group.
+
+        Args:
+            group: A pygame sprite group.
+
+        Returns:
+            list: The areas of the frame that were drawn.
+        """
+        return [self.blit(sprite.image, sprite.rect) for sprite in group]
+
+    def end_frame(self):
+        """
+        Show the drawn frame.
+        """
+        self._renderer.present()
+
+    def present_screen(self):
+        """
+        Show what has been drawn directly on the screen surface,
+        e.g. level titles and the game over screen.
+        The screen changes every time, so its texture is not kept.
+        """
+        self._open()
+        video.Texture.from_surface(self._renderer, self.screen).draw()
+        self._renderer.present()
+
+    def invalidate(self):
+        """
+        Every frame is drawn from scratch, nothing to forget.
+        """
+
+    def close(self):
+        """
+        Close the game window and show the menu window again.
+        """
+        if self._renderer is None:
+            return
+        self._textures.clear()
+        self._renderer = None
+        self._window.destroy()
+        self._window = None
+        video.Window.from_display_module().show()
+
+    def to_surface(self):
+        """
+        Returns:
+            Surface: A copy of the frame drawn so far. Used in tests.
+        """
+        return self._renderer.to_surface()
@@ -1,5 +1,7 @@
 import pygame
 from app_enums import AppState, CurrentField
+from config import MENU_FPS
+from ui.game_views.managers.idle_events import needs_redraw, wait_for_events
 from utils.ui_helpers import update_single_field
 
 
@@ -26,17 +28,25 @@ class EventLoop:
     def run(self):
         """
         Main loop for the view.
-        Renders the view and handles events until an AppState is returned.
+        Handles events until an AppState is returned.
+        The loop sleeps while there is no input and the view is
+        rendered again only when an event has changed it.
 
         Returns:
             AppState: The next application state based on user actions.
         """
+        clock = pygame.time.Clock()
+        redraw = True
         while True:
-            self.view.render()
-            for event in pygame.event.get():
+            if redraw:
+                self.view.render()
+                clock.tick(MENU_FPS)
+            events = wait_for_events()
+            for event in events:
                 state = self._handle_event(event)
                 if state is not None:
                     return state, self.view.user
+            redraw = needs_redraw(events)
 
     def _handle_event(self, event):
         """
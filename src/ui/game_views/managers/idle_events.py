@@ -0,0 +1,41 @@
+import pygame
+from config import MENU_IDLE_TIMEOUT_MS
+
+# Events after which a menu view has to be drawn again.
+REDRAW_EVENTS = {
+    pygame.KEYDOWN,
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWSIZECHANGED,
+}
+
+
+def wait_for_events(timeout=MENU_IDLE_TIMEOUT_MS):
+    """
+    Sleep until at least one event arrives or the timeout passes.
+    The process does not use the CPU while it waits.
+
+    Args:
+        timeout: Longest wait in milliseconds.
+
+    Returns:
+        list: The pending events. Empty if the wait timed out.
+    """
+    event = pygame.event.wait(timeout)
+    if event.type == pygame.NOEVENT:
+        return []
+    return [event] + pygame.event.get()
+
+
+def needs_redraw(events):
+    """
+    Check if any of the events changes what the view shows.
+
+    Args:
+        events: The handled events.
+
+    Returns:
+        bool: True if the view should be drawn again.
+    """
+    return any(event.type in REDRAW_EVENTS for event in events)
@@ -1,6 +1,7 @@
 import pygame
 from app_enums import GameAttributes
 from config import THICK_BORDER, THIN_BORDER, WHITE
+from ui.resources.text_cache import TEXT_CACHE, get_font
 
 
 class MenuDrawer:
@@ -13,8 +14,8 @@ class MenuDrawer:
 
     def __init__(self, screen):
         self.screen = screen
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 28)
+        self.font = get_font(36)
+        self.small_font = get_font(28)
         self.borders = {GameAttributes.THICK_BORDER: THICK_BORDER,
                         GameAttributes.THIN_BORDER: THIN_BORDER}
 
@@ -32,7 +33,7 @@ class MenuDrawer:
         pygame.draw.rect(self.screen, WHITE, rect, border)
 
         display_text = self.generate_display_text(text, is_password)
-        surface = self.font.render(display_text, True, WHITE)
+        surface = TEXT_CACHE.render(self.font, display_text, WHITE)
 
         y_offset = 5
         self.screen.blit(surface, (rect.x + y_offset, rect.y + y_offset))
@@ -79,7 +80,7 @@ class MenuDrawer:
         """
         if font is None:
             font = self.small_font
-        text_surface = font.render(text, True, color)
+        text_surface = TEXT_CACHE.render(font, text, color)
         rect = text_surface.get_rect()
         if center:
             rect.center = position
@@ -1,12 +1,14 @@
 
-import os
 import pygame
-from config import BLACK, BRONZE, GOLD, SILVER, WHITE, ASSETS_DIR
+from config import BLACK, BRONZE, GOLD, MENU_FPS, SILVER, WHITE
 from app_enums import AppState, CurrentField
 from db import Database
-from ui.game_views.managers.event_loop import EventLoop
+from models.size import Size
+from ui.game_views.managers.idle_events import needs_redraw, wait_for_events
 from ui.game_views.managers.menu_drawer import MenuDrawer
 from ui.game_views.managers.session_manager import SessionManager
+from ui.resources.surface_cache import SURFACE_CACHE
+from ui.resources.text_cache import TEXT_CACHE, get_font
 from utils.ui_helpers import format_high_scores
 
 
@@ -27,8 +29,8 @@ class StartScreenView():
             user: The currently logged-in user (optional).
         """
         self.screen = screen
-        self.font = pygame.font.Font(None, 50)
-        self.small_font = pygame.font.Font(None, 36)
+        self.font = get_font(50)
+        self.small_font = get_font(36)
         self.selected_index = 0
         self.borders = {"thick": 3, "thin": 1}
         self._drawer = MenuDrawer(screen)
@@ -50,17 +52,25 @@ class StartScreenView():
     def run(self):
         """
         Main loop for the view.
-        Renders the view and handles events until an AppState is returned.
+        Handles events until an AppState is returned.
+        The loop sleeps while there is no input and the view is
+        rendered again only when an event has changed it.
 
         Returns:
             AppState: The next application state based on user actions.
         """
+        clock = pygame.time.Clock()
+        redraw = True
         while True:
-            self.render()
-            for event in pygame.event.get():
+            if redraw:
+                self.render()
+                clock.tick(MENU_FPS)
+            events = wait_for_events()
+            for event in events:
                 result = self.handle_event(event)
                 if result is not None:
                     return result, self.user
+            redraw = needs_redraw(events)
 
     def render(self):
         """
@@ -117,17 +127,15 @@ class StartScreenView():
 
     def draw_title(self):
         """
-        Loads and draws the main title image at the top of the screen.
+        Draws the main title image at the top of the screen.
 
-        The image is loaded from the assets directory, scaled to match the screen width 
-        while preserving its height, and then blitted onto the screen at the top-left corner.
+        The image is scaled to match the screen width while preserving its height
+        and then blitted onto the screen at the top-left corner. The scaled image 
+        is loaded only once from the surface cache.
         """
-        self.image = pygame.image.load(
-            os.path.join(ASSETS_DIR, "game_title.png")
-        ).convert_alpha()
-
-        self.image = pygame.transform.scale(
-            self.image, (self.screen.get_width(), self.image.get_height()))
+        title_height = SURFACE_CACHE.get_original("game_title.png").get_height()
+        self.image = SURFACE_CACHE.get("game_title.png",
+                                       Size(self.screen.get_width(), title_height))
 
         self.rect = self.image.get_rect()
         self.screen.blit(self.image, (self.rect.x, self.rect.y))
@@ -262,7 +270,7 @@ class StartScreenView():
             pygame.Rect: The rectangle area of the drawn text.
         """
         color = (255, 255, 0) if highlight else WHITE
-        text_surface = font.render(text, True, color)
+        text_surface = TEXT_CACHE.render(font, text, color)
         text_rect = text_surface.get_rect()
 
         if center:
@@ -321,7 +329,7 @@ class StartScreenView():
             y = next y coordinate
             left_x = title text left x coordinate
         """
-        title_surface = self.small_font.render(title_text, True, WHITE)
+        title_surface = TEXT_CACHE.render(self.small_font, title_text, WHITE)
         title_rect = title_surface.get_rect(center=(center_x, y_start))
         self.screen.blit(title_surface, title_rect)
 
@@ -355,7 +363,7 @@ class StartScreenView():
             else:
                 font = self.small_font
 
-            text_surface = font.render(line, True, color)
+            text_surface = TEXT_CACHE.render(font, line, color)
             text_rect = text_surface.get_rect()
             text_rect.topleft = (x, y)
             self.screen.blit(text_surface, text_rect)
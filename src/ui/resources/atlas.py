@@ -0,0 +1,68 @@
+import json
+import os
+import pygame
+from config import ASSETS_DIR, ATLAS_MANIFEST
+
+
+class SpriteAtlas:
+    """
+    Sprite images packed on a few atlas pages by the build_atlas script.
+
+    The pages are loaded and converted once. Single sprites are handed out
+    as subsurfaces of the pages, so slicing a sprite does not copy pixels.
+    """
+
+    def __init__(self, pages, sprites):
+        """
+        Args:
+            pages: Converted atlas page surfaces.
+            sprites: dict of sprite name -> (page, x, y, width, height).
+        """
+        self._pages = pages
+        self._sprites = sprites
+
+    def __contains__(self, image_name):
+        return image_name in self._sprites
+
+    @property
+    def page_count(self):
+        return len(self._pages)
+
+    def get(self, image_name):
+        """
+        Get a sprite from the atlas.
+
+        Args:
+            image_name: The original file name of the sprite.
+
+        Returns:
+            Surface: A subsurface of the atlas page.
+        """
+        page, x, y, width, height = self._sprites[image_name]
+        return self._pages[page].subsurface((x, y, width, height))
+
+    @staticmethod
+    def load(assets_dir=ASSETS_DIR, manifest_name=ATLAS_MANIFEST):
+        """
+        Load the atlas pages listed in the manifest.
+        The display mode must be set before calling this.
+
+        Args:
+            assets_dir: Directory of the manifest and the atlas pages.
+            manifest_name: File name of the manifest.
+
+        Returns:
+            SpriteAtlas or None: The atlas, or None if it has not been built.
+        """
+        manifest_path = os.path.join(assets_dir, manifest_name)
+        if not os.path.isfile(manifest_path):
+            return None
+
+        with open(manifest_path, encoding="utf-8") as file:
+            manifest = json.load(file)
+
+        pages = [pygame.image.load(os.path.join(assets_dir, page)).convert_alpha()
+                 for page in manifest["pages"]]
+        sprites = {name: tuple(placement)
+                   for name, placement in manifest["sprites"].items()}
+        return SpriteAtlas(pages, sprites)
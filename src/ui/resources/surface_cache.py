@@ -0,0 +1,178 @@
+import os
+from collections import OrderedDict
+import pygame
+from config import (ASSETS_DIR,
+                    BULLET_HEIGHT,
+                    BULLET_WIDTH,
+                    ENEMY_HEIGHT,
+                    ENEMY_WIDTH,
+                    PLAYER_HEIGHT,
+                    PLAYER_WIDTH,
+                    SURFACE_CACHE_MAX_SIZE)
+from level_config import ENEMY_IMAGE, ENEMY_IMAGE_2, ENEMY_IMAGE_3
+from models.size import Size
+from ui.resources.atlas import SpriteAtlas
+
+
+class SurfaceCache:
+    """
+    A process-wide registry of loaded and scaled sprite images.
+
+    Each image file is decoded and converted only once. If the sprite
+    atlas has been built, images are sliced from the atlas pages instead
+    of being loaded from separate files. Every (image name, width, height)
+    combination is scaled only once and the same surface is handed out
+    to all sprites that ask for it.
+    The collision mask of a scaled surface is also made only once and
+    kept next to the surface.
+    The scaled surfaces and their masks are evicted in least recently
+    used order when the cache is full.
+
+    Surfaces and masks returned by the cache are shared. They must not be
+    drawn on or changed.
+    """
+
+    def __init__(self, max_size=SURFACE_CACHE_MAX_SIZE, assets_dir=ASSETS_DIR,
+                 use_atlas=True):
+        """
+        Args:
+            max_size: How many scaled surfaces are kept in the cache.
+            assets_dir: The directory where the image files are loaded from.
+            use_atlas: Whether images are sliced from the sprite atlas when it exists.
+        """
+        self._max_size = max_size
+        self._assets_dir = assets_dir
+        self._use_atlas = use_atlas
+        self._atlas = None
+        self._atlas_loaded = False
+        self._originals = {}
+        self._surfaces = OrderedDict()
+        self._masks = {}
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def __contains__(self, key):
+        return key in self._surfaces
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    def get(self, image_name, size: Size):
+        """
+        Get an image scaled to the given size.
+
+        Args:
+            image_name: File name of the image in the assets directory.
+            size: The size the image is scaled to.
+
+        Returns:
+            Surface: A shared, scaled surface.
+        """
+        key = (image_name, size.width, size.height)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+
+        surface = pygame.transform.scale(self.get_original(image_name),
+                                         (size.width, size.height))
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self._max_size:
+            evicted, _ = self._surfaces.popitem(last=False)
+            self._masks.pop(evicted, None)
+        return surface
+
+    def get_mask(self, image_name, size: Size):
+        """
+        Get the collision mask of an image scaled to the given size.
+        The opaque pixels of the image are set in the mask.
+
+        Args:
+            image_name: File name of the image in the assets directory.
+            size: The size the image is scaled to.
+
+        Returns:
+            Mask: A shared mask of the scaled surface.
+        """
+        surface = self.get(image_name, size)
+        key = (image_name, size.width, size.height)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = pygame.mask.from_surface(surface)
+            self._masks[key] = mask
+        return mask
+
+    def get_original(self, image_name):
+        """
+        Get an image in its original size.
+
+        Args:
+            image_name: File name of the image in the assets directory.
+
+        Returns:
+            Surface: A shared surface converted to the display format.
+        """
+        original = self._originals.get(image_name)
+        if original is None:
+            atlas = self._get_atlas()
+            if atlas is not None and image_name in atlas:
+                original = atlas.get(image_name)
+            else:
+                original = pygame.image.load(
+                    os.path.join(self._assets_dir, image_name)
+                ).convert_alpha()
+            self._originals[image_name] = original
+        return original
+
+    def _get_atlas(self):
+        """
+        Load the sprite atlas on first use.
+
+        Returns:
+            SpriteAtlas or None: The atlas, or None if it is not used or not built.
+        """
+        if self._use_atlas and not self._atlas_loaded:
+            self._atlas = SpriteAtlas.load(self._assets_dir)
+            self._atlas_loaded = True
+        return self._atlas
+
+    def preload(self, image_names, size: Size):
+        """
+        Load and scale several images to the same size in advance.
+
+        Args:
+            image_names: File names of the images.
+            size: The size the images are scaled to.
+        """
+        for image_name in image_names:
+            self.get(image_name, size)
+
+    def clear(self):
+        """
+        Remove all loaded images from the cache.
+        """
+        self._originals.clear()
+        self._surfaces.clear()
+        self._masks.clear()
+        self._atlas = None
+        self._atlas_loaded = False
+
+
+SURFACE_CACHE = SurfaceCache()
+
+
+def preload_game_images(cache: SurfaceCache = SURFACE_CACHE):
+    """
+    Load the player, bullet and all level enemy images into the cache.
+    The display mode must be set before calling this.
+
+    Args:
+        cache: The surface cache to fill.
+    """
+    cache.preload(["player.png"], Size(PLAYER_WIDTH, PLAYER_HEIGHT))
+    cache.preload(["player_bullet.png", "enemy_bullet.png"],
+                  Size(BULLET_WIDTH, BULLET_HEIGHT))
+    cache.preload([ENEMY_IMAGE, ENEMY_IMAGE_2, ENEMY_IMAGE_3],
+                  Size(ENEMY_WIDTH, ENEMY_HEIGHT))
@@ -0,0 +1,104 @@
+from collections import OrderedDict
+import pygame
+from config import TEXT_CACHE_MAX_SIZE
+
+_FONTS = {}
+
+
+def get_font(size):
+    """
+    Get the default pygame font in the given size.
+    The same font object is shared by all views so that their
+    rendered texts can be found from the text cache.
+
+    Args:
+        size: Font size in pixels.
+
+    Returns:
+        pygame.font.Font: A shared font object.
+    """
+    font = _FONTS.get(size)
+    if font is None:
+        font = pygame.font.Font(None, size)
+        _FONTS[size] = font
+    return font
+
+
+class TextCache:
+    """
+    Keeps rendered text surfaces so that texts which change rarely
+    are not rasterized again on every frame.
+
+    Surfaces are keyed by (font, text, color, antialias) and evicted in
+    least recently used order when the cache is full. The hit and miss
+    counters tell how well the cache works.
+
+    Surfaces returned by the cache are shared. They must not be drawn on.
+    """
+
+    def __init__(self, max_size=TEXT_CACHE_MAX_SIZE):
+        """
+        Args:
+            max_size: How many rendered texts are kept in the cache.
+        """
+        self._max_size = max_size
+        self._surfaces = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    @property
+    def hits(self):
+        """
+        Returns:
+            int: How many texts were found from the cache.
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        Returns:
+            int: How many texts had to be rendered.
+        """
+        return self._misses
+
+    def render(self, font, text, color, antialias=True):
+        """
+        Get a rendered text surface.
+
+        Args:
+            font: The pygame font to render with.
+            text: The text to render.
+            color: The text color.
+            antialias: Whether the text is antialiased.
+
+        Returns:
+            Surface: A shared surface of the rendered text.
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self._misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self._max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """
+        Remove all rendered texts and reset the counters.
+        """
+        self._surfaces.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+TEXT_CACHE = TextCache()
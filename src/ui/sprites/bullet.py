@@ -1,55 +1,94 @@
 import pygame
-import os
-from config import ASSETS_DIR
-from services.bullet_service import BulletService
-
-dirname = os.path.dirname(__file__)
+from config import SPRITE_POOL_MAX_SIZE
+from services.bullet_pool import BulletPool
+from ui.resources.surface_cache import SURFACE_CACHE
+from ui.sprites.sprite_pool import SpritePool
 
 
 class BulletSprite (pygame.sprite.Sprite):
     """
     User Interface pygame bullet sprite in the game.
 
-    This class uses the logic from a BulletService and then
-    updates the sprite image and location on the screen.
+    The bullet state lives in a slot of a BulletPool, which moves all
+    bullets at once. This class only copies the position of its slot to
+    the sprite rect and removes itself when the bullet has left the screen.
+
+    Use BULLET_SPRITES.acquire to get a bullet sprite. Killed bullet
+    sprites go back to the pool and are reinitialized for the next shot.
     """
 
-    def __init__(self, bullet_service: BulletService):
+    def __init__(self, bullet_pool: BulletPool, handle):
         """
         Initialize the bullet sprite, load its image based on direction,
         and set its size and starting position.
 
         Args:
-            bullet_service: The logic class controlling bullet behavior.
+            bullet_pool: The pool that holds the bullet state.
+            handle: (slot, generation) of the bullet in the pool.
         """
         super().__init__()
-        self.bullet = bullet_service
+        self.sprite_pool = None
+        self.rect = None
+        self.reset(bullet_pool, handle)
+
+    def reset(self, bullet_pool: BulletPool, handle):
+        """
+        Reinitialize the sprite for a new bullet.
 
-        width = self.bullet.width
-        height = self.bullet.height
+        Args:
+            bullet_pool: The pool that holds the bullet state.
+            handle: (slot, generation) of the bullet in the pool.
+        """
+        self.bullet_pool = bullet_pool
+        self.slot, self.generation = handle
 
-        if self.bullet.direction == "up":
+        if self.bullet_pool.get_direction(self.slot) == "up":
             image_name = "player_bullet.png"
         else:
             image_name = "enemy_bullet.png"
 
-        self.image = pygame.image.load(
-            os.path.join(ASSETS_DIR, image_name)
-        ).convert_alpha()
+        size = self.size
+        self.image = SURFACE_CACHE.get(image_name, size)
+        self.mask = SURFACE_CACHE.get_mask(image_name, size)
+
+        position = self.bullet_pool.get_position(self.slot)
+        if self.rect is None:
+            self.rect = self.image.get_rect(topleft=position)
+        else:
+            self.rect.update(position, self.image.get_size())
 
-        self.image = pygame.transform.scale(
-            self.image, (width, height))
+    @property
+    def size(self):
+        return self.bullet_pool.get_size(self.slot)
 
-        self.rect = self.image.get_rect()
+    @property
+    def motion(self):
+        """
+        Returns:
+            tuple: (dx, dy) the bullet moved on the last tick, for swept collisions.
+        """
+        return 0, self.bullet_pool.get_dy(self.slot)
 
     def update(self):
         """
         Updates the bullet's position and checks if it should be removed from the screen.
+        The bullet pool must have been updated before.
         """
-        self.bullet.update()
-        x, y = self.bullet.position
-        self.rect.x = x
-        self.rect.y = y
-
-        if self.bullet.is_moving() == False:
+        if not self.bullet_pool.is_alive(self.slot):
             self.kill()
+            return
+        self.rect.y = self.bullet_pool.get_y(self.slot)
+
+    def kill(self):
+        """
+        Remove the bullet from all groups, free its slot in the bullet pool
+        and give the sprite back to the sprite pool.
+        """
+        super().kill()
+        self.bullet_pool.release(self.slot, self.generation)
+        if self.sprite_pool is not None:
+            sprite_pool, self.sprite_pool = self.sprite_pool, None
+            sprite_pool.release(self)
+
+
+BULLET_SPRITES = SpritePool(BulletSprite, max_size=SPRITE_POOL_MAX_SIZE)
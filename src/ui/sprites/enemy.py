@@ -1,10 +1,8 @@
-import os
-import random
 import pygame
-from config import ASSETS_DIR
-from level_config import ENEMY_SHOOTING_PROBABILITY
-from ui.sprites.bullet import BulletSprite
+from services.bullet_pool import BulletPool
+from ui.sprites.bullet import BULLET_SPRITES
 from services.enemy_service import EnemyService
+from ui.resources.surface_cache import SURFACE_CACHE
 
 
 class EnemySprite(pygame.sprite.Sprite):
@@ -12,11 +10,12 @@ class EnemySprite(pygame.sprite.Sprite):
     Represents the enemy sprite in the game.
     Updates movement, shooting and rendering of the enemy sprite. 
     The class uses the logic from a EnemyService 
+    Which enemies shoot on each frame is decided by the game's FireScheduler.
     """
 
     def __init__(self, enemy_service: EnemyService,
                  bullet_group: pygame.sprite.Group,
-                 shooting_probability: int,
+                 bullet_pool: BulletPool,
                  image_path: str = "enemy.png"):
         """
         Initialize the enemy sprite, load its image,
@@ -25,44 +24,47 @@ class EnemySprite(pygame.sprite.Sprite):
         Args:
             enemy_service: The EnemyService object controlling enemy logic.
             bullet_group: The group where bullets are added.
+            bullet_pool: The pool that holds the state of the bullets.
             image_path: Path to the enemy image file.
         """
         super().__init__()
         self.enemy_service = enemy_service
         self.bullet_group = bullet_group
-        self.shooting_probability = shooting_probability
-        width = self.enemy_service.width
-        height = self.enemy_service.height
+        self.bullet_pool = bullet_pool
 
-        self.image = pygame.image.load(
-            os.path.join(ASSETS_DIR, image_path)
-        ).convert_alpha()
-        self.image = pygame.transform.scale(
-            self.image, (width, height)
-        )
+        self.image = SURFACE_CACHE.get(image_path, self.enemy_service.size)
+        self.mask = SURFACE_CACHE.get_mask(image_path, self.enemy_service.size)
 
-        self.rect = self.image.get_rect()
+        self.rect = self.image.get_rect(topleft=self.enemy_service.position)
+        self.motion = (0, 0)
 
     def shoot(self):
         """
         Tries to shoot. If shooting is a success a new bullet is created. 
         The bullet is added to enemy bullet group.
         """
-        bullet_service = self.enemy_service.try_shoot()
+        handle = self.enemy_service.try_shoot_into(self.bullet_pool)
 
-        if bullet_service:
-            bullet_sprite = BulletSprite(bullet_service)
+        if handle:
+            bullet_sprite = BULLET_SPRITES.acquire(self.bullet_pool, handle)
             self.bullet_group.add(bullet_sprite)
 
+    def fire(self):
+        """
+        Shoots a new bullet without checking the cooldown.
+        Used when the FireScheduler has already checked it.
+        """
+        handle = self.enemy_service.shoot_into(self.bullet_pool)
+        self.bullet_group.add(BULLET_SPRITES.acquire(self.bullet_pool, handle))
+
     def update(self):
         """
-        Updates the emey's position. Randomly shoots a new bullet. 
+        Updates the emey's position and stores how far it moved
+        for the swept collision checks.
         """
         self.enemy_service.move()
-        shooting_probability = self.shooting_probability if self.shooting_probability else ENEMY_SHOOTING_PROBABILITY
-        if random.random() < shooting_probability:
-            self.shoot()
         x, y = self.enemy_service.position
+        self.motion = (x - self.rect.x, y - self.rect.y)
         self.rect.x = x
         self.rect.y = y
 
@@ -1,8 +1,8 @@
-import os
 import pygame
-from config import ASSETS_DIR
+from services.bullet_pool import BulletPool
 from services.player_service import PlayerService
-from ui.sprites.bullet import BulletSprite
+from ui.resources.surface_cache import SURFACE_CACHE
+from ui.sprites.bullet import BULLET_SPRITES
 
 
 
@@ -16,29 +16,26 @@ class PlayerSprite(pygame.sprite.Sprite):
     dimensions, and the boundaries within which the player is allowed to move.
     """
 
-    def __init__(self, player_service: PlayerService, bullet_group: pygame.sprite.Group):
+    def __init__(self, player_service: PlayerService, bullet_group: pygame.sprite.Group,
+                 bullet_pool: BulletPool):
         """
         Initialize the player sprite.
 
         Args:
             player_service: Logic layer managing player movement and shooting.
             bullet_group: Pygame group to add bullets to when shooting.
+            bullet_pool: The pool that holds the state of the bullets.
         """
         super().__init__()
         self.player_service = player_service
         self.bullet_group = bullet_group
+        self.bullet_pool = bullet_pool
 
-        width = self.player_service.width
-        height = self.player_service.height
+        self.image = SURFACE_CACHE.get("player.png", self.player_service.size)
+        self.mask = SURFACE_CACHE.get_mask("player.png", self.player_service.size)
 
-        self.image = pygame.image.load(
-            os.path.join(ASSETS_DIR, "player.png")
-        ).convert_alpha()
-        self.image = pygame.transform.scale(
-            self.image, (width, height)
-        )
-
-        self.rect = self.image.get_rect()
+        self.rect = self.image.get_rect(topleft=self.player_service.position)
+        self.motion = (0, 0)
 
     def handle_input(self):
         """
@@ -61,16 +58,18 @@ class PlayerSprite(pygame.sprite.Sprite):
         Tries to shoot. If shooting is a success a new bullet is created. 
         The bullet is added to player bullet group.
         """
-        bullet_service = self.player_service.try_shoot()
-        if bullet_service:
-            bullet_sprite = BulletSprite(bullet_service)
+        handle = self.player_service.try_shoot_into(self.bullet_pool)
+        if handle:
+            bullet_sprite = BULLET_SPRITES.acquire(self.bullet_pool, handle)
             self.bullet_group.add(bullet_sprite)
 
     def update(self):
         """
-        Updates the player's position.
+        Updates the player's position and stores how far it moved
+        for the swept collision checks.
         """
         x, y = self.player_service.position
+        self.motion = (x - self.rect.x, y - self.rect.y)
         self.rect.x = x
         self.rect.y = y
 
@@ -0,0 +1,102 @@
+from config import SPRITE_POOL_MAX_SIZE
+
+
+class SpritePool:
+    """
+    A free list of killed sprites that are reinitialized in place
+    instead of creating new sprite objects.
+
+    The pooled sprite class must have a reset method that takes the same
+    arguments as its constructor, and it must give itself back to the pool
+    with release when it is killed.
+    """
+
+    def __init__(self, factory, max_size=SPRITE_POOL_MAX_SIZE):
+        """
+        Args:
+            factory: Creates a new sprite when the free list is empty.
+            max_size: How many free sprites are kept at most.
+        """
+        self._factory = factory
+        self._max_size = max_size
+        self._free = []
+        self._hits = 0
+        self._misses = 0
+        self._dropped = 0
+
+    def __len__(self):
+        """
+        Returns:
+            int: Number of free sprites waiting to be reused.
+        """
+        return len(self._free)
+
+    @property
+    def hits(self):
+        """
+        Returns:
+            int: How many sprites were reused from the free list.
+        """
+        return self._hits
+
+    @property
+    def misses(self):
+        """
+        Returns:
+            int: How many sprites had to be created.
+        """
+        return self._misses
+
+    @property
+    def dropped(self):
+        """
+        Returns:
+            int: How many released sprites did not fit in the free list.
+        """
+        return self._dropped
+
+    def stats(self):
+        """
+        Returns:
+            dict: hits, misses, dropped and the number of free sprites.
+        """
+        return {"hits": self._hits, "misses": self._misses,
+                "dropped": self._dropped, "free": len(self._free)}
+
+    def acquire(self, *args):
+        """
+        Get a sprite, reused if possible.
+
+        Args:
+            args: Arguments of the sprite constructor.
+
+        Returns:
+            A sprite initialized with the arguments.
+        """
+        if self._free:
+            sprite = self._free.pop()
+            sprite.reset(*args)
+            self._hits += 1
+        else:
+            sprite = self._factory(*args)
+            self._misses += 1
+        sprite.sprite_pool = self
+        return sprite
+
+    def release(self, sprite):
+        """
+        Give a killed sprite back to the pool.
+        """
+        if len(self._free) < self._max_size:
+            self._free.append(sprite)
+        else:
+            self._dropped += 1
+
+    def clear(self):
+        """
+        Forget the free sprites and reset the statistics.
+        """
+        self._free.clear()
+        self._hits = 0
+        self._misses = 0
+        self._dropped = 0
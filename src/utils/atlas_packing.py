@@ -0,0 +1,45 @@
+def pack_sprites(sizes, max_size=2048, padding=1):
+    """
+    Pack sprite rectangles on one or more atlas pages using shelf packing.
+
+    The sprites are sorted by height and placed from left to right on
+    horizontal shelves. A new shelf starts when the current shelf is full
+    and a new page starts when the page is full.
+
+    Args:
+        sizes: dict of sprite name -> (width, height).
+        max_size: Maximum width and height of one atlas page.
+        padding: Empty pixels between sprites.
+
+    Returns:
+        tuple: (placements, page_sizes)
+            - placements: dict of sprite name -> (page, x, y, width, height)
+            - page_sizes: list of (width, height) of each page
+    """
+    order = sorted(sizes, key=lambda name: (-sizes[name][1], name))
+    placements = {}
+    page_sizes = []
+    page = x = y = shelf_height = page_width = 0
+
+    for name in order:
+        width, height = sizes[name]
+        if width > max_size or height > max_size:
+            raise ValueError(f"{name} does not fit on an atlas page")
+
+        if x + width > max_size:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        if y + height > max_size:
+            page_sizes.append((page_width, y - padding))
+            page += 1
+            x = y = shelf_height = page_width = 0
+
+        placements[name] = (page, x, y, width, height)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+        page_width = max(page_width, x - padding)
+
+    if placements:
+        page_sizes.append((page_width, y + shelf_height))
+    return placements, page_sizes
@@ -2,7 +2,7 @@ import os
 from pathlib import Path
 import random
 
-from app_enums import GameAttributes, GameMessages, LevelAttributes
+from app_enums import GameAttributes, GameMessages
 from config import BRONZE, GOLD, PROJECT_ROOT, SILVER
 from entities.general_statistics import GeneralStatistics
 from entities.user_statistics import UserStatistics
@@ -25,33 +25,6 @@ def init_start_level_attributes():
     }
 
 
-def set_new_level_attributes(current_level):
-    """
-    Args:
-        current_level: game current level
-
-    Returns:
-        level attributes: enemy attributes of the current level
-    """
-    cooldown = current_level[LevelAttributes.ENEMY_COOLDOWN]
-    enemy_shooting_probability = current_level[LevelAttributes.ENEMY_SHOOT_PROB]
-    enemy_count_cols = current_level[LevelAttributes.ENEMY_COLS]
-    enemy_rows = current_level[LevelAttributes.ENEMY_ROWS]
-    enemy_speed = current_level[LevelAttributes.ENEMY_SPEED]
-    enemy_bullet_speed = current_level[LevelAttributes.ENEMY_BULLET_SPEED]
-    enemy_max_hits = current_level[LevelAttributes.ENEMY_MAX_HITS]
-    enemy_image = current_level[LevelAttributes.ENEMY_IMAGE]
-    return {GameAttributes.COOLDOWN: cooldown,
-            GameAttributes.SHOOT_PROB: enemy_shooting_probability,
-            GameAttributes.COLS: enemy_count_cols,
-            GameAttributes.ROWS: enemy_rows,
-            GameAttributes.SPEED: enemy_speed,
-            GameAttributes.BULLET_SPEED: enemy_bullet_speed,
-            GameAttributes.MAX_HITS: enemy_max_hits,
-            GameAttributes.IMAGE: enemy_image
-            }
-
-
 def init_high_score(general_statistics_service):
     """
     Args:
@@ -1,9 +1,28 @@
+import os
 from invoke import task
 
 # poetry run invoke start
+# poetry run invoke start --renderer dirty
+# poetry run invoke start --renderer texture
+# poetry run invoke start --seed 42
+# poetry run invoke start --loop fixed
+# poetry run invoke start --loop uncapped
+# poetry run invoke start --endless
+# poetry run invoke start --collisions grid
+# poetry run invoke start --collisions sweep
+# poetry run invoke start --collisions numpy
+# poetry run invoke start --pixel
 @task
-def start(ctx):
-    ctx.run("python3 src/main.py", pty=True)
+def start(ctx, renderer="full", seed="", loop="frame", endless=False, collisions="pygame",
+          pixel=False):
+    options = f"--renderer {renderer} --loop {loop} --collisions {collisions}"
+    if seed:
+        options += f" --seed {seed}"
+    if endless:
+        options += " --endless"
+    if pixel:
+        options += " --pixel"
+    ctx.run(f"python3 src/main.py {options}", pty=True)
 
 # poetry run invoke test
 @task
@@ -39,4 +58,39 @@ def check(ctx):
 @task
 def build(ctx):
     ctx.run("python3 src/ui/build.py", pty=True)
-    
\ No newline at end of file
+
+# poetry run invoke build-atlas
+@task
+def build_atlas(ctx):
+    ctx.run("python3 src/ui/build_atlas.py", pty=True)
+    
+@task
+def benchmark_render(ctx):
+    with ctx.cd("src"):
+        ctx.run("python3 -m benchmarks.render_benchmark", pty=True)
+
+# poetry run invoke benchmark-draw --populations 10,100,1000,5000 --output draw.json
+@task
+def benchmark_draw(ctx, populations="10,100,500,1000,5000", frames=120, renderers="", output=""):
+    options = f"--populations {populations} --frames {frames}"
+    if renderers:
+        options += f" --renderers {renderers}"
+    if output:
+        options += f" --output {os.path.abspath(output)}"
+    with ctx.cd("src"):
+        ctx.run(f"python3 -m benchmarks.draw_benchmark {options}", pty=True)
+
+@task
+def benchmark_bullets(ctx):
+    with ctx.cd("src"):
+        ctx.run("python3 -m benchmarks.bullet_benchmark", pty=True)
+
+@task
+def benchmark_models(ctx):
+    with ctx.cd("src"):
+        ctx.run("python3 -m benchmarks.model_benchmark", pty=True)
+
+@task
+def benchmark_collisions(ctx):
+    with ctx.cd("src"):
+        ctx.run("python3 -m benchmarks.collision_benchmark", pty=True)